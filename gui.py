@@ -33,6 +33,8 @@ try:
 except ImportError:
     PILImage = None
 
+from src.events import GuiEventQueue
+
 # --- Constants ----------------------------------------------------------------
 
 APP_TITLE = "Iris"
@@ -103,6 +105,22 @@ class OutputRedirector:
         pass
 
 
+# --- Frame conversion ---------------------------------------------------------
+
+
+def _bgr_to_pil(frame):
+    """Build an RGB PIL image from a BGR uint8 frame in a single copy.
+
+    PIL's raw decoder swaps the channels while copying, so no intermediate
+    RGB array is made, and the image never shares memory with the frame
+    (video frames go back to the player's buffer pool once drawn).
+    """
+    if not frame.flags.c_contiguous:
+        frame = frame.copy()
+    h, w = frame.shape[:2]
+    return PILImage.frombytes("RGB", (w, h), frame, "raw", "BGR")
+
+
 # --- Application --------------------------------------------------------------
 
 
@@ -136,7 +154,7 @@ class IrisApp(ctk.CTk):
         self._active_experiment = None
 
         # Event queues for experiment <-> GUI communication
-        self._gui_event_queue = queue.Queue()
+        self._gui_event_queue = GuiEventQueue()
         self._user_action_queue = queue.Queue()
 
         # Widget references (populated in build methods)
@@ -772,6 +790,7 @@ class IrisApp(ctk.CTk):
 
         self._vp_time_label = ctk.CTkLabel(ctrl, text="0:00 / 0:00", font=FONT_SMALL)
         self._vp_time_label.pack(side="right", padx=10)
+        self._vp_time_secs = (0, 0)  # whole seconds last shown in _vp_time_label
 
         # Centered play/pause toggle button
         self._vp_playpause_btn = ctk.CTkButton(
@@ -811,7 +830,7 @@ class IrisApp(ctk.CTk):
         """Start the recording indicator animation (dots + timer) on both phase display and video player."""
         self._rec_animating = True
         self._rec_dot_step = 0
-        self._rec_start_time = time.time()
+        self._rec_start_time = time.monotonic()
         # Show phase display REC frame (before the progress bar)
         self._rec_frame.pack(pady=(4, 8), before=self._phase_display_progress)
         # Show VP REC frame
@@ -854,7 +873,7 @@ class IrisApp(ctk.CTk):
             self._vp_rec_dot.configure(text_color="#aa1111")
 
         # Update timer
-        elapsed = time.time() - self._rec_start_time
+        elapsed = time.monotonic() - self._rec_start_time
         mins, secs = divmod(int(elapsed), 60)
         timer_text = f"{mins:02d}:{secs:02d}"
         self._rec_timer_label.configure(text=timer_text)
@@ -1548,8 +1567,6 @@ class IrisApp(ctk.CTk):
 
     def _show_camera_selection(self, cameras, frames):
         """Show the camera selection panel with preview images."""
-        import cv2
-
         self.tabview.set("Experiment")
         self._phase_display.grid_forget()
         self._exp_left.grid_forget()
@@ -1573,13 +1590,13 @@ class IrisApp(ctk.CTk):
             # Render preview frame
             frame = frames.get(cam_id)
             if frame is not None and PILImage is not None:
-                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                img = PILImage.fromarray(rgb)
-                # Scale to ~480px wide
+                img = _bgr_to_pil(frame)
+                # Scale to ~480px wide (the experiment usually sends thumbnails)
                 w, h = img.size
                 scale = 480 / w if w > 0 else 1
                 new_w, new_h = int(w * scale), int(h * scale)
-                img = img.resize((new_w, new_h), PILImage.BILINEAR)
+                if (new_w, new_h) != (w, h):
+                    img = img.resize((new_w, new_h), PILImage.BILINEAR)
                 ctk_img = ctk.CTkImage(light_image=img, dark_image=img,
                                        size=(new_w, new_h))
                 card["img_label"].configure(image=ctk_img, text="")
@@ -1842,16 +1859,14 @@ class IrisApp(ctk.CTk):
     def _update_video_frame(self, frame):
         """Display a video frame in the player canvas, scaled to fit.
 
-        Frames are pre-downscaled by the experiment thread, so only a
-        lightweight resize to match canvas dimensions is needed here.
+        Frames are pre-downscaled by the experiment thread. The final fit to
+        the canvas is left to CTkImage, which resamples to its display size
+        anyway, so the frame is only resized once.
         """
         if PILImage is None:
             return
         try:
-            import cv2
-            # BGR -> RGB
-            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            img = PILImage.fromarray(rgb)
+            img = _bgr_to_pil(frame)
 
             # Get actual canvas dimensions
             disp_w = self._vp_canvas.winfo_width()
@@ -1865,10 +1880,6 @@ class IrisApp(ctk.CTk):
             new_w = max(1, int(src_w * scale))
             new_h = max(1, int(src_h * scale))
 
-            # Only resize if dimensions differ meaningfully (>5px)
-            if abs(new_w - src_w) > 5 or abs(new_h - src_h) > 5:
-                img = img.resize((new_w, new_h), PILImage.BILINEAR)
-
             ctk_img = ctk.CTkImage(light_image=img, dark_image=img,
                                    size=(new_w, new_h))
             self._vp_canvas.configure(image=ctk_img, text="")
@@ -1877,9 +1888,17 @@ class IrisApp(ctk.CTk):
             print(f"Video frame render error: {e}")
 
     def _update_video_time(self, position_sec, duration_sec):
-        """Update the video time display."""
-        pos_m, pos_s = divmod(int(position_sec), 60)
-        dur_m, dur_s = divmod(int(duration_sec), 60)
+        """Update the video time display.
+
+        Called for every displayed frame, but the label only changes once a
+        second, so the Tk configure is skipped while the whole seconds match.
+        """
+        secs = (int(position_sec), int(duration_sec))
+        if secs == self._vp_time_secs:
+            return
+        self._vp_time_secs = secs
+        pos_m, pos_s = divmod(secs[0], 60)
+        dur_m, dur_s = divmod(secs[1], 60)
         self._vp_time_label.configure(text=f"{pos_m}:{pos_s:02d} / {dur_m}:{dur_s:02d}")
 
     # ==========================================================================
@@ -1903,11 +1922,7 @@ class IrisApp(ctk.CTk):
         self._show_experiment_layout()
 
         # Clear event queues
-        while not self._gui_event_queue.empty():
-            try:
-                self._gui_event_queue.get_nowait()
-            except queue.Empty:
-                break
+        self._gui_event_queue.clear()
         while not self._user_action_queue.empty():
             try:
                 self._user_action_queue.get_nowait()
@@ -2162,8 +2177,12 @@ class IrisApp(ctk.CTk):
         self._log("Stopping... (sending stop signal)")
         self._progress_label.configure(text="Stopping...")
 
-        # Send stop via action queue first
-        self._user_action_queue.put({"type": "stop"})
+        # Signal the experiment first (stop flag + action queue)
+        exp = self._active_experiment
+        if exp is not None:
+            exp.request_stop()
+        else:
+            self._user_action_queue.put({"type": "stop"})
 
         # Fallback: async exception after a short delay
         def force_stop():
@@ -2376,21 +2395,27 @@ class IrisApp(ctk.CTk):
         to prevent queue backup when the GUI can't keep up with FPS.
         """
         latest_video_frame = None
-        try:
-            while True:
-                event = self._gui_event_queue.get_nowait()
-                if event.get("type") == "video_frame":
-                    # Keep only the latest video frame, skip stale ones
-                    latest_video_frame = event
-                else:
-                    self._handle_gui_event(event)
-        except queue.Empty:
-            pass
+        for event in self._gui_event_queue.drain():
+            if event.get("type") == "video_frame":
+                # Keep only the latest video frame, skip stale ones
+                if latest_video_frame is not None:
+                    self._release_video_frame(latest_video_frame)
+                latest_video_frame = event
+            else:
+                self._handle_gui_event(event)
         # Render only the most recent video frame
         if latest_video_frame is not None:
             self._handle_gui_event(latest_video_frame)
         self.after(33, self._poll_gui_events)
 
+    @staticmethod
+    def _release_video_frame(event):
+        """Hand a video_frame buffer back to the player's preview pool."""
+        release = event.get("release")
+        frame = event.get("frame")
+        if release is not None and frame is not None:
+            release(frame)
+
     def _handle_gui_event(self, event):
         """Handle a single event from the experiment."""
         etype = event.get("type")
@@ -2464,10 +2489,12 @@ class IrisApp(ctk.CTk):
             # Discard frames while waiting for first play or during countdown
             # so the instructional text stays visible
             if self._video_first_play or self._countdown_active:
+                self._release_video_frame(event)
                 return
             frame = event.get("frame")
             if frame is not None:
                 self._update_video_frame(frame)
+            self._release_video_frame(event)
             pos = event.get("position_sec", 0)
             dur = event.get("duration_sec", 0)
             self._update_video_time(pos, dur)
@@ -2511,6 +2538,11 @@ class IrisApp(ctk.CTk):
         elif etype == "status":
             msg = event.get("message", "")
             self._progress_label.configure(text=msg)
+            if event.get("backup_done"):
+                # The backup outlives the experiment's stdout redirect and may
+                # finish after the console log was saved, so log and save again
+                self._log(msg)
+                self._save_console_log()
 
         elif etype == "experiment_done_choice":
             self._hide_continue_btn()
@@ -1,6 +1,8 @@
 """Pre-flight calibration tool to verify all devices are connected and working."""
 
+import os
 import sys
+import tempfile
 import threading
 import time
 from typing import Optional
@@ -179,8 +181,6 @@ class CalibrationTool:
 
         try:
             from .audio import AudioConfig, AudioRecorder, find_audio_device
-            import tempfile
-            import os
 
             device_name = mic_settings.get("device_name", "Tonor")
             device_index = mic_settings.get("device_index")
@@ -211,7 +211,6 @@ class CalibrationTool:
 
             if opened:
                 recorder.start_recording()
-                import time
                 time.sleep(1.0)
                 recorder.stop_recording()
                 recorder.close()
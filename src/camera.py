@@ -1,12 +1,20 @@
 """Camera interface for USB webcams connected via USB."""
 
+import gc
 import sys
+import threading
+import time
 from dataclasses import dataclass
 from typing import Optional
 
 import cv2
 import numpy as np
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
 
 @dataclass
 class CameraConfig:
@@ -26,8 +34,21 @@ class Camera:
         self.config = config
         self._capture: Optional[cv2.VideoCapture] = None
 
+        # Read counters (see CameraManager.stats)
+        self._stats_lock = threading.Lock()
+        self.frames_grabbed = 0
+        self.frames_dropped = 0
+        self._opened_at: Optional[float] = None
+
     def open(self) -> bool:
-        """Initialize USB camera connection."""
+        """Initialize USB camera connection.
+
+        An already-open capture is reused rather than rebuilt, since repeated
+        VideoCapture construction leaks memory on several backends.
+        """
+        if self.is_open:
+            return True
+
         print(f"Opening camera: {self.config.name} (device {self.config.device_index})")
 
         # Use DirectShow backend on Windows for reliable USB camera access
@@ -66,6 +87,11 @@ class Camera:
                   f"Requested {self.config.resolution[0]}x{self.config.resolution[1]}, "
                   f"got {actual_w}x{actual_h}. Using actual resolution for recording.")
 
+        with self._stats_lock:
+            self.frames_grabbed = 0
+            self.frames_dropped = 0
+            self._opened_at = time.monotonic()
+
         print(f"Opened camera: {self.config.name} "
               f"(requested {self.config.resolution[0]}x{self.config.resolution[1]}, "
               f"actual {actual_w}x{actual_h}, fps={actual_fps:.0f}, zoom={actual_zoom})")
@@ -78,18 +104,54 @@ class Camera:
             self._capture.release()
             self._capture = None
 
-    def read_frame(self) -> Optional[np.ndarray]:
-        """Capture a single frame from the USB camera."""
+    def read_frame(self, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """Capture a single frame from the USB camera.
+
+        If out is given and matches the frame size, the frame is decoded
+        into it (and out is returned) instead of a new array.
+        """
         if self._capture is None:
             return None
 
-        ret, frame = self._capture.read()
+        ret, frame = self._capture.read() if out is None else self._capture.read(out)
         if not ret or frame is None:
+            with self._stats_lock:
+                self.frames_dropped += 1
             print(f"Warning: Failed to read frame from {self.config.name}")
             return None
 
+        with self._stats_lock:
+            self.frames_grabbed += 1
         return frame
 
+    def skip_frames(self, count: int) -> int:
+        """Grab and discard up to count frames without decoding them.
+
+        Drains stale frames from the driver queue (e.g. during auto-exposure
+        warmup) more cheaply than read_frame. Returns the number skipped.
+        """
+        if self._capture is None:
+            return 0
+        skipped = 0
+        for _ in range(count):
+            if not self._capture.grab():
+                break
+            skipped += 1
+        return skipped
+
+    def stats(self) -> dict:
+        """Snapshot of read counters and effective FPS since open."""
+        with self._stats_lock:
+            grabbed = self.frames_grabbed
+            dropped = self.frames_dropped
+            opened_at = self._opened_at
+        elapsed = time.monotonic() - opened_at if opened_at is not None else 0.0
+        return {
+            "grabbed": grabbed,
+            "dropped": dropped,
+            "fps": grabbed / elapsed if elapsed > 0 else 0.0,
+        }
+
     @property
     def is_open(self) -> bool:
         return self._capture is not None and self._capture.isOpened()
@@ -120,9 +182,19 @@ class CameraManager:
         return success
 
     def close_all(self):
-        """Close all cameras."""
+        """Close all cameras and reclaim the released capture buffers."""
         for camera in self.cameras.values():
             camera.close()
+        gc.collect()
+        if resource is not None:
+            max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            # ru_maxrss is in bytes on macOS, KiB on Linux
+            max_rss_mb = max_rss // (1024 * 1024 if sys.platform == "darwin" else 1024)
+            print(f"Cameras closed (peak RSS {max_rss_mb} MB)")
+
+    def stats(self) -> dict[str, dict]:
+        """Per-camera read counters: {cam_id: {grabbed, dropped, fps}}."""
+        return {cam_id: camera.stats() for cam_id, camera in self.cameras.items()}
 
     def capture_all(self) -> dict[str, np.ndarray]:
         """Capture frame from all cameras."""
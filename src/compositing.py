@@ -3,55 +3,118 @@
 Requires ffmpeg on PATH.
 """
 
+import csv
 import json
+import os
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 import cv2
 import ffmpeg
 
+from .utils import copy_file
+from .video_recorder import H264_ENCODER_ARGS, FFmpegPipeWriter
+
 
 def check_ffmpeg() -> bool:
     """Check that ffmpeg is available on PATH."""
     return shutil.which("ffmpeg") is not None
 
 
+# Minimum AAC bitrate that is stream-copied instead of re-encoded
+MIN_COPY_AUDIO_BITRATE = 128_000
+
+
+@lru_cache(maxsize=32)
+def _probe_audio_stream(audio_path: str, mtime: float) -> dict:
+    """Return the first audio stream's ffprobe info (cached per file version)."""
+    info = ffmpeg.probe(audio_path)
+    for stream in info.get("streams", []):
+        if stream.get("codec_type") == "audio":
+            return stream
+    return {}
+
+
+def _can_copy_audio(audio_path: str) -> bool:
+    """True if the audio is already AAC at an acceptable bitrate."""
+    try:
+        stream = _probe_audio_stream(audio_path, os.path.getmtime(audio_path))
+    except (ffmpeg.Error, OSError, ValueError) as e:
+        print(f"WARNING: Could not probe {audio_path}: {e}")
+        return False
+    if stream.get("codec_name") != "aac":
+        return False
+    bit_rate = int(stream.get("bit_rate") or 0)
+    return bit_rate == 0 or bit_rate >= MIN_COPY_AUDIO_BITRATE
+
+
 def overlay_audio_on_video(video_path: str, audio_path: str, output_path: str):
-    """Mux audio onto video (copy video stream, encode audio as AAC)."""
+    """Mux audio onto video (copy video stream, encode audio as AAC).
+
+    Audio that is already AAC is stream-copied rather than re-encoded.
+    """
     print(f"Muxing audio onto video -> {output_path}")
+    if _can_copy_audio(audio_path):
+        audio_args = {"acodec": "copy"}
+    else:
+        audio_args = {"acodec": "aac", "audio_bitrate": "192k"}
     video_input = ffmpeg.input(video_path)
     audio_input = ffmpeg.input(audio_path)
     (
         ffmpeg
         .output(video_input.video, audio_input.audio, output_path,
-                vcodec="copy", acodec="aac", audio_bitrate="192k",
-                shortest=None)
+                vcodec="copy", shortest=None, **audio_args)
         .overwrite_output()
         .run(quiet=True)
     )
     print(f"  Done: {output_path}")
 
 
+def _load_timestamp_events(timestamps_path: str) -> list[dict]:
+    """Read review pause/resume events from a JSONL file or a legacy JSON list."""
+    with open(timestamps_path) as f:
+        if timestamps_path.endswith(".json"):
+            return json.load(f)
+        lines = [line for line in f if line.strip()]
+    events = []
+    for n, line in enumerate(lines, 1):
+        try:
+            events.append(json.loads(line))
+        except json.JSONDecodeError:
+            if n < len(lines):
+                raise
+            # Last line cut short by a crash mid-write; keep everything before it
+            print(f"WARNING: Ignoring truncated last line in {timestamps_path}")
+    return events
+
+
 def create_review_composite(
     overhead_video: str,
     audio_path: str,
     timestamps_path: str,
     output_path: str,
+    encoder: Optional[str] = None,
 ):
     """Expand overhead video by inserting frozen frames at pause points, then mux audio.
 
-    The timestamps_path JSON should contain a list of events:
-        [{"type": "pause", "wall_time": ..., "video_position_sec": ...},
-         {"type": "resume", "wall_time": ..., "video_position_sec": ...}, ...]
+    The timestamps_path file holds one JSON event per line (.jsonl), or a
+    JSON list of events for sessions recorded before the JSONL format:
+        {"type": "pause", "wall_time": ..., "video_position_sec": ...}
+        {"type": "resume", "wall_time": ..., "video_position_sec": ...}
 
     During each pause->resume interval, the last frame before the pause is
     repeated to fill the gap (matching the wall-clock duration of the pause).
+
+    With an H.264 encoder name (see video_recorder.detect_h264_encoder) the
+    expanded frames and the audio go through a single ffmpeg process straight
+    to output_path. Otherwise an mp4v temp file is written and then muxed.
     """
     print(f"Creating review composite -> {output_path}")
 
-    with open(timestamps_path) as f:
-        events = json.load(f)
+    events = _load_timestamp_events(timestamps_path)
 
     # Build pause intervals: [(video_pos_sec, pause_duration_sec), ...]
     pause_intervals = []
@@ -79,9 +142,15 @@ def create_review_composite(
     w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
     h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
 
-    temp_video = str(Path(output_path).parent / "_temp_expanded.mp4")
-    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-    writer = cv2.VideoWriter(temp_video, fourcc, fps, (w, h))
+    temp_video = None
+    if encoder:
+        audio_args = ["-c:a", "copy"] if _can_copy_audio(audio_path) else None
+        writer = FFmpegPipeWriter(output_path, fps, (w, h), encoder,
+                                  audio_path=audio_path, audio_args=audio_args)
+    else:
+        temp_video = str(Path(output_path).parent / "_temp_expanded.mp4")
+        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+        writer = cv2.VideoWriter(temp_video, fourcc, fps, (w, h))
 
     # Sort pauses by video position
     pause_intervals.sort(key=lambda x: x[0])
@@ -114,29 +183,43 @@ def create_review_composite(
         frame_idx += 1
 
     cap.release()
-    writer.release()
+    # FFmpegPipeWriter returns ffmpeg's exit status (cv2.VideoWriter None)
+    status = writer.release()
+    if status:
+        raise RuntimeError(f"ffmpeg exited with status {status} writing {output_path}")
 
-    # Mux audio onto the expanded video
-    overlay_audio_on_video(temp_video, audio_path, output_path)
+    if temp_video is not None:
+        # Mux audio onto the expanded video
+        overlay_audio_on_video(temp_video, audio_path, output_path)
 
-    # Clean up temp file
-    Path(temp_video).unlink(missing_ok=True)
+        # Clean up temp file
+        Path(temp_video).unlink(missing_ok=True)
     print(f"  Review composite done: {output_path}")
 
 
+def _encoder_output_kwargs(encoder: Optional[str]) -> dict:
+    """ffmpeg-python output kwargs for an H264_ENCODER_ARGS entry ({} for ffmpeg's default)."""
+    if not encoder:
+        return {}
+    args = H264_ENCODER_ARGS[encoder]
+    return {flag.lstrip("-"): value for flag, value in zip(args[::2], args[1::2])}
+
+
 def create_hr_synced_video(
     video_path: str,
     hr_csv_path: str,
     output_path: str,
     phase: str,
+    encoder: Optional[str] = None,
 ):
     """Burn HR BPM as text overlay onto a video using ffmpeg drawtext filter.
 
     Reads the HR CSV to get BPM values for the given phase, then overlays
-    the nearest BPM value as text on each frame.
+    the nearest BPM value as text on each frame. The audio stream is copied.
+    With an H.264 encoder name (see video_recorder.detect_h264_encoder) the
+    video is re-encoded with that encoder's fast settings instead of
+    ffmpeg's default libx264 preset.
     """
-    import csv
-
     print(f"Creating HR overlay video -> {output_path}")
 
     # Read HR samples for the given phase
@@ -149,7 +232,7 @@ def create_hr_synced_video(
 
     if not hr_data:
         print(f"  No HR data for phase '{phase}', copying video as-is")
-        shutil.copy2(video_path, output_path)
+        copy_file(video_path, output_path)
         return
 
     # Get video start time (use first HR sample as reference)
@@ -186,7 +269,7 @@ def create_hr_synced_video(
         (
             ffmpeg
             .input(video_path)
-            .output(output_path, vf=drawtext, acodec="copy")
+            .output(output_path, vf=drawtext, acodec="copy", **_encoder_output_kwargs(encoder))
             .overwrite_output()
             .run(quiet=True)
         )
@@ -0,0 +1,116 @@
+"""Queue carrying events from the experiment thread to the GUI."""
+
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Optional
+
+
+class _LatestSlot:
+    """Queue placeholder for the newest pending event of one type."""
+
+    __slots__ = ("type",)
+
+    def __init__(self, event_type: str):
+        self.type = event_type
+
+
+class GuiEventQueue:
+    """Experiment -> GUI event channel.
+
+    A deque guarded by a plain Lock, plus a threading.Event for consumers
+    that want to block. Exposes the subset of the queue.Queue API the GUI
+    uses, without Queue's Condition bookkeeping on every put.
+
+    Control events (put/put_many) are never dropped. High-rate events go
+    through put_latest, which holds at most one pending event per type, so
+    a stalled GUI cannot make the queue grow with frames.
+    """
+
+    def __init__(self):
+        self._items: deque = deque()
+        self._latest: dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+
+    def _notify(self):
+        # Event.set() takes the Condition lock and notifies every call; it only
+        # needs doing on the empty -> non-empty edge. The flag is only cleared
+        # under _lock once the deque is empty, so a set flag stays truthful.
+        if not self._ready.is_set():
+            self._ready.set()
+
+    def put(self, event: Any):
+        with self._lock:
+            self._items.append(event)
+        self._notify()
+
+    def put_many(self, events: list):
+        """Enqueue several events with a single lock acquisition and wakeup."""
+        with self._lock:
+            self._items.extend(events)
+        self._notify()
+
+    def put_latest(self, event: dict) -> Optional[dict]:
+        """Enqueue event as the single pending event of its type.
+
+        A pending event of the same type is overwritten in place, wherever
+        it sits in the queue, and returned so the caller can recycle it.
+        For high-rate events (e.g. video_frame) where the GUI only needs
+        the newest one. Returns None if nothing was displaced.
+        """
+        etype = event.get("type")
+        with self._lock:
+            replaced = self._latest.get(etype)
+            if replaced is None:
+                self._items.append(_LatestSlot(etype))
+            self._latest[etype] = event
+        self._notify()
+        return replaced
+
+    def _resolve(self, item: Any) -> Any:
+        if isinstance(item, _LatestSlot):
+            return self._latest.pop(item.type)
+        return item
+
+    def get_nowait(self) -> Any:
+        with self._lock:
+            if not self._items:
+                raise queue.Empty
+            item = self._resolve(self._items.popleft())
+            if not self._items:
+                self._ready.clear()
+        return item
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """Block until an event is available (or raise queue.Empty on timeout)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self.get_nowait()
+            except queue.Empty:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise
+                self._ready.wait(remaining)
+
+    def drain(self) -> list:
+        """Remove and return every queued event, oldest first."""
+        with self._lock:
+            items = [self._resolve(item) for item in self._items]
+            self._items.clear()
+            self._ready.clear()
+        return items
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._latest.clear()
+            self._ready.clear()
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def qsize(self) -> int:
+        return len(self._items)
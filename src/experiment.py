@@ -5,30 +5,85 @@ video playback, and compositing. Post-hoc calibration is available
 separately from the Calibration tab.
 """
 
+import gzip
+import io
 import json
+import os
 import queue
-import shutil
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, redirect_stderr, redirect_stdout
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional
 
-from .audio import AudioConfig, AudioRecorder
+import cv2
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used instead
+    orjson = None
+
+from .audio import AudioConfig, AudioRecorder, find_audio_device
 from .camera import CameraManager
 from .compositing import (
     check_ffmpeg,
     create_hr_synced_video,
     create_review_composite,
 )
+from .events import GuiEventQueue
 from .gopro import GoProManager
 from .heart_rate import PolarH10
 from .phase import Phase, PhaseConfig, PhaseStatus
-from .utils import timestamp_string
-from .video_player import PlayerState, VideoPlayer
-from .video_recorder import PausableVideoRecorder, VideoRecorder
+from .utils import copy_tree_parallel, single_opencv_thread, timestamp_string
+from .video_player import VideoPlayer
+from .video_recorder import PausableVideoRecorder, VideoRecorder, detect_h264_encoder
+
+
+# Width of the camera-selection thumbnails shown by the GUI
+SELECTION_PREVIEW_WIDTH = 480
+
+# Subdirectories created in every session directory
+SESSION_SUBDIRS = ("performance", "review", "scoring", "composited",
+                   "heart_rate", "gopro_footage", "calibration")
+
+# (subdir, file name) of each input to the review composite
+REVIEW_COMPOSITE_INPUTS = (("performance", "overhead_camera.mp4"),
+                           ("review", "audio_commentary.wav"),
+                           ("review", "review_timestamps.jsonl"))
+
+
+def _call_capturing_output(fn, *args, **kwargs) -> tuple[str, Optional[Exception]]:
+    """Run fn in a pool worker; return what it printed and the error it raised, if any.
+
+    A worker process has its own stdout, which the GUI never sees (and which
+    is None under pythonw), so the parent prints the captured text itself.
+    """
+    output = io.StringIO()
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            fn(*args, **kwargs)
+        except Exception as e:
+            return output.getvalue(), e
+    return output.getvalue(), None
+
+
+def _json_line(entry: dict) -> bytes:
+    """Serialize one JSONL record (orjson when installed)."""
+    if orjson:
+        return orjson.dumps(entry) + b"\n"
+    return (json.dumps(entry) + "\n").encode()
 
 
 class Experiment:
-    def __init__(self, settings: dict, gui_event_queue: Optional[queue.Queue] = None,
+    # Sync events are appended to sync_manifest.jsonl in batches of this size
+    SYNC_FLUSH_EVERY = 50
+    SYNC_FLUSH_INTERVAL = 1.0
+    SYNC_GZIP_MIN_EVENTS = 1000
+
+    def __init__(self, settings: dict, gui_event_queue: Optional[GuiEventQueue] = None,
                  user_action_queue: Optional[queue.Queue] = None,
                  gopro_mode: str = "auto"):
         self.settings = settings
@@ -45,6 +100,16 @@ class Experiment:
             self.gopro_manager = GoProManager(settings.get("gopros", []))
         self.phases = self._load_phases(settings["phases"])
         self.current_phase_index = 0
+        # Phase id -> handler, built once rather than on every loop iteration
+        self._phase_handlers = {
+            "setup": self._run_setup,
+            "heart_rate_start": self._run_heart_rate_start,
+            "warmup_calibration": self._run_warmup_calibration,
+            "performance": self._run_performance,
+            "review": self._run_review,
+            "scoring": self._run_scoring,
+            "finish": self._run_finish,
+        }
 
         # Polar H10 heart rate monitor setup
         hr_settings = settings.get("heart_rate", {})
@@ -69,23 +134,51 @@ class Experiment:
 
         self._session_timestamp = timestamp_string()
         self._session_dir: Optional[Path] = None
+        self._paths: dict[str, Path] = {}
+        self._files = SimpleNamespace()  # per-session media file paths (str), set in setup()
+        self._preferred_encoder: Optional[str] = None
         self._keepalive_interval = 2.5
-        self._last_keepalive = 0.0
+        self._keepalive_stop = threading.Event()
+        self._keepalive_thread: Optional[threading.Thread] = None
 
         # GUI communication queues
-        self._gui_event_queue = gui_event_queue or queue.Queue()
+        self._has_gui = gui_event_queue is not None
+        self._gui_event_queue = gui_event_queue or GuiEventQueue()
         self._user_action_queue = user_action_queue or queue.Queue()
 
+        # Set by request_stop(); lets _check_for_stop test without touching the queue
+        self._stop_event = threading.Event()
+
         self._skip_remaining = False
         self._redo_requested = False
         self._hr_saved = False
 
-        # Synchronization event log — timestamped record of every key moment
-        self._sync_log = []
+        # Holds single_opencv_thread() from setup until teardown
+        self._cv_threads = ExitStack()
+
+        # Synchronization event log — timestamped record of every key moment.
+        # Wall times use time.time(), the same clock as the HR/ECG samples
+        # and review timestamps they are aligned with.
+        self._sync_log = deque()
+        self._sync_flushed = 0
+        self._sync_write_lock = threading.Lock()
+        self._sync_wake = threading.Event()
+        self._sync_writer: Optional[threading.Thread] = None
+        self._sync_writer_stop = False
 
         # Persistent recorder for overhead camera (spans calibration -> performance)
         self._overhead_recorder: Optional["VideoRecorder"] = None
 
+        # Overhead-video player shared by review and scoring (same file)
+        self._overhead_player: Optional[VideoPlayer] = None
+
+        # Review composite, started in the background as soon as review ends
+        self._composite_pool: Optional[ProcessPoolExecutor] = None
+        self._review_composite: Optional[Future] = None
+
+        # F: drive backup runs after teardown on its own (non-daemon) thread
+        self._backup_thread: Optional[threading.Thread] = None
+
     def _load_phases(self, phase_configs: list[dict]) -> list[Phase]:
         phases = []
         for cfg in phase_configs:
@@ -110,55 +203,232 @@ class Experiment:
             return self.phases[self.current_phase_index]
         return None
 
+    def _set_hr_phase(self, phase_id: str):
+        """Tag incoming HR samples with a phase (hr_monitor exists only when HR is enabled)."""
+        if self.hr_monitor is not None:
+            self.hr_monitor.set_phase(phase_id)
+
     def _send_gui_event(self, event_type: str, **data):
         """Send an event to the GUI."""
         self._gui_event_queue.put({"type": event_type, **data})
 
-    def _wait_for_user_action(self, action_type: str, timeout: float = None) -> Optional[dict]:
-        """Wait for a specific user action from the GUI."""
-        deadline = time.time() + timeout if timeout else None
+    def _send_gui_events_batch(self, events: list[dict]):
+        """Send several events (each a dict with a "type") in one queue operation."""
+        self._gui_event_queue.put_many(events)
+
+    def _wait_action(self, expected_types: set, deadline: Optional[float] = None) -> Optional[dict]:
+        """Block until an expected action (or redo) arrives from the GUI.
+
+        deadline is a time.monotonic() value. Sleeps on the queue itself
+        until an action arrives or the deadline passes (GoPro keep-alives run
+        on their own thread). Returns None if the deadline passes first. A
+        stop action raises KeyboardInterrupt here, so callers never see one.
+        """
+        wanted = set(expected_types) | {"redo"}
         while True:
-            remaining = None
-            if deadline:
-                remaining = deadline - time.time()
-                if remaining <= 0:
+            wait = None
+            if deadline is not None:
+                wait = deadline - time.monotonic()
+                if wait <= 0:
                     return None
             try:
-                wait_time = min(remaining, 0.5) if remaining else 0.5
-                action = self._user_action_queue.get(timeout=wait_time)
-                if action.get("type") == action_type:
-                    return action
-                if action.get("type") == "stop":
-                    raise KeyboardInterrupt("User stopped experiment")
-                if action.get("type") == "redo":
-                    self._redo_requested = True
-                    return None
+                action = self._user_action_queue.get(timeout=wait)
             except queue.Empty:
-                continue
+                return None
+            if action.get("type") == "stop":
+                self._stop_event.set()
+                raise KeyboardInterrupt("User stopped experiment")
+            if action.get("type") in wanted:
+                return action
+
+    def _wait_for_user_action(self, action_type: str, timeout: float = None) -> Optional[dict]:
+        """Wait for a specific user action from the GUI."""
+        deadline = time.monotonic() + timeout if timeout else None
+        action = self._wait_action({action_type}, deadline)
+        if action is None:
+            return None
+        if action.get("type") == "redo":
+            self._redo_requested = True
+            return None
+        return action
+
+    def _get_overhead_player(self) -> Optional[VideoPlayer]:
+        """Return the stopped, rewound overhead-video player, opening it on first use.
+
+        Review and scoring play the same file, so the decoder and preview
+        buffers are set up once. Returns None if the video cannot be opened.
+        """
+        player = self._overhead_player
+        if player is None:
+            player = VideoPlayer(self._files.overhead_video, preview_width=960)
+            if not player.open():
+                return None
+            self._overhead_player = player
+        else:
+            player.stop()
+        player.on_frame = player.on_state_change = player.on_complete = None
+        player.should_display = None
+        return player
+
+    def _close_overhead_player(self):
+        """Release the shared overhead-video player (e.g. before the file is re-recorded)."""
+        if self._overhead_player is not None:
+            self._overhead_player.close()
+            self._overhead_player = None
+
+    def _start_review_composite(self):
+        """Build the review composite in the background while scoring runs.
+
+        Its inputs are final once review ends (HR overlays need the HR CSV,
+        which is only written at finish). One worker, so the scoring
+        recordings keep most of the CPU. Its output is printed when
+        _run_finish collects it.
+        """
+        if not self._present_files("performance", "review").issuperset(REVIEW_COMPOSITE_INPUTS):
+            return
+        files = self._files
+        if self._composite_pool is None:
+            self._composite_pool = ProcessPoolExecutor(max_workers=1)
+        print("Starting review composite in the background...")
+        self._review_composite = self._composite_pool.submit(
+            _call_capturing_output, create_review_composite, files.overhead_video,
+            files.review_audio, files.review_timestamps, files.review_composite,
+            encoder=self._preferred_encoder)
+
+    def _present_files(self, *subdirs: str) -> set[tuple[str, str]]:
+        """(subdir, file name) for every entry in the given session subdirs.
+
+        One directory listing per subdir instead of a stat per candidate file.
+        A subdir removed since setup just contributes nothing.
+        """
+        present = set()
+        for name in subdirs:
+            try:
+                with os.scandir(self._paths[name]) as entries:
+                    present.update((name, entry.name) for entry in entries)
+            except FileNotFoundError:
+                pass
+        return present
+
+    def _discard_review_composite(self):
+        """Drop a background review composite before review re-records its inputs."""
+        job = self._review_composite
+        if job is None:
+            return
+        self._review_composite = None
+        if not job.cancel():
+            print("Waiting for the previous review composite to finish...")
+            try:
+                job.result()
+            except Exception:
+                pass
+
+    def _shutdown_composite_pool(self):
+        """Wait for any running background composite and release the worker."""
+        if self._composite_pool is not None:
+            self._composite_pool.shutdown(wait=True, cancel_futures=True)
+            self._composite_pool = None
+
+    def _frame_forwarder(self, player: VideoPlayer):
+        """Build the player's on_frame callback that forwards frames to the GUI.
+
+        Frames arrive already downscaled by the player, and the GUI hands each
+        buffer back through release once drawn. Until it does, the player is
+        told to skip display ticks, so frames the GUI could not show are never
+        converted. Per-file values are looked up once here, not per frame, and
+        each frame costs a single event dict (no **kwargs repacking).
+        """
+        put_latest = self._gui_event_queue.put_latest
+        duration_sec = player.duration_sec
+        pending = threading.Event()
+
+        def release(frame):
+            pending.clear()
+            player.release_preview(frame)
+
+        def on_frame(frame, position_sec):
+            pending.set()
+            replaced = put_latest({"type": "video_frame", "frame": frame, "position_sec": position_sec,
+                                   "duration_sec": duration_sec, "release": release})
+            if replaced is not None:
+                # Never drawn: recycle the buffer, the new frame is still pending
+                player.release_preview(replaced["frame"])
+
+        player.should_display = lambda: not pending.is_set()
+        return on_frame
+
+    def _post_video_complete(self):
+        """VideoPlayer.on_complete hook: wake the phase loop waiting on the action queue."""
+        self._user_action_queue.put({"type": "video_complete"})
+
+    def request_stop(self):
+        """Ask the experiment to stop (called from the GUI thread).
+
+        Sets the stop flag for _check_for_stop and also queues a stop action
+        to wake a phase blocked in _wait_action.
+        """
+        self._stop_event.set()
+        self._user_action_queue.put({"type": "stop"})
 
     def _check_for_stop(self):
         """Non-blocking check if user requested stop."""
-        try:
-            action = self._user_action_queue.get_nowait()
-            if action.get("type") == "stop":
-                raise KeyboardInterrupt("User stopped experiment")
-            # Put back if not a stop action
-            self._user_action_queue.put(action)
-        except queue.Empty:
-            pass
-
-    def _send_keepalive(self):
-        """Send GoPro keep-alive if interval has elapsed."""
-        now = time.time()
-        if now - self._last_keepalive >= self._keepalive_interval:
-            self.gopro_manager.keep_alive_all()
-            self._last_keepalive = now
+        if self._stop_event.is_set():
+            raise KeyboardInterrupt("User stopped experiment")
+
+    def _keepalive_loop(self):
+        """Background thread: keep the GoPros awake until teardown."""
+        while True:
+            try:
+                self.gopro_manager.keep_alive_all()
+            except Exception as e:
+                print(f"WARNING: GoPro keep-alive failed: {e}")
+            if self._keepalive_stop.wait(self._keepalive_interval):
+                return
+
+    def _stop_keepalive(self):
+        """Stop the keep-alive thread before the GoPros are stopped or disconnected."""
+        if self._keepalive_thread is None:
+            return
+        self._keepalive_stop.set()
+        self._keepalive_thread.join()
+        self._keepalive_thread = None
 
     def _log_sync(self, event: str, **extra):
         """Append a timestamped event to the synchronization log."""
         entry = {"event": event, "wall_time": time.time()}
         entry.update(extra)
         self._sync_log.append(entry)
+        if len(self._sync_log) - self._sync_flushed >= self.SYNC_FLUSH_EVERY:
+            self._sync_wake.set()
+
+    def _flush_sync_log(self):
+        """Append not-yet-written sync events to the sync_manifest.jsonl sidecar."""
+        with self._sync_write_lock:
+            log = self._sync_log
+            end = len(log)
+            if not self._session_dir or self._sync_flushed >= end:
+                return
+            # Index rather than iterate: the deque may grow while we write
+            pending = [log[i] for i in range(self._sync_flushed, end)]
+            with open(self._session_dir / "sync_manifest.jsonl", "ab", buffering=0) as f:
+                f.write(b"".join(_json_line(entry) for entry in pending))
+            self._sync_flushed = end
+
+    def _sync_writer_loop(self):
+        """Background thread: flush the sync log periodically, or sooner when a batch is due."""
+        while not self._sync_writer_stop:
+            self._sync_wake.wait(self.SYNC_FLUSH_INTERVAL)
+            self._sync_wake.clear()
+            self._flush_sync_log()
+
+    def _stop_sync_writer(self):
+        """Stop the background sync writer; it flushes once more on the way out."""
+        if self._sync_writer is None:
+            return
+        self._sync_writer_stop = True
+        self._sync_wake.set()
+        self._sync_writer.join()
+        self._sync_writer = None
 
     def setup(self) -> bool:
         """Initialize experiment resources."""
@@ -167,26 +437,83 @@ class Experiment:
         # Check ffmpeg
         if not check_ffmpeg():
             print("WARNING: ffmpeg not found on PATH. Compositing will be unavailable.")
+        else:
+            # Hardware H.264 if available; None falls back to OpenCV mp4v
+            self._preferred_encoder = detect_h264_encoder()
 
         # Create session directory
         self._session_dir = self.output_dir / f"{self.name.replace(' ', '_')}_{self._session_timestamp}"
-        self._session_dir.mkdir(parents=True, exist_ok=True)
+        self._paths = {name: self._session_dir / name for name in SESSION_SUBDIRS}
+        try:
+            self._session_dir.mkdir(parents=True)
+        except FileExistsError:
+            # Same name and second as an earlier run: reuse what is there
+            for path in self._paths.values():
+                path.mkdir(exist_ok=True)
+        else:
+            # Fresh session dir, so none of the subdirs can exist yet
+            for path in self._paths.values():
+                os.mkdir(path)
+        paths = self._paths
+        self._files = SimpleNamespace(
+            overhead_video=str(paths["performance"] / "overhead_camera.mp4"),
+            review_face=str(paths["review"] / "face_cam.mp4"),
+            review_audio=str(paths["review"] / "audio_commentary.wav"),
+            review_timestamps=str(paths["review"] / "review_timestamps.jsonl"),
+            scoring_face=str(paths["scoring"] / "face_cam.mp4"),
+            scoring_audio=str(paths["scoring"] / "audio_scoring.wav"),
+            hr_csv=str(paths["heart_rate"] / "hr_full_session.csv"),
+            ecg_csv=str(paths["heart_rate"] / "ecg_full_session.csv"),
+            review_composite=str(paths["composited"] / "overhead_with_commentary.mp4"),
+            review_face_hr=str(paths["composited"] / "review_face_with_hr.mp4"),
+            scoring_face_hr=str(paths["composited"] / "scoring_face_with_hr.mp4"),
+        )
+
+        # Recorders and the player already run one thread per stream; OpenCV's
+        # own pool inside each resize/convert would only oversubscribe the cores
+        self._cv_threads.enter_context(single_opencv_thread())
+
+        # Stream HR (and ECG) samples to disk as they arrive
+        if self.hr_monitor:
+            ecg_csv = Path(self._files.ecg_csv) if self.hr_monitor.ecg_enabled else None
+            self.hr_monitor.attach_writers(Path(self._files.hr_csv), ecg_csv)
+
+        # Resolve the microphone once; later phases reuse the cached index
+        if self.mic_enabled and self.mic_config.device_index is None:
+            self.mic_config.device_index = find_audio_device(self.mic_config.device_name)
 
         self._log_sync("session_created", session_dir=str(self._session_dir))
+        self._sync_writer = threading.Thread(target=self._sync_writer_loop,
+                                             name="sync-writer", daemon=True)
+        self._sync_writer.start()
+        self._keepalive_thread = threading.Thread(target=self._keepalive_loop,
+                                                  name="gopro-keepalive", daemon=True)
+        self._keepalive_thread.start()
         return True
 
     def _backup_to_f_drive(self):
-        """Copy the session folder to F:/Iris_Recorded_Taekwondo_Data/ as a backup."""
+        """Copy the session folder to F:/Iris_Recorded_Taekwondo_Data/ as a backup.
+
+        Runs after teardown, by which time the GUI may have restored stdout,
+        so with a GUI the outcome goes out as a status event (backup_done set)
+        for the GUI to log instead of being printed.
+        """
         if self._session_dir is None or not self._session_dir.exists():
-            print("No session directory to back up.")
-            return
+            result = "No session directory to back up."
+        else:
+            result = self._copy_session_to_f_drive()
+        if self._has_gui:
+            self._send_gui_event("status", message=result, backup_done=True)
+        else:
+            print(result)
 
+    def _copy_session_to_f_drive(self) -> str:
+        """Copy the session folder to the F: drive; returns a one-line outcome."""
         backup_root = Path("F:/Iris_Recorded_Taekwondo_Data")
         try:
             # Check if F: drive is available
             if not Path("F:/").exists():
-                print("WARNING: F: drive not found. Skipping backup.")
-                return
+                return "WARNING: F: drive not found. Skipping backup."
 
             backup_dest = backup_root / self._session_dir.name
             print(f"\n--- Backing Up to F: Drive ---")
@@ -195,39 +522,68 @@ class Experiment:
 
             backup_root.mkdir(parents=True, exist_ok=True)
 
-            # Remove existing backup of this session if present
-            if backup_dest.exists():
-                shutil.rmtree(backup_dest)
-
-            shutil.copytree(str(self._session_dir), str(backup_dest))
-            print(f"Backup complete: {backup_dest}")
+            # Incremental: files already backed up unchanged are skipped
+            count = copy_tree_parallel(self._session_dir, backup_dest)
+            return f"Backup complete: {backup_dest} ({count} files copied)"
 
         except Exception as e:
-            print(f"WARNING: Backup to F: drive failed: {e}")
-            print("Primary data is still safe in the output directory.")
+            return (f"WARNING: Backup to F: drive failed: {e}. "
+                    "Primary data is still safe in the output directory.")
 
     def _save_sync_manifest(self):
         """Write the synchronization manifest to the session directory."""
         if not self._session_dir:
             return
+        self._stop_sync_writer()
+        self._flush_sync_log()
         manifest = {
             "session": str(self._session_dir.name),
             "experiment_name": self.name,
             "gopro_mode": self.gopro_mode,
             "hr_enabled": self.hr_enabled,
             "mic_enabled": self.mic_enabled,
-            "events": self._sync_log,
+            "events": list(self._sync_log),
         }
-        path = self._session_dir / "sync_manifest.json"
-        with open(path, "w") as f:
-            json.dump(manifest, f, indent=2)
+        data = orjson.dumps(manifest) if orjson else json.dumps(manifest).encode()
+        if len(self._sync_log) > self.SYNC_GZIP_MIN_EVENTS:
+            # Large sessions: fast, light compression keeps the write short
+            path = self._session_dir / "sync_manifest.json.gz"
+        else:
+            path = self._session_dir / "sync_manifest.json"
+        # Write beside the target and rename, so a crash never leaves a
+        # half-written manifest in place
+        tmp_path = path.with_name(path.name + ".tmp")
+        if path.suffix == ".gz":
+            with gzip.open(tmp_path, "wb", compresslevel=1) as f:
+                f.write(data)
+        else:
+            tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
         print(f"Sync manifest saved to {path}")
 
+    def _print_hr_summary(self):
+        """Print the per-phase Polar H10 summary in a single write."""
+        summary = self.hr_monitor.get_summary()
+        if not summary:
+            return
+        lines = ["\nPolar H10 Summary by Phase:"]
+        for phase, stats in summary.items():
+            avg_rr = stats.get("avg_rr_ms")
+            rr_info = f", avg_rr={avg_rr}ms ({stats['rr_count']} beats)" if avg_rr is not None else ""
+            lines.append(f"  {phase}: avg={stats['avg_bpm']} bpm, "
+                         f"min={stats['min_bpm']}, max={stats['max_bpm']}, "
+                         f"samples={stats['count']}{rr_info}")
+        print("\n".join(lines))
+
     def teardown(self):
         """Clean up all resources."""
         print("\n--- Tearing Down Experiment ---")
         self._log_sync("teardown_start")
 
+        self._close_overhead_player()
+        # A background review composite must finish before the session is backed up
+        self._shutdown_composite_pool()
+
         # Stop overhead recorder if still active (safety net)
         if self._overhead_recorder:
             print("Stopping overhead recorder...")
@@ -240,25 +596,12 @@ class Experiment:
             if not self._hr_saved:
                 self._log_sync("hr_stop_recording")
                 self.hr_monitor.stop_recording()
-                hr_dir = self._session_dir / "heart_rate"
-                hr_dir.mkdir(parents=True, exist_ok=True)
-                hr_path = hr_dir / "hr_full_session.csv"
-                self.hr_monitor.save_to_csv(hr_path)
-                ecg_path = hr_dir / "ecg_full_session.csv"
-                self.hr_monitor.save_ecg_to_csv(ecg_path)
-                summary = self.hr_monitor.get_summary()
-                if summary:
-                    print("\nPolar H10 Summary by Phase:")
-                    for phase, stats in summary.items():
-                        rr_info = ""
-                        if "avg_rr_ms" in stats:
-                            rr_info = f", avg_rr={stats['avg_rr_ms']}ms ({stats['rr_count']} beats)"
-                        print(f"  {phase}: avg={stats['avg_bpm']} bpm, "
-                              f"min={stats['min_bpm']}, max={stats['max_bpm']}, "
-                              f"samples={stats['count']}{rr_info}")
+                self.hr_monitor.close_writers()
+                self._print_hr_summary()
             self.hr_monitor.disconnect()
 
         # Stop GoPro recording first, then disconnect
+        self._stop_keepalive()
         if self.gopro_mode == "auto":
             print("Stopping all GoPro recordings...")
             self.gopro_manager.stop_recording_all()
@@ -267,13 +610,21 @@ class Experiment:
             print("MANUAL MODE: Please stop GoPro recording and power off cameras.")
 
         # Close USB cameras
+        for cam_id, stats in self.camera_manager.stats().items():
+            print(f"Camera {cam_id}: grabbed={stats['grabbed']}, "
+                  f"dropped={stats['dropped']}, fps={stats['fps']:.1f}")
         self.camera_manager.close_all()
+        self._cv_threads.close()
 
         self._log_sync("teardown_complete")
         self._save_sync_manifest()
 
-        # Backup session data to F: drive
-        self._backup_to_f_drive()
+        # Backup session data to F: drive in the background. The thread is
+        # non-daemon, so the interpreter still waits for it before exiting.
+        self._backup_thread = threading.Thread(
+            target=self._backup_to_f_drive, name="session-backup", daemon=False
+        )
+        self._backup_thread.start()
 
         print("Teardown complete")
 
@@ -289,8 +640,7 @@ class Experiment:
                        phase_name=phase.config.name,
                        phase_index=self.current_phase_index)
         # Update heart rate phase label
-        if self.hr_monitor and self.hr_enabled:
-            self.hr_monitor.set_phase(phase.config.id)
+        self._set_hr_phase(phase.config.id)
         # Notify GUI
         self._send_gui_event(
             "phase_change",
@@ -306,15 +656,10 @@ class Experiment:
     # ======================================================================
 
     def _run_setup(self, phase: Phase):
-        """Phase 1: Create output dirs, display project name, auto-advance."""
+        """Phase 1: Display project name (output dirs already exist), auto-advance."""
         print(f"\nExperiment: {self.name}")
         print(f"Session directory: {self._session_dir}")
 
-        # Create all subdirectories
-        for subdir in ["performance", "review", "scoring", "composited",
-                       "heart_rate", "gopro_footage", "calibration"]:
-            (self._session_dir / subdir).mkdir(parents=True, exist_ok=True)
-
         self._send_gui_event("status", message=f"Experiment: {self.name}")
         phase.complete()
 
@@ -346,13 +691,8 @@ class Experiment:
                     print(f"Polar H10 connection failed (attempt {attempt}). Retrying in 3s...")
                     self._send_gui_event("status",
                                          message=f"HR connection failed (attempt {attempt}). Retrying...")
-                    # Check for stop during retry delay
-                    try:
-                        action = self._user_action_queue.get(timeout=3.0)
-                        if action.get("type") == "stop":
-                            raise KeyboardInterrupt("User stopped experiment")
-                    except queue.Empty:
-                        pass
+                    # Retry delay; a stop raises from the wait
+                    self._wait_action(set(), deadline=time.monotonic() + 3.0)
         else:
             print("Heart rate monitoring disabled.")
 
@@ -369,17 +709,25 @@ class Experiment:
         open_cameras = [c for c in self.camera_manager.cameras.values() if c.is_open]
         if len(open_cameras) == 2:
             print("\n--- Camera Role Selection ---")
-            # Read 5 throwaway frames per camera for auto-exposure warmup
-            for cam in open_cameras:
-                for _ in range(5):
-                    cam.read_frame()
+            # Skip 5 frames (grabbed, never decoded) for auto-exposure warmup,
+            # then read one preview frame. Cameras are independent, so warm
+            # them up in parallel.
+            def warmup(cam):
+                cam.skip_frames(5)
+                return cam.read_frame()
+
+            with ThreadPoolExecutor(max_workers=len(open_cameras)) as pool:
+                frames = list(pool.map(warmup, open_cameras))
 
-            # Capture one preview frame from each camera
             preview_frames = {}
             camera_info = []
-            for cam in open_cameras:
-                frame = cam.read_frame()
+            for cam, frame in zip(open_cameras, frames):
                 if frame is not None:
+                    # Ship thumbnails, not full-resolution frames
+                    h, w = frame.shape[:2]
+                    if w > SELECTION_PREVIEW_WIDTH:
+                        size = (SELECTION_PREVIEW_WIDTH, int(h * SELECTION_PREVIEW_WIDTH / w))
+                        frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
                     preview_frames[cam.config.id] = frame
                     camera_info.append({
                         "id": cam.config.id,
@@ -411,10 +759,11 @@ class Experiment:
         # Test microphone
         if self.mic_enabled:
             print("\n--- Testing Microphone ---")
-            from .audio import find_audio_device
             device_idx = self.mic_config.device_index
             if device_idx is None:
+                # Not found at setup (e.g. plugged in since) — look again
                 device_idx = find_audio_device(self.mic_config.device_name)
+                self.mic_config.device_index = device_idx
             if device_idx is not None:
                 print(f"Microphone found: device index {device_idx}")
             else:
@@ -430,12 +779,14 @@ class Experiment:
             print("\n--- Starting GoPro Recording (Calibration) ---")
             self.gopro_manager.start_recording_all()
             self._log_sync("gopro_recording_start", purpose="calibration")
-            self._send_gui_event("recording_status", recording=True, gopros=True)
 
             print("\nGoPros are recording. Please stand in T-pose facing the front camera.")
             print("Ensure the checkerboard is visible to all cameras if doing extrinsic calibration.")
-            self._send_gui_event("wait_for_continue",
-                                 message="Stand in T-pose facing the front camera. Press Continue when done.")
+            self._send_gui_events_batch([
+                {"type": "recording_status", "recording": True, "gopros": True},
+                {"type": "wait_for_continue",
+                 "message": "Stand in T-pose facing the front camera. Press Continue when done."},
+            ])
         else:
             print("\n--- GoPro Mode: MANUAL ---")
             print("Please start GoPro recording manually now.")
@@ -445,25 +796,10 @@ class Experiment:
 
         # Wait for T-pose to finish
         print("Waiting for T-pose to complete...")
-        while True:
-            self._send_keepalive()
-            try:
-                action = self._user_action_queue.get(timeout=1.0)
-            except queue.Empty:
-                continue
-            if action.get("type") == "stop":
-                if self.gopro_mode == "auto":
-                    self.gopro_manager.stop_recording_all()
-                self._send_gui_event("recording_status", recording=False)
-                raise KeyboardInterrupt("User stopped experiment")
-            if action.get("type") == "redo":
-                if self.gopro_mode == "auto":
-                    self.gopro_manager.stop_recording_all()
-                self._send_gui_event("recording_status", recording=False)
-                self._redo_requested = True
-                return
-            if action.get("type") == "continue":
-                break
+        action = self._wait_action({"continue"})
+        if action.get("type") != "continue":
+            self._abort_calibration_recording()
+            return
 
         # Ask Angela to clap to align the cameras
         print("\nAngela, please perform a single clap to align the cameras.")
@@ -473,26 +809,11 @@ class Experiment:
 
         # Wait for clap to finish
         print("Waiting for clap sync to complete...")
-        while True:
-            self._send_keepalive()
-            try:
-                action = self._user_action_queue.get(timeout=1.0)
-            except queue.Empty:
-                continue
-            if action.get("type") == "stop":
-                if self.gopro_mode == "auto":
-                    self.gopro_manager.stop_recording_all()
-                self._send_gui_event("recording_status", recording=False)
-                raise KeyboardInterrupt("User stopped experiment")
-            if action.get("type") == "redo":
-                if self.gopro_mode == "auto":
-                    self.gopro_manager.stop_recording_all()
-                self._send_gui_event("recording_status", recording=False)
-                self._redo_requested = True
-                return
-            if action.get("type") == "continue":
-                self._log_sync("clap_sync_done")
-                break
+        action = self._wait_action({"continue"})
+        if action.get("type") != "continue":
+            self._abort_calibration_recording()
+            return
+        self._log_sync("clap_sync_done")
 
         # Stop GoPro recording after calibration
         if self.gopro_mode == "auto":
@@ -506,10 +827,16 @@ class Experiment:
 
         phase.complete()
 
+    def _abort_calibration_recording(self):
+        """Stop calibration GoPro footage after a redo during warmup."""
+        if self.gopro_mode == "auto":
+            self.gopro_manager.stop_recording_all()
+        self._send_gui_event("recording_status", recording=False)
+        self._redo_requested = True
+
     def _run_performance(self, phase: Phase):
         """Phase 4: Record overhead video + GoPros simultaneously."""
-        if self.hr_monitor and self.hr_enabled:
-            self.hr_monitor.set_phase("performance")
+        self._set_hr_phase("performance")
 
         # Start overhead camera recording
         overhead_cam = self.camera_manager.get_camera_by_role("overhead")
@@ -518,12 +845,13 @@ class Experiment:
             if self.camera_manager.cameras:
                 overhead_cam = next(iter(self.camera_manager.cameras.values()))
 
-        overhead_path = str(self._session_dir / "performance" / "overhead_camera.mp4")
+        overhead_path = self._files.overhead_video
         if overhead_cam and overhead_cam.is_open:
             print(f"OVERHEAD CAM selected: '{overhead_cam.config.name}' "
                   f"(device_index={overhead_cam.config.device_index}, role={overhead_cam.config.role})")
             self._overhead_recorder = VideoRecorder(
-                overhead_cam, overhead_path, fps=overhead_cam.config.fps
+                overhead_cam, overhead_path, fps=overhead_cam.config.fps,
+                encoder=self._preferred_encoder,
             )
             self._overhead_recorder.start()
             self._log_sync("overhead_recorder_start",
@@ -541,31 +869,23 @@ class Experiment:
             print("MANUAL MODE: Ensure GoPros are recording.")
             self._log_sync("gopro_manual_start_prompted", purpose="performance")
 
-        self._send_gui_event("wait_for_continue", message="Recording in progress. Press Continue when done.")
-        self._send_gui_event("recording_status", recording=True, cameras=["overhead"], gopros=True)
+        self._send_gui_events_batch([
+            {"type": "wait_for_continue", "message": "Recording in progress. Press Continue when done."},
+            {"type": "recording_status", "recording": True, "cameras": ["overhead"], "gopros": True},
+        ])
 
         # Wait for user to end performance
         print("Performance recording started. Waiting for user to continue...")
-        while True:
-            self._send_keepalive()
-            action = None
-            try:
-                action = self._user_action_queue.get(timeout=1.0)
-            except queue.Empty:
-                continue
-            if action and action.get("type") == "stop":
-                raise KeyboardInterrupt("User stopped experiment")
-            if action and action.get("type") == "redo":
-                if self._overhead_recorder:
-                    self._overhead_recorder.stop()
-                    self._overhead_recorder = None
-                if self.gopro_mode == "auto":
-                    self.gopro_manager.stop_recording_all()
-                self._send_gui_event("recording_status", recording=False)
-                self._redo_requested = True
-                return
-            if action and action.get("type") == "continue":
-                break
+        action = self._wait_action({"continue"})
+        if action.get("type") == "redo":
+            if self._overhead_recorder:
+                self._overhead_recorder.stop()
+                self._overhead_recorder = None
+            if self.gopro_mode == "auto":
+                self.gopro_manager.stop_recording_all()
+            self._send_gui_event("recording_status", recording=False)
+            self._redo_requested = True
+            return
 
         # Stop overhead recording
         if self._overhead_recorder:
@@ -586,17 +906,16 @@ class Experiment:
 
     def _run_review(self, phase: Phase):
         """Phase 5: Play overhead video, record face cam + mic with pause/play."""
-        if self.hr_monitor and self.hr_enabled:
-            self.hr_monitor.set_phase("review")
+        self._set_hr_phase("review")
+        self._discard_review_composite()
 
-        overhead_path = str(self._session_dir / "performance" / "overhead_camera.mp4")
-        face_video_path = str(self._session_dir / "review" / "face_cam.mp4")
-        audio_path = str(self._session_dir / "review" / "audio_commentary.wav")
-        timestamps_path = str(self._session_dir / "review" / "review_timestamps.json")
+        face_video_path = self._files.review_face
+        audio_path = self._files.review_audio
+        timestamps_path = self._files.review_timestamps
 
-        # Set up video player for overhead footage
-        player = VideoPlayer(overhead_path)
-        if not player.open():
+        # Set up video player for overhead footage (decoder-side 960px preview)
+        player = self._get_overhead_player()
+        if player is None:
             print("WARNING: Cannot open overhead video for review. Skipping review.")
             self._send_gui_event("hide_video_player")
             phase.complete()
@@ -608,7 +927,8 @@ class Experiment:
         if face_cam and face_cam.is_open:
             print(f"REVIEW FACE CAM: '{face_cam.config.name}' "
                   f"(device_index={face_cam.config.device_index}, role={face_cam.config.role})")
-            face_recorder = PausableVideoRecorder(face_cam, face_video_path, fps=face_cam.config.fps)
+            face_recorder = PausableVideoRecorder(face_cam, face_video_path, fps=face_cam.config.fps,
+                                                  encoder=self._preferred_encoder)
             face_recorder.start()
             self._log_sync("face_recorder_start",
                            file="review/face_cam.mp4",
@@ -628,32 +948,18 @@ class Experiment:
             else:
                 audio_recorder = None
 
-        # Timestamp log for pause/resume events
-        timestamps = []
-
-        # Send video frames to GUI via callback (pre-downscale for performance)
-        import cv2 as _cv2
-
-        def on_frame(frame, position_sec):
-            # Downscale to 960px wide before sending to GUI to avoid lag
-            h, w = frame.shape[:2]
-            if w > 960:
-                scale = 960 / w
-                small = _cv2.resize(frame, (960, int(h * scale)), interpolation=_cv2.INTER_AREA)
-            else:
-                small = frame
-            self._send_gui_event("video_frame", frame=small, position_sec=position_sec,
-                                 duration_sec=player.duration_sec)
-
+        # Frames only reach the GUI at display rate, so on a state change also
+        # push the exact position (the frame the pause landed on)
         def on_state_change(state):
-            self._send_gui_event("player_state", state=state.name)
-
-        def on_complete():
-            self._send_gui_event("video_complete")
+            self._send_gui_events_batch([
+                {"type": "player_state", "state": state.name},
+                {"type": "player_progress", "position_sec": player.position_sec,
+                 "duration_sec": player.duration_sec},
+            ])
 
-        player.on_frame = on_frame
+        player.on_frame = self._frame_forwarder(player)
         player.on_state_change = on_state_change
-        player.on_complete = on_complete
+        player.on_complete = self._post_video_complete
 
         self._send_gui_event("show_video_player", allow_pause=True,
                              message="Review overhead video. Use Pause/Play for commentary.",
@@ -663,67 +969,53 @@ class Experiment:
                        duration_sec=player.duration_sec)
         self._send_gui_event("recording_status", recording=True, cameras=["face"])
 
-        # Main review loop
-        video_finished = False
-
-        def mark_complete():
-            nonlocal video_finished
-            video_finished = True
-
-        player.on_complete = mark_complete
-
+        # Main review loop: blocks on the action queue; the player posts
+        # video_complete there at end of file, and frames carry the position
         print("Review phase started. Waiting for user actions...")
-        while not video_finished:
-            try:
-                action = self._user_action_queue.get(timeout=0.5)
-            except queue.Empty:
-                # Send current frame if playing
-                if player.state == PlayerState.PLAYING:
-                    self._send_gui_event("player_progress",
-                                         position_sec=player.position_sec,
-                                         duration_sec=player.duration_sec)
-                continue
-
-            action_type = action.get("type")
-            if action_type == "stop":
-                raise KeyboardInterrupt("User stopped experiment")
-            elif action_type == "redo":
-                player.stop()
-                player.close()
-                if face_recorder:
-                    face_recorder.stop()
-                if audio_recorder:
-                    audio_recorder.stop_recording()
-                    audio_recorder.close()
-                self._send_gui_event("recording_status", recording=False)
-                self._send_gui_event("hide_video_player")
-                self._redo_requested = True
-                return
-            elif action_type == "play":
-                player.play()
-                if face_recorder and face_recorder.is_paused:
-                    face_recorder.resume()
-                timestamps.append({
-                    "type": "resume",
-                    "wall_time": time.time(),
-                    "video_position_sec": player.position_sec,
-                })
-            elif action_type == "pause":
-                player.pause()
-                if face_recorder:
-                    face_recorder.pause()
-                timestamps.append({
-                    "type": "pause",
-                    "wall_time": time.time(),
-                    "video_position_sec": player.position_sec,
-                })
-            elif action_type == "continue":
-                break
+        # Pause/resume events are appended one line at a time, each as a
+        # single unbuffered write, so they survive a crash mid-review
+        with open(timestamps_path, "wb", buffering=0) as ts_file:
+            while True:
+                action = self._wait_action({"play", "pause", "continue", "video_complete"})
+                action_type = action.get("type")
+                if action_type == "redo":
+                    # Performance is re-recorded next, so let go of the file
+                    self._close_overhead_player()
+                    if face_recorder:
+                        face_recorder.stop()
+                    if audio_recorder:
+                        audio_recorder.stop_recording()
+                        audio_recorder.close()
+                    self._send_gui_events_batch([
+                        {"type": "recording_status", "recording": False},
+                        {"type": "hide_video_player"},
+                    ])
+                    self._redo_requested = True
+                    return
+                elif action_type == "play":
+                    player.play()
+                    if face_recorder and face_recorder.is_paused:
+                        face_recorder.resume()
+                    ts_file.write(_json_line({
+                        "type": "resume",
+                        "wall_time": time.time(),
+                        "video_position_sec": player.position_sec,
+                    }))
+                elif action_type == "pause":
+                    player.pause()
+                    if face_recorder:
+                        face_recorder.pause()
+                    ts_file.write(_json_line({
+                        "type": "pause",
+                        "wall_time": time.time(),
+                        "video_position_sec": player.position_sec,
+                    }))
+                else:  # continue, or the video reached its end
+                    break
 
         # Stop everything
         self._log_sync("review_playback_stop")
         player.stop()
-        player.close()
         if face_recorder:
             face_recorder.stop()
             self._log_sync("face_recorder_stop", file="review/face_cam.mp4", phase="review")
@@ -734,26 +1026,22 @@ class Experiment:
 
         self._send_gui_event("recording_status", recording=False)
 
-        # Save timestamps
-        with open(timestamps_path, "w") as f:
-            json.dump(timestamps, f, indent=2)
         print(f"Review timestamps saved to {timestamps_path}")
+        self._start_review_composite()
 
         self._send_gui_event("hide_video_player")
         phase.complete()
 
     def _run_scoring(self, phase: Phase):
         """Phase 6: Play overhead video (no pause), record face cam + audio."""
-        if self.hr_monitor and self.hr_enabled:
-            self.hr_monitor.set_phase("scoring")
+        self._set_hr_phase("scoring")
 
-        overhead_path = str(self._session_dir / "performance" / "overhead_camera.mp4")
-        face_video_path = str(self._session_dir / "scoring" / "face_cam.mp4")
-        audio_path = str(self._session_dir / "scoring" / "audio_scoring.wav")
+        face_video_path = self._files.scoring_face
+        audio_path = self._files.scoring_audio
 
-        # Set up video player
-        player = VideoPlayer(overhead_path)
-        if not player.open():
+        # Reuse the review phase's player (downscales for the GUI preview on its own thread)
+        player = self._get_overhead_player()
+        if player is None:
             print("WARNING: Cannot open overhead video for scoring. Skipping.")
             self._send_gui_event("hide_video_player")
             phase.complete()
@@ -765,7 +1053,8 @@ class Experiment:
         if face_cam and face_cam.is_open:
             print(f"SCORING FACE CAM: '{face_cam.config.name}' "
                   f"(device_index={face_cam.config.device_index}, role={face_cam.config.role})")
-            face_recorder = VideoRecorder(face_cam, face_video_path, fps=face_cam.config.fps)
+            face_recorder = VideoRecorder(face_cam, face_video_path, fps=face_cam.config.fps,
+                                          encoder=self._preferred_encoder)
             face_recorder.start()
             self._log_sync("face_recorder_start",
                            file="scoring/face_cam.mp4",
@@ -785,19 +1074,7 @@ class Experiment:
             else:
                 audio_recorder = None
 
-        import cv2 as _cv2
-
-        def on_frame(frame, position_sec):
-            h, w = frame.shape[:2]
-            if w > 960:
-                scale = 960 / w
-                small = _cv2.resize(frame, (960, int(h * scale)), interpolation=_cv2.INTER_AREA)
-            else:
-                small = frame
-            self._send_gui_event("video_frame", frame=small, position_sec=position_sec,
-                                 duration_sec=player.duration_sec)
-
-        player.on_frame = on_frame
+        player.on_frame = self._frame_forwarder(player)
 
         self._send_gui_event("show_video_player", allow_pause=False,
                              message="Scoring: Press Start to begin. Face camera is recording.",
@@ -807,65 +1084,41 @@ class Experiment:
                        duration_sec=player.duration_sec)
         self._send_gui_event("recording_status", recording=True, cameras=["face"])
 
-        video_finished = False
-
-        def mark_complete():
-            nonlocal video_finished
-            video_finished = True
-
-        player.on_complete = mark_complete
+        player.on_complete = self._post_video_complete
 
         def _cleanup_scoring():
             player.stop()
-            player.close()
             if face_recorder:
                 face_recorder.stop()
             if audio_recorder:
                 audio_recorder.stop_recording()
                 audio_recorder.close()
-            self._send_gui_event("recording_status", recording=False)
-            self._send_gui_event("hide_video_player")
+            self._send_gui_events_batch([
+                {"type": "recording_status", "recording": False},
+                {"type": "hide_video_player"},
+            ])
 
         # Wait for user to press Start (GUI handles countdown, then sends "play")
         print("Scoring phase: Waiting for user to start...")
-        while True:
-            try:
-                action = self._user_action_queue.get(timeout=0.5)
-            except queue.Empty:
-                continue
-            if action.get("type") == "stop":
-                raise KeyboardInterrupt("User stopped experiment")
-            if action.get("type") == "redo":
-                _cleanup_scoring()
-                self._redo_requested = True
-                return
-            if action.get("type") == "play":
-                player.play()
-                self._log_sync("scoring_playback_start")
-                break
+        action = self._wait_action({"play"})
+        if action.get("type") == "redo":
+            _cleanup_scoring()
+            self._redo_requested = True
+            return
+        player.play()
+        self._log_sync("scoring_playback_start")
 
         print("Scoring video playing...")
-        while not video_finished:
-            try:
-                action = self._user_action_queue.get(timeout=0.5)
-                if action.get("type") == "stop":
-                    raise KeyboardInterrupt("User stopped experiment")
-                if action.get("type") == "redo":
-                    _cleanup_scoring()
-                    self._redo_requested = True
-                    return
-                if action.get("type") == "continue":
-                    break
-            except queue.Empty:
-                self._send_gui_event("player_progress",
-                                     position_sec=player.position_sec,
-                                     duration_sec=player.duration_sec)
+        action = self._wait_action({"continue", "video_complete"})
+        if action.get("type") == "redo":
+            _cleanup_scoring()
+            self._redo_requested = True
+            return
 
         self._send_gui_event("recording_status", recording=False)
 
         self._log_sync("scoring_playback_stop")
-        player.stop()
-        player.close()
+        self._close_overhead_player()
         if face_recorder:
             face_recorder.stop()
             self._log_sync("face_recorder_stop", file="scoring/face_cam.mp4", phase="scoring")
@@ -879,8 +1132,7 @@ class Experiment:
 
     def _run_finish(self, phase: Phase):
         """Phase 7: Wait for checklist, stop HR, save data, run compositing."""
-        if self.hr_monitor and self.hr_enabled:
-            self.hr_monitor.set_phase("finish")
+        self._set_hr_phase("finish")
 
         # Wait for user to confirm they want to stop HR (checklist gates Continue)
         self._send_gui_event("wait_for_continue",
@@ -894,71 +1146,64 @@ class Experiment:
         self._log_sync("hr_stop_in_finish")
         if self.hr_monitor:
             self.hr_monitor.stop_recording()
-            hr_dir = self._session_dir / "heart_rate"
-            hr_dir.mkdir(parents=True, exist_ok=True)
-            hr_path = hr_dir / "hr_full_session.csv"
-            self.hr_monitor.save_to_csv(hr_path)
-            ecg_path = hr_dir / "ecg_full_session.csv"
-            self.hr_monitor.save_ecg_to_csv(ecg_path)
-            summary = self.hr_monitor.get_summary()
-            if summary:
-                print("\nPolar H10 Summary by Phase:")
-                for ph, stats in summary.items():
-                    rr_info = ""
-                    if "avg_rr_ms" in stats:
-                        rr_info = f", avg_rr={stats['avg_rr_ms']}ms ({stats['rr_count']} beats)"
-                    print(f"  {ph}: avg={stats['avg_bpm']} bpm, "
-                          f"min={stats['min_bpm']}, max={stats['max_bpm']}, "
-                          f"samples={stats['count']}{rr_info}")
+            self.hr_monitor.close_writers()
+            self._print_hr_summary()
             self._hr_saved = True
 
         # --- Post-Processing ---
         print("\n--- Post-Processing ---")
         self._send_gui_event("status", message="Running post-processing...")
 
-        hr_csv = self._session_dir / "heart_rate" / "hr_full_session.csv"
-        composited_dir = self._session_dir / "composited"
+        files = self._files
+        present = self._present_files("performance", "review", "scoring", "heart_rate")
 
+        # The composites are independent, so each runs in its own process
+        composites = []
         # Composite: overlay commentary audio on expanded overhead video
-        overhead_path = str(self._session_dir / "performance" / "overhead_camera.mp4")
-        audio_path = str(self._session_dir / "review" / "audio_commentary.wav")
-        timestamps_path = str(self._session_dir / "review" / "review_timestamps.json")
-        composite_output = str(composited_dir / "overhead_with_commentary.mp4")
-
-        if Path(audio_path).exists() and Path(timestamps_path).exists() and Path(overhead_path).exists():
-            try:
-                create_review_composite(overhead_path, audio_path, timestamps_path, composite_output)
-            except Exception as e:
-                print(f"WARNING: Review composite failed: {e}")
-        else:
-            print("Skipping review composite (missing files)")
+        # (normally already running since the end of review)
+        if self._review_composite is None:
+            if present.issuperset(REVIEW_COMPOSITE_INPUTS):
+                composites.append(("Review composite", create_review_composite,
+                                   (files.overhead_video, files.review_audio, files.review_timestamps,
+                                    files.review_composite),
+                                   {"encoder": self._preferred_encoder}))
+            else:
+                print("Skipping review composite (missing files)")
 
         # HR synced face videos
-        if hr_csv.exists():
-            review_face = str(self._session_dir / "review" / "face_cam.mp4")
-            if Path(review_face).exists():
-                try:
-                    create_hr_synced_video(
-                        review_face, str(hr_csv),
-                        str(composited_dir / "review_face_with_hr.mp4"),
-                        phase="review",
-                    )
-                except Exception as e:
-                    print(f"WARNING: HR overlay for review failed: {e}")
-
-            scoring_face = str(self._session_dir / "scoring" / "face_cam.mp4")
-            if Path(scoring_face).exists():
-                try:
-                    create_hr_synced_video(
-                        scoring_face, str(hr_csv),
-                        str(composited_dir / "scoring_face_with_hr.mp4"),
-                        phase="scoring",
-                    )
-                except Exception as e:
-                    print(f"WARNING: HR overlay for scoring failed: {e}")
+        if ("heart_rate", "hr_full_session.csv") in present:
+            for face_phase, face_path, output in (("review", files.review_face, files.review_face_hr),
+                                                  ("scoring", files.scoring_face, files.scoring_face_hr)):
+                if (face_phase, "face_cam.mp4") in present:
+                    composites.append((f"HR overlay for {face_phase}", create_hr_synced_video,
+                                       (face_path, files.hr_csv, output),
+                                       {"phase": face_phase, "encoder": self._preferred_encoder}))
         else:
             print("Skipping HR overlay (no HR data)")
 
+        futures = {}
+        if self._review_composite is not None:
+            futures[self._review_composite] = "Review composite"
+            self._review_composite = None
+        if futures or composites:
+            with ProcessPoolExecutor(max_workers=max(1, min(len(composites), os.cpu_count() or 1))) as pool:
+                for label, fn, args, kwargs in composites:
+                    futures[pool.submit(_call_capturing_output, fn, *args, **kwargs)] = label
+                for done, future in enumerate(as_completed(futures), 1):
+                    label = futures[future]
+                    try:
+                        output, error = future.result()
+                    except Exception as e:
+                        # The worker itself died (e.g. BrokenProcessPool)
+                        output, error = "", e
+                    for line in output.splitlines():
+                        print(line)
+                    if error is not None:
+                        print(f"WARNING: {label} failed: {error}")
+                    self._send_gui_event("status",
+                                         message=f"Post-processing: {done}/{len(futures)} done")
+        self._shutdown_composite_pool()
+
         print("Post-processing complete.")
         phase.complete()
 
@@ -980,8 +1225,7 @@ class Experiment:
                            phase_id=self.current_phase.config.id,
                            phase_name=self.current_phase.config.name,
                            phase_index=0)
-            if self.hr_monitor and self.hr_enabled:
-                self.hr_monitor.set_phase(self.current_phase.config.id)
+            self._set_hr_phase(self.current_phase.config.id)
 
             self._send_gui_event(
                 "phase_change",
@@ -996,15 +1240,7 @@ class Experiment:
                 phase_id = phase.config.id
 
                 # Route to phase-specific handler
-                handler = {
-                    "setup": self._run_setup,
-                    "heart_rate_start": self._run_heart_rate_start,
-                    "warmup_calibration": self._run_warmup_calibration,
-                    "performance": self._run_performance,
-                    "review": self._run_review,
-                    "scoring": self._run_scoring,
-                    "finish": self._run_finish,
-                }.get(phase_id)
+                handler = self._phase_handlers.get(phase_id)
 
                 if handler:
                     handler(phase)
@@ -1027,8 +1263,7 @@ class Experiment:
                                    phase_id=prev.config.id,
                                    phase_name=prev.config.name,
                                    phase_index=self.current_phase_index)
-                    if self.hr_monitor and self.hr_enabled:
-                        self.hr_monitor.set_phase(prev.config.id)
+                    self._set_hr_phase(prev.config.id)
                     self._send_gui_event(
                         "phase_change",
                         phase_index=self.current_phase_index,
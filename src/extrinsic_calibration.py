@@ -4,6 +4,10 @@ Reuses checkerboard parameters from lens_correct.py (10x7, 25mm squares).
 """
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import reduce
 from pathlib import Path
 from typing import Optional
 
@@ -11,11 +15,15 @@ import cv2
 import numpy as np
 
 from .lens_correct import (
-    BOARD_INNER_COLS,
-    BOARD_INNER_ROWS,
-    SQUARE_SIZE_MM,
+    BOARD_OBJECT_POINTS,
     calibrate_from_video,
+    detect_checkerboard,
 )
+from .utils import single_opencv_thread
+
+# Sample gaps (in frames) above which seeking beats grabbing forward; a seek
+# lands on the previous keyframe and decodes on from there
+SEEK_MIN_GAP = 30
 
 
 def calibrate_intrinsic(video_path: str) -> Optional[tuple]:
@@ -28,6 +36,58 @@ def calibrate_intrinsic(video_path: str) -> Optional[tuple]:
     return calibrate_from_video(video_path)
 
 
+def _detect_checkerboards(cap: cv2.VideoCapture, sample_indices: set[int]) -> dict[int, np.ndarray]:
+    """Detect the checkerboard in the sampled frames of one video.
+
+    Returns {frame_index: refined corners} for the frames where it was found.
+    Only sampled frames are retrieved: short gaps are skipped with grab()
+    (no colour conversion), long ones with a seek. A frame identical to the
+    previous sample (e.g. a frozen frame our recorders repeat) reuses that
+    sample's result instead of searching again.
+    """
+    detections = {}
+    prev_gray, prev_corners = None, None
+
+    cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+    position = 0  # index of the next frame read() returns
+    for frame_idx in sorted(sample_indices):
+        gap = frame_idx - position
+        if gap > SEEK_MIN_GAP and cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx):
+            position = frame_idx
+        # Not seekable, or a short gap: step forward frame by frame
+        while position < frame_idx and cap.grab():
+            position += 1
+        ret, frame = cap.read()
+        if not ret:
+            break
+        position += 1
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        if prev_gray is not None and np.array_equal(gray, prev_gray):
+            corners = prev_corners
+        else:
+            corners = detect_checkerboard(gray)
+        prev_gray, prev_corners = gray, corners
+        if corners is not None:
+            detections[frame_idx] = corners
+    return detections
+
+
+def _sorted_intersect(a: list[int], b: list[int]) -> list[int]:
+    """Common elements of two ascending lists, by a two-pointer merge."""
+    common = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i] < b[j]:
+            i += 1
+        elif a[i] > b[j]:
+            j += 1
+        else:
+            common.append(a[i])
+            i += 1
+            j += 1
+    return common
+
+
 def _find_shared_checkerboard_frames(
     video_paths: list[str],
     max_frames: int = 200,
@@ -37,9 +97,6 @@ def _find_shared_checkerboard_frames(
     Returns a dict: {frame_index: {video_path: corners_array, ...}}
     Only frames where ALL videos have a detection are included.
     """
-    board_size = (BOARD_INNER_COLS, BOARD_INNER_ROWS)
-    criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 30, 0.001)
-
     caps = {}
     total_frames = float("inf")
     for path in video_paths:
@@ -60,31 +117,15 @@ def _find_shared_checkerboard_frames(
     sample_interval = max(1, total_frames // max_frames)
     sample_indices = set(range(0, total_frames, sample_interval))
 
-    # Detect checkerboard per video per frame
-    detections: dict[str, dict[int, np.ndarray]] = {p: {} for p in caps}
-
-    for path, cap in caps.items():
-        cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-        frame_idx = 0
-        max_frame = max(sample_indices)
-        while frame_idx <= max_frame:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            if frame_idx in sample_indices:
-                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                found, corners = cv2.findChessboardCorners(
-                    gray, board_size,
-                    cv2.CALIB_CB_ADAPTIVE_THRESH
-                    + cv2.CALIB_CB_NORMALIZE_IMAGE
-                    + cv2.CALIB_CB_FAST_CHECK,
-                )
-                if found:
-                    corners_refined = cv2.cornerSubPix(
-                        gray, corners, (11, 11), (-1, -1), criteria
-                    )
-                    detections[path][frame_idx] = corners_refined
-            frame_idx += 1
+    # Detect checkerboard per video, one video per thread (as in calibrate_all)
+    workers = min(len(caps), max(1, (os.cpu_count() or 2) // 2))
+    # The pool already parallelizes across videos; keep OpenCV's internal
+    # threads from multiplying on top of it while it runs
+    with single_opencv_thread() if workers > 1 else nullcontext():
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_detect_checkerboards, caps.values(),
+                               [sample_indices] * len(caps))
+            detections: dict[str, dict[int, np.ndarray]] = dict(zip(caps, results))
 
     for cap in caps.values():
         cap.release()
@@ -95,11 +136,10 @@ def _find_shared_checkerboard_frames(
     if not all_paths:
         return {}
 
-    common_frames = set(detections[all_paths[0]].keys())
-    for path in all_paths[1:]:
-        common_frames &= set(detections[path].keys())
+    # Detections are stored in ascending frame order, so the keys are sorted
+    common_frames = reduce(_sorted_intersect, (list(detections[p]) for p in all_paths))
 
-    for fidx in sorted(common_frames):
+    for fidx in common_frames:
         shared[fidx] = {path: detections[path][fidx] for path in all_paths}
 
     print(f"Found {len(shared)} shared checkerboard frames across {len(all_paths)} cameras")
@@ -118,12 +158,7 @@ def calibrate_extrinsic_pair(
 
     Uses cv2.stereoCalibrate with CALIB_FIX_INTRINSIC so K/D are fixed.
     """
-    board_size = (BOARD_INNER_COLS, BOARD_INNER_ROWS)
-    objp = np.zeros((BOARD_INNER_COLS * BOARD_INNER_ROWS, 3), np.float32)
-    objp[:, :2] = np.mgrid[0:BOARD_INNER_COLS, 0:BOARD_INNER_ROWS].T.reshape(-1, 2)
-    objp *= SQUARE_SIZE_MM
-
-    obj_points = [objp for _ in img_points_a]
+    obj_points = [BOARD_OBJECT_POINTS] * len(img_points_a)
 
     try:
         ret, _, _, _, _, R, T, E, F = cv2.stereoCalibrate(
@@ -159,10 +194,16 @@ def calibrate_all(
     print("  MULTI-CAMERA CALIBRATION")
     print(f"{'=' * 60}")
 
-    # Step 1: Intrinsic calibration per camera
+    # Step 1: Intrinsic calibration per camera. The videos are independent
+    # and OpenCV releases the GIL while decoding/detecting, so they run on
+    # threads (which also keeps their progress output on the GUI's stdout).
+    # Half the cores, since OpenCV parallelizes internally as well.
+    workers = min(len(video_paths), max(1, (os.cpu_count() or 2) // 2)) or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(calibrate_intrinsic, video_paths))
+
     intrinsics = {}
-    for i, path in enumerate(video_paths):
-        result = calibrate_intrinsic(path)
+    for i, (path, result) in enumerate(zip(video_paths, results)):
         if result is None:
             print(f"FAILED: Intrinsic calibration for {path}")
             continue
@@ -227,18 +268,15 @@ def calibrate_all(
 def save_calibration_log(calibrations: dict, output_path: str):
     """Save calibration results to JSON."""
 
-    def ndarray_to_list(obj):
+    def numpy_default(obj):
+        # Only called for values json can't encode itself
         if isinstance(obj, np.ndarray):
             return obj.tolist()
-        if isinstance(obj, dict):
-            return {k: ndarray_to_list(v) for k, v in obj.items()}
-        if isinstance(obj, list):
-            return [ndarray_to_list(v) for v in obj]
-        return obj
-
-    serializable = ndarray_to_list(calibrations)
+        if isinstance(obj, (np.floating, np.integer)):
+            return obj.item()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
     with open(output_path, "w") as f:
-        json.dump(serializable, f, indent=2)
+        json.dump(calibrations, f, indent=2, default=numpy_default)
     print(f"Calibration log saved to {output_path}")
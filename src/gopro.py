@@ -5,28 +5,334 @@ USB WiFi adapter. Uses source-address binding to route HTTP traffic to the
 correct GoPro when multiple cameras share the same IP (10.5.5.9).
 """
 
+import ctypes
 import http.client
+import io
+import json
 import platform
 import socket
 import subprocess
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Callable, Optional
 
+import urllib.error
+import urllib.parse
 import urllib.request
+import urllib.response
 
 from goprocam import GoProCamera, constants
 
+# UDP keep-alive datagram the GoPro expects on port 8554
+KEEPALIVE_PAYLOAD = b"_GPHD_:0:0:2:0.000000\n"
+
+# Upper bound (seconds) on any GoPro HTTP request, so a dropped camera can't
+# hold its API lock indefinitely.
+HTTP_TIMEOUT = 3.0
+
+# gpControl shutter command; p=1 starts recording, p=0 stops it
+SHUTTER_PATH = "/gp/gpControl/command/shutter?p={}"
+
+# gpControl status endpoint and the "status" fields read from it
+STATUS_PATH = "/gp/gpControl/status"
+STATUS_RECORDING = "8"
+STATUS_BATTERY_PERCENT = "70"
+
+# Windows IPPROTO_IP option pinning a socket's outbound traffic to one
+# interface index, whatever the routing table says about 10.5.5.9
+IP_UNICAST_IF = 31
+
+# How long (seconds) a looked-up interface IP is trusted before asking the OS
+# again. Each lookup spawns netsh/ipconfig.
+INTERFACE_IP_TTL = 2.0
+
+_iface_ip_cache: dict[str, tuple[float, str]] = {}
+_iface_ip_lock = threading.Lock()
+
 
 def get_interface_ip(interface_name: str) -> Optional[str]:
     """Get the IPv4 address of a WiFi interface connected to a GoPro network.
 
     Looks for an IP in the 10.5.5.x subnet assigned by the GoPro's DHCP.
+    Found addresses are cached for INTERFACE_IP_TTL seconds; misses are not,
+    so DHCP polling still sees a new lease straight away.
     Windows only; returns None on other platforms.
     """
+    now = time.monotonic()
+    with _iface_ip_lock:
+        cached = _iface_ip_cache.get(interface_name)
+    if cached is not None and now - cached[0] < INTERFACE_IP_TTL:
+        return cached[1]
+    ip = _query_interface_ip(interface_name)
+    if ip:
+        with _iface_ip_lock:
+            _iface_ip_cache[interface_name] = (now, ip)
+    return ip
+
+
+def invalidate_interface_ip(interface_name: str):
+    """Forget the cached IP of an interface, e.g. after changing its address."""
+    with _iface_ip_lock:
+        _iface_ip_cache.pop(interface_name, None)
+
+
+# --- IP Helper API (GetAdaptersAddresses) ---
+# Only the leading fields we read are declared; the OS allocates the records
+# and they are only ever accessed through pointers.
+
+class _SockaddrIn(ctypes.Structure):
+    _fields_ = [
+        ("sin_family", ctypes.c_ushort),
+        ("sin_port", ctypes.c_ushort),
+        ("sin_addr", ctypes.c_ubyte * 4),
+        ("sin_zero", ctypes.c_char * 8),
+    ]
+
+
+class _SocketAddress(ctypes.Structure):
+    _fields_ = [
+        ("lpSockaddr", ctypes.POINTER(_SockaddrIn)),
+        ("iSockaddrLength", ctypes.c_int),
+    ]
+
+
+class _IpAdapterUnicastAddress(ctypes.Structure):
+    pass
+
+
+_IpAdapterUnicastAddress._fields_ = [
+    ("Length", ctypes.c_ulong),
+    ("Flags", ctypes.c_ulong),
+    ("Next", ctypes.POINTER(_IpAdapterUnicastAddress)),
+    ("Address", _SocketAddress),
+]
+
+
+class _IpAdapterAddresses(ctypes.Structure):
+    pass
+
+
+_IpAdapterAddresses._fields_ = [
+    ("Length", ctypes.c_ulong),
+    ("IfIndex", ctypes.c_ulong),
+    ("Next", ctypes.POINTER(_IpAdapterAddresses)),
+    ("AdapterName", ctypes.c_char_p),
+    ("FirstUnicastAddress", ctypes.POINTER(_IpAdapterUnicastAddress)),
+    ("FirstAnycastAddress", ctypes.c_void_p),
+    ("FirstMulticastAddress", ctypes.c_void_p),
+    ("FirstDnsServerAddress", ctypes.c_void_p),
+    ("DnsSuffix", ctypes.c_wchar_p),
+    ("Description", ctypes.c_wchar_p),
+    ("FriendlyName", ctypes.c_wchar_p),
+]
+
+_AF_INET = 2
+_GAA_FLAG_SKIP_ANYCAST = 0x2
+_GAA_FLAG_SKIP_MULTICAST = 0x4
+_GAA_FLAG_SKIP_DNS_SERVER = 0x8
+_ERROR_BUFFER_OVERFLOW = 111
+_ERROR_IO_PENDING = 997
+_WAIT_OBJECT_0 = 0
+_INFINITE = 0xFFFFFFFF
+
+
+class _Overlapped(ctypes.Structure):
+    _fields_ = [
+        ("Internal", ctypes.c_void_p),
+        ("InternalHigh", ctypes.c_void_p),
+        ("Offset", ctypes.c_ulong),
+        ("OffsetHigh", ctypes.c_ulong),
+        ("hEvent", ctypes.c_void_p),
+    ]
+
+
+def _adapter_gopro_ip(adapter: "ctypes._Pointer") -> Optional[str]:
+    """An adapter's first 10.5.5.x IPv4 address, if any."""
+    unicast = adapter.contents.FirstUnicastAddress
+    while unicast:
+        sockaddr = unicast.contents.Address.lpSockaddr
+        if sockaddr and sockaddr.contents.sin_family == _AF_INET:
+            ip = ".".join(map(str, sockaddr.contents.sin_addr))
+            if ip.startswith("10.5.5."):
+                return ip
+        unicast = unicast.contents.Next
+    return None
+
+
+def _find_adapter_ip(first: "ctypes._Pointer", interface_name: str) -> Optional[str]:
+    """Walk an adapter list for interface_name's first 10.5.5.x IPv4 address."""
+    adapter = first
+    while adapter:
+        if adapter.contents.FriendlyName == interface_name:
+            return _adapter_gopro_ip(adapter)
+        adapter = adapter.contents.Next
+    return None
+
+
+def _find_adapter_index(first: "ctypes._Pointer", interface_name: str) -> Optional[int]:
+    """Walk an adapter list for interface_name's interface index."""
+    adapter = first
+    while adapter:
+        if adapter.contents.FriendlyName == interface_name:
+            return adapter.contents.IfIndex
+        adapter = adapter.contents.Next
+    return None
+
+
+def _find_all_adapter_ips(first: "ctypes._Pointer") -> dict[str, str]:
+    """Map every adapter in the list that has a 10.5.5.x address to that address."""
+    ips = {}
+    adapter = first
+    while adapter:
+        ip = _adapter_gopro_ip(adapter)
+        if ip:
+            ips[adapter.contents.FriendlyName] = ip
+        adapter = adapter.contents.Next
+    return ips
+
+
+def _iphlpapi_adapters(visit: Callable[["ctypes._Pointer"], Any]) -> Any:
+    """Fetch the adapter list with GetAdaptersAddresses and return visit(first).
+
+    Raises OSError (or AttributeError off Windows) if the API is unusable.
+    """
+    get_adapters = ctypes.WinDLL("iphlpapi").GetAdaptersAddresses
+    flags = _GAA_FLAG_SKIP_ANYCAST | _GAA_FLAG_SKIP_MULTICAST | _GAA_FLAG_SKIP_DNS_SERVER
+    size = ctypes.c_ulong(15 * 1024)  # Microsoft's recommended first guess
+    for _ in range(3):
+        buf = ctypes.create_string_buffer(size.value)
+        err = get_adapters(_AF_INET, flags, None, buf, ctypes.byref(size))
+        if err == _ERROR_BUFFER_OVERFLOW:
+            continue  # size now holds the required length
+        if err:
+            raise OSError(err, "GetAdaptersAddresses failed")
+        return visit(ctypes.cast(buf, ctypes.POINTER(_IpAdapterAddresses)))
+    raise OSError(_ERROR_BUFFER_OVERFLOW, "GetAdaptersAddresses buffer kept growing")
+
+
+def _wait_for_addr_change(timeout: float) -> bool:
+    """Block until Windows reports an IPv4 address change, or timeout seconds pass.
+
+    Returns True if an address changed. Raises OSError (or AttributeError
+    off Windows) if NotifyAddrChange is unusable.
+    """
+    kernel32 = ctypes.WinDLL("kernel32")
+    iphlpapi = ctypes.WinDLL("iphlpapi")
+    kernel32.CreateEventW.restype = ctypes.c_void_p
+    event = kernel32.CreateEventW(None, False, False, None)
+    if not event:
+        raise OSError("CreateEventW failed")
+    overlapped = _Overlapped(hEvent=event)
+    handle = ctypes.c_void_p()
+    try:
+        err = iphlpapi.NotifyAddrChange(ctypes.byref(handle), ctypes.byref(overlapped))
+        if err != _ERROR_IO_PENDING:
+            raise OSError(err, "NotifyAddrChange failed")
+        result = kernel32.WaitForSingleObject(ctypes.c_void_p(event), int(timeout * 1000))
+        if result != _WAIT_OBJECT_0:
+            # Cancellation completes asynchronously and the kernel still owns
+            # `overlapped` until then; wait for the (aborted or raced)
+            # completion before it and the event are freed.
+            iphlpapi.CancelIPChangeNotify(ctypes.byref(overlapped))
+            kernel32.WaitForSingleObject(ctypes.c_void_p(event), _INFINITE)
+        return result == _WAIT_OBJECT_0
+    finally:
+        kernel32.CloseHandle(ctypes.c_void_p(event))
+
+
+def _iphlpapi_interface_ip(interface_name: str) -> Optional[str]:
+    """Look the address up in-process with GetAdaptersAddresses."""
+    return _iphlpapi_adapters(lambda first: _find_adapter_ip(first, interface_name))
+
+
+def get_interface_index(interface_name: str) -> Optional[int]:
+    """Get the IPv4 interface index of a WiFi interface.
+
+    Windows only; returns None on other platforms or if the IP Helper API
+    is unavailable.
+    """
     if platform.system() != "Windows":
         return None
+    try:
+        return _iphlpapi_adapters(lambda first: _find_adapter_index(first, interface_name))
+    except (OSError, AttributeError):
+        return None
+
+
+def _pin_to_interface(sock: socket.socket, if_index: Optional[int]):
+    """Send sock's traffic out of interface if_index (no-op for None)."""
+    if if_index is not None:
+        sock.setsockopt(socket.IPPROTO_IP, IP_UNICAST_IF, socket.htonl(if_index))
+
+
+def _parse_ipconfig(output: str, interface_names: list[str]) -> dict[str, str]:
+    """Map the given adapter names to their 10.5.5.x IPv4 addresses in ipconfig output.
+
+    Adapter sections start with an unindented header that ends with the
+    adapter name, e.g. "Wireless LAN adapter WiFi 4:" or, localized,
+    "Carte réseau sans fil WiFi 4 :". Only the name is matched, so the
+    wording around it does not matter.
+    """
+    ips = {}
+    current = None
+    for line in output.splitlines():
+        if line and not line[0].isspace():
+            header = line.strip().rstrip(":").rstrip()
+            current = next((name for name in interface_names
+                            if header == name or header.endswith(" " + name)), None)
+        elif current and "IPv4" in line:
+            ip = line.rsplit(":", 1)[-1].strip().split("(", 1)[0]
+            if ip.startswith("10.5.5.") and current not in ips:
+                ips[current] = ip
+    return ips
+
+
+def _ipconfig_interface_ips(interface_names: list[str]) -> dict[str, str]:
+    """Run ipconfig once and parse the named adapters' 10.5.5.x addresses."""
+    result = subprocess.run(
+        ["ipconfig"], capture_output=True, text=True, timeout=5,
+    )
+    return _parse_ipconfig(result.stdout, interface_names)
+
+
+def get_all_interface_ips(interface_names: list[str]) -> dict[str, str]:
+    """Look up the 10.5.5.x addresses of several interfaces in one OS query.
+
+    The results seed the get_interface_ip cache, so connecting N cameras
+    costs one lookup instead of N. Windows only; empty elsewhere.
+    """
+    if platform.system() != "Windows":
+        return {}
+    try:
+        found = _iphlpapi_adapters(_find_all_adapter_ips)
+        ips = {name: found[name] for name in interface_names if name in found}
+    except (OSError, AttributeError):
+        try:
+            ips = _ipconfig_interface_ips(interface_names)
+        except Exception:
+            return {}
+    now = time.monotonic()
+    with _iface_ip_lock:
+        for name, ip in ips.items():
+            _iface_ip_cache[name] = (now, ip)
+    return ips
+
+
+def _query_interface_ip(interface_name: str) -> Optional[str]:
+    """Ask the OS for the interface's 10.5.5.x address.
+
+    Uses the IP Helper API; netsh and then ipconfig output are parsed only
+    if that call is unavailable.
+    """
+    if platform.system() != "Windows":
+        return None
+    try:
+        return _iphlpapi_interface_ip(interface_name)
+    except (OSError, AttributeError):
+        pass
     try:
         result = subprocess.run(
             ["netsh", "interface", "ip", "show", "addresses", interface_name],
@@ -42,19 +348,7 @@ def get_interface_ip(interface_name: str) -> Optional[str]:
         pass
     # Fallback: parse ipconfig output
     try:
-        result = subprocess.run(
-            ["ipconfig"], capture_output=True, text=True, timeout=5,
-        )
-        found_interface = False
-        for line in result.stdout.splitlines():
-            if interface_name in line:
-                found_interface = True
-            elif found_interface and "IPv4" in line:
-                ip = line.rsplit(":", 1)[-1].strip()
-                if ip.startswith("10.5.5."):
-                    return ip
-            elif found_interface and line.strip() == "":
-                found_interface = False
+        return _ipconfig_interface_ips([interface_name]).get(interface_name)
     except Exception:
         pass
     return None
@@ -77,11 +371,22 @@ def ensure_interface_ip(interface_name: str, static_ip: str,
     if ip:
         return ip
 
-    # Wait for DHCP
+    # Wait for DHCP, waking as soon as Windows reports an address change.
+    # Waits are capped at a second so a change that lands between the
+    # lookup and the next registration is still picked up promptly.
     print(f"  Waiting for DHCP on {interface_name}...")
-    deadline = time.time() + max_wait
-    while time.time() < deadline:
-        time.sleep(1.0)
+    deadline = time.monotonic() + max_wait
+    notify = True
+    while time.monotonic() < deadline:
+        step = min(1.0, max(0.0, deadline - time.monotonic()))
+        if notify:
+            try:
+                _wait_for_addr_change(step)
+            except (OSError, AttributeError):
+                notify = False
+                time.sleep(step)
+        else:
+            time.sleep(step)
         ip = get_interface_ip(interface_name)
         if ip:
             print(f"  DHCP assigned {ip} to {interface_name}")
@@ -101,6 +406,7 @@ def ensure_interface_ip(interface_name: str, static_ip: str,
             ],
             capture_output=True, text=True, timeout=15,
         )
+        invalidate_interface_ip(interface_name)
         time.sleep(2.0)
         ip = get_interface_ip(interface_name)
         if ip:
@@ -113,36 +419,103 @@ def ensure_interface_ip(interface_name: str, static_ip: str,
 
 
 class _BoundHTTPConnection(http.client.HTTPConnection):
-    """HTTPConnection that binds to a specific local source address."""
+    """HTTPConnection that binds to a specific local source address.
 
-    def __init__(self, host, source_address=None, **kwargs):
+    With an if_index the socket is also pinned to that interface, so it
+    reaches the right camera even when several adapters route 10.5.5.9.
+    """
+
+    def __init__(self, host, source_address=None, if_index=None, **kwargs):
         self._bind_address = source_address
+        self._if_index = if_index
         super().__init__(host, **kwargs)
 
     def connect(self):
-        self.sock = socket.create_connection(
-            (self.host, self.port),
-            self.timeout,
-            self._bind_address,
-        )
+        if self._if_index is None:
+            self.sock = socket.create_connection(
+                (self.host, self.port),
+                self.timeout,
+                self._bind_address,
+            )
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            try:
+                _pin_to_interface(sock, self._if_index)
+                sock.settimeout(self.timeout)
+                if self._bind_address:
+                    sock.bind(self._bind_address)
+                sock.connect((self.host, self.port))
+            except Exception:
+                sock.close()
+                raise
+            self.sock = sock
+        # Requests are tiny; send them now rather than waiting on Nagle
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
 
 class _BoundHTTPHandler(urllib.request.HTTPHandler):
-    """urllib HTTP handler that routes connections through a specific interface."""
+    """urllib HTTP handler that routes connections through a specific interface.
+
+    Requests without a timeout, or with a longer one, are capped at
+    HTTP_TIMEOUT. A source_address and if_index of None use default routing.
+    """
 
-    def __init__(self, source_address):
+    def __init__(self, source_address, if_index=None):
         super().__init__()
         self._source_address = source_address
+        self._if_index = if_index
 
     def http_open(self, req):
+        # No timeout is a sentinel object rather than a number
+        if not isinstance(req.timeout, (int, float)) or req.timeout > HTTP_TIMEOUT:
+            req.timeout = HTTP_TIMEOUT
         return self.do_open(
             lambda host, **kw: _BoundHTTPConnection(
-                host, source_address=self._source_address, **kw
+                host, source_address=self._source_address,
+                if_index=self._if_index, **kw
             ),
             req,
         )
 
 
+# --- Per-thread request routing ---
+# goprocam issues every request through urllib.request.urlopen. Instead of
+# installing each camera's opener process-wide (which forces all cameras to
+# take turns), urlopen inside goprocam is pointed at the camera the calling
+# thread selected with GoProCam._route_requests.
+
+_route = threading.local()
+
+
+def _routed_urlopen(url, *args, **kwargs):
+    camera = getattr(_route, "camera", None)
+    if camera is None:
+        return urllib.request.urlopen(url, *args, **kwargs)
+    return camera._urlopen(url, *args, **kwargs)
+
+
+class _RoutedRequestModule:
+    """urllib.request with urlopen replaced by _routed_urlopen."""
+
+    urlopen = staticmethod(_routed_urlopen)
+
+    def __getattr__(self, name):
+        return getattr(urllib.request, name)
+
+
+class _RoutedUrllib:
+    """Stand-in for the urllib package as seen from goprocam."""
+
+    request = _RoutedRequestModule()
+
+    def __getattr__(self, name):
+        return getattr(urllib, name)
+
+
+GoProCamera.urllib = _RoutedUrllib()
+GoProCamera.urlopen = _routed_urlopen  # in case of `from urllib.request import urlopen`
+
+
 @dataclass
 class GoProConfig:
     id: str
@@ -156,16 +529,14 @@ class GoProConfig:
 class GoProCam:
     """Wrapper for a single GoPro camera with interface-bound networking.
 
-    Uses a class-level lock and per-instance urllib openers to ensure HTTP
-    requests reach the correct GoPro when multiple cameras share the same IP.
+    Uses a per-instance urllib opener, selected per calling thread, to ensure
+    HTTP requests reach the correct GoPro when multiple cameras share the
+    same IP. Different cameras can make requests at the same time.
     """
 
-    # Class-level lock serializes all goprocam HTTP calls so that the correct
-    # urllib opener is active for each request.
-    _api_lock = threading.Lock()
-
-    # Track assigned static IPs to avoid conflicts
-    _used_static_ips: list[str] = []
+    # Track assigned static IPs to avoid conflicts (cameras connect in parallel)
+    _used_static_ips: set[str] = set()
+    _static_ip_lock = threading.Lock()
 
     def __init__(self, config: GoProConfig):
         self.config = config
@@ -173,24 +544,121 @@ class GoProCam:
         self._connected = False
         self._opener: Optional[urllib.request.OpenerDirector] = None
         self._source_ip: Optional[str] = None
+        # Interface index the camera's sockets are pinned to (Windows only)
+        self._if_index: Optional[int] = None
+        self._keepalive_sock: Optional[socket.socket] = None
+        # Persistent HTTP connection to the camera, reused across requests
+        self._http: Optional[_BoundHTTPConnection] = None
+        # One request at a time per camera
+        self._api_lock = threading.Lock()
+        # Last shutter state the camera acknowledged; None when unknown
+        # (never commanded, or the last command failed)
+        self._recording: Optional[bool] = None
 
     @property
     def is_connected(self) -> bool:
         """Whether the camera is currently connected."""
         return self._connected
 
-    def _install_opener(self):
-        """Install this camera's bound urllib opener. Must hold _api_lock."""
-        if self._opener is not None:
-            urllib.request.install_opener(self._opener)
+    @contextmanager
+    def _route_requests(self):
+        """Send goprocam requests made in this block through this camera (_urlopen)."""
+        with self._api_lock:
+            _route.camera = self
+            try:
+                yield
+            finally:
+                _route.camera = None
+
+    def _urlopen(self, url, data=None, timeout=HTTP_TIMEOUT):
+        """urlopen for this camera: plain GETs reuse one kept-alive connection.
+
+        Anything else (POSTs, other hosts) goes through the bound opener.
+        Must hold _api_lock.
+        """
+        parts = urllib.parse.urlsplit(url if isinstance(url, str) else url.full_url)
+        if data is not None or parts.scheme != "http" or parts.hostname != self.config.ip_address:
+            opener = self._opener or urllib.request.build_opener()
+            return opener.open(url, data, timeout)
+        if not isinstance(timeout, (int, float)) or timeout > HTTP_TIMEOUT:
+            timeout = HTTP_TIMEOUT
+        path = f"{parts.path or '/'}?{parts.query}" if parts.query else (parts.path or "/")
+
+        for attempt in range(2):
+            conn = self._http_connection(parts.netloc, timeout)
+            try:
+                conn.request("GET", path)
+                resp = conn.getresponse()
+                body = resp.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # The camera closed the idle connection; reconnect once
+                self._close_http()
+                if attempt:
+                    raise
+            except Exception:
+                self._close_http()
+                raise
+
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers,
+                                         io.BytesIO(body))
+        return urllib.response.addinfourl(io.BytesIO(body), resp.headers, url, resp.status)
+
+    def _http_connection(self, netloc: Optional[str], timeout: float) -> "_BoundHTTPConnection":
+        """The persistent connection to the camera, opened lazily. Must hold _api_lock.
+
+        The connection belongs to one host:port; asking for another netloc
+        (e.g. the media server on :8080) closes it and connects there.
+        A netloc of None takes whatever connection is open, or the camera's
+        default port.
+        """
+        if self._http is not None and netloc is not None:
+            target = urllib.parse.urlsplit(f"//{netloc}")
+            if (target.hostname, target.port or http.client.HTTP_PORT) != (self._http.host, self._http.port):
+                self._close_http()
+        if self._http is None:
+            source = (self._source_ip, 0) if self._source_ip else None
+            self._http = _BoundHTTPConnection(netloc or self.config.ip_address, source_address=source,
+                                              if_index=self._if_index, timeout=timeout)
+        conn = self._http
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn
+
+    def _send_get(self, path: str) -> bool:
+        """Send a GET without waiting for the reply (see _read_reply). Must hold _api_lock."""
+        try:
+            self._http_connection(None, HTTP_TIMEOUT).request("GET", path)
+            return True
+        except Exception:
+            self._close_http()
+            return False
+
+    def _read_reply(self) -> bool:
+        """Read the reply to _send_get; True if the camera accepted it. Must hold _api_lock."""
+        try:
+            resp = self._http.getresponse()
+            resp.read()
+            return resp.status < 400
+        except Exception:
+            self._close_http()
+            return False
+
+    def _close_http(self):
+        if self._http is not None:
+            self._http.close()
+            self._http = None
 
     def _next_static_ip(self) -> str:
         """Pick the next available static IP in 10.5.5.0/24."""
-        for last_octet in range(100, 200):
-            candidate = f"10.5.5.{last_octet}"
-            if candidate not in GoProCam._used_static_ips:
-                GoProCam._used_static_ips.append(candidate)
-                return candidate
+        with GoProCam._static_ip_lock:
+            for last_octet in range(100, 200):
+                candidate = f"10.5.5.{last_octet}"
+                if candidate not in GoProCam._used_static_ips:
+                    GoProCam._used_static_ips.add(candidate)
+                    return candidate
         return "10.5.5.199"
 
     def connect(self) -> bool:
@@ -204,18 +672,19 @@ class GoProCam:
             self.config.wifi_interface, static_fallback, max_wait=10.0,
         )
 
+        self._if_index = get_interface_index(self.config.wifi_interface)
         if source_ip:
             print(f"  Interface {self.config.wifi_interface} -> local IP {source_ip}")
             self._source_ip = source_ip
-            handler = _BoundHTTPHandler((source_ip, 0))
-            self._opener = urllib.request.build_opener(handler)
+            handler = _BoundHTTPHandler((source_ip, 0), self._if_index)
         else:
             print(f"  WARNING: Could not get IP for {self.config.wifi_interface}, "
                   f"using default routing")
+            handler = _BoundHTTPHandler(None, self._if_index)
+        self._opener = urllib.request.build_opener(handler)
 
         try:
-            with GoProCam._api_lock:
-                self._install_opener()
+            with self._route_requests():
                 self._camera = GoProCamera.GoPro(
                     ip_address=self.config.ip_address,
                     camera=constants.gpcontrol,
@@ -236,8 +705,7 @@ class GoProCam:
         if not self._connected or self._camera is None:
             return
         try:
-            with GoProCam._api_lock:
-                self._install_opener()
+            with self._route_requests():
                 self._camera.mode(constants.Mode.VideoMode, constants.Mode.SubMode.Video.Video)
             print(f"GoPro {self.config.name}: Set to video mode")
         except Exception as e:
@@ -248,11 +716,12 @@ class GoProCam:
         if not self._connected or self._camera is None:
             return
         try:
-            with GoProCam._api_lock:
-                self._install_opener()
+            with self._route_requests():
                 self._camera.shutter(constants.start)
+            self._recording = True
             print(f"GoPro {self.config.name}: Recording started")
         except Exception as e:
+            self._recording = None
             print(f"ERROR: Failed to start recording on {self.config.name}: {e}")
 
     def stop_recording(self):
@@ -260,11 +729,12 @@ class GoProCam:
         if not self._connected or self._camera is None:
             return
         try:
-            with GoProCam._api_lock:
-                self._install_opener()
+            with self._route_requests():
                 self._camera.shutter(constants.stop)
+            self._recording = False
             print(f"GoPro {self.config.name}: Recording stopped")
         except Exception as e:
+            self._recording = None
             print(f"ERROR: Failed to stop recording on {self.config.name}: {e}")
 
     def is_recording(self) -> bool:
@@ -272,8 +742,7 @@ class GoProCam:
         if not self._connected or self._camera is None:
             return False
         try:
-            with GoProCam._api_lock:
-                self._install_opener()
+            with self._route_requests():
                 return self._camera.IsRecording() == 1
         except Exception:
             return False
@@ -283,46 +752,76 @@ class GoProCam:
         if not self._connected or self._camera is None:
             return None
         try:
-            with GoProCam._api_lock:
-                self._install_opener()
+            with self._route_requests():
                 return self._camera.getStatus(
                     constants.Status.Status, constants.Status.STATUS.BattPercent
                 )
         except Exception:
             return None
 
+    def get_status_snapshot(self) -> dict:
+        """Recording state and battery from a single status request.
+
+        Equivalent to is_recording() and get_battery() but with one round
+        trip instead of two.
+        """
+        snapshot = {"recording": False, "battery": None}
+        if not self._connected or self._camera is None:
+            return snapshot
+        try:
+            with self._route_requests():
+                body = self._urlopen(f"http://{self.config.ip_address}{STATUS_PATH}").read()
+            status = json.loads(body)["status"]
+            snapshot["recording"] = status.get(STATUS_RECORDING) == 1
+            snapshot["battery"] = status.get(STATUS_BATTERY_PERCENT)
+        except Exception:
+            pass
+        return snapshot
+
     def keep_alive(self):
         """Send keep-alive signal via a source-bound UDP socket.
 
         The goprocam library's KeepAlive() uses an unbound socket, which would
         route to whichever GoPro the OS picks. We send our own bound UDP packet
-        to ensure it reaches the correct camera.
+        to ensure it reaches the correct camera. The socket is kept for the
+        whole connection, so each keep-alive is a single sendto.
         """
         if not self._connected:
             return
         try:
-            payload = "_GPHD_:0:0:2:0.000000\n".encode()
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            try:
+            sock = self._keepalive_sock
+            if sock is None:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                _pin_to_interface(sock, self._if_index)
                 if self._source_ip:
                     sock.bind((self._source_ip, 0))
-                sock.sendto(payload, (self.config.ip_address, 8554))
-            finally:
-                sock.close()
+                self._keepalive_sock = sock
+            sock.sendto(KEEPALIVE_PAYLOAD, (self.config.ip_address, 8554))
         except Exception:
-            pass
+            # Rebuild the socket next time (e.g. the interface went away)
+            self._close_keepalive_socket()
+
+    def _close_keepalive_socket(self):
+        if self._keepalive_sock is not None:
+            self._keepalive_sock.close()
+            self._keepalive_sock = None
 
     def disconnect(self):
         """Stop any recording and disconnect from the camera."""
         if self._camera is not None:
-            # Always attempt to stop recording — don't rely on is_recording()
-            # which can fail silently over flaky WiFi
-            try:
-                self.stop_recording()
-            except Exception:
-                pass
+            # Stop unless the camera acknowledged a stop already. Don't ask
+            # is_recording(), which can fail silently over flaky WiFi
+            if self._recording is not False:
+                try:
+                    self.stop_recording()
+                except Exception:
+                    pass
             self._connected = False
             self._camera = None
+            self._recording = None
+            self._close_keepalive_socket()
+            with self._api_lock:
+                self._close_http()
             print(f"GoPro {self.config.name}: Disconnected")
 
 
@@ -336,7 +835,8 @@ class GoProManager:
 
     def __init__(self, gopro_configs: list[dict]):
         # Reset static IP tracker for fresh connections
-        GoProCam._used_static_ips.clear()
+        with GoProCam._static_ip_lock:
+            GoProCam._used_static_ips.clear()
         self.cameras: dict[str, GoProCam] = {}
         for cfg in gopro_configs:
             if cfg.get("enabled", True):
@@ -349,27 +849,29 @@ class GoProManager:
                     enabled=cfg.get("enabled", True),
                 )
                 self.cameras[config.id] = GoProCam(config)
+        # One worker per camera, created on first use and kept until
+        # disconnect_all so start/stop don't spawn fresh threads each time
+        self._pool: Optional[ThreadPoolExecutor] = None
 
     def connect_all(self) -> bool:
-        """Connect to all GoPro cameras sequentially.
+        """Connect to all GoPro cameras in parallel.
 
-        Sequential connection is required because each camera installs its own
-        urllib opener bound to its WiFi interface's local IP address.
+        Each camera routes its requests through its own interface-bound
+        opener, so the DHCP waits and handshakes overlap.
         """
         if not self.cameras:
             print("No GoPro cameras configured")
             return True
 
         print(f"\nConnecting to {len(self.cameras)} GoPro cameras...")
-        results = {}
-
-        for cam_id, cam in self.cameras.items():
-            results[cam_id] = cam.connect()
+        # One OS query for every adapter instead of one per camera
+        get_all_interface_ips([cam.config.wifi_interface for cam in self.cameras.values()])
+        pool = self._executor()
+        results = dict(zip(self.cameras, pool.map(GoProCam.connect, self.cameras.values())))
 
         # Set all cameras to video mode after connecting
-        for cam_id, cam in self.cameras.items():
-            if results.get(cam_id, False):
-                cam.set_video_mode()
+        connected_cams = [cam for cam_id, cam in self.cameras.items() if results[cam_id]]
+        list(pool.map(GoProCam.set_video_mode, connected_cams))
 
         connected = sum(1 for v in results.values() if v)
         total = len(self.cameras)
@@ -377,63 +879,96 @@ class GoProManager:
 
         return connected == total
 
-    def start_recording_all(self):
-        """Trigger all GoPro cameras to start recording.
+    def _executor(self) -> ThreadPoolExecutor:
+        """The manager's worker pool, one thread per camera."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=max(1, len(self.cameras)), thread_name_prefix="gopro",
+            )
+        return self._pool
 
-        Uses threading so both cameras start nearly simultaneously.
-        The API lock inside each camera serializes the actual HTTP calls.
+    def _run_parallel(self, action: Callable[["GoProCam"], None], timeout: float):
+        """Run action(cam) for every camera concurrently and wait for all."""
+        if not self.cameras:
+            return
+        pool = self._executor()
+        futures = [pool.submit(action, cam) for cam in self.cameras.values()]
+        wait(futures, timeout=timeout)
+
+    def _shutter_all(self, start: bool):
+        """Send the shutter command to all connected cameras at (nearly) the same instant.
+
+        The requests go out back to back over each camera's open connection
+        before any reply is read, so cameras trigger within microseconds of
+        each other rather than one HTTP round trip apart. Cameras whose
+        request or reply fails, or that have no open connection yet, go
+        through goprocam in parallel instead.
         """
-        print("\nTriggering all GoPro cameras to start recording...")
-        threads = []
-        for cam in self.cameras.values():
-            t = threading.Thread(target=cam.start_recording)
-            threads.append(t)
-            t.start()
-
-        for t in threads:
-            t.join(timeout=10.0)
+        connected = [cam for cam in self.cameras.values() if cam.is_connected]
+        cams = [cam for cam in connected if cam._http is not None]
+        retry = [cam for cam in connected if cam._http is None]
+        path = SHUTTER_PATH.format(1 if start else 0)
+        # Fixed acquisition order; everything else holds at most one camera lock
+        for cam in cams:
+            cam._api_lock.acquire()
+        try:
+            sent = []
+            for cam in cams:
+                (sent if cam._send_get(path) else retry).append(cam)
+            for cam in sent:
+                if cam._read_reply():
+                    cam._recording = start
+                    print(f"GoPro {cam.config.name}: Recording {'started' if start else 'stopped'}")
+                else:
+                    retry.append(cam)
+        finally:
+            for cam in cams:
+                cam._api_lock.release()
+        if retry:
+            pool = self._executor()
+            wait([pool.submit(cam.start_recording if start else cam.stop_recording)
+                  for cam in retry], timeout=10.0)
 
+    def start_recording_all(self):
+        """Trigger all GoPro cameras to start recording simultaneously."""
+        print("\nTriggering all GoPro cameras to start recording...")
+        self._shutter_all(start=True)
         print("All GoPro cameras triggered to record")
 
     def stop_recording_all(self):
         """Stop recording on all GoPro cameras."""
         print("\nStopping all GoPro cameras...")
-        threads = []
-        for cam in self.cameras.values():
-            t = threading.Thread(target=cam.stop_recording)
-            threads.append(t)
-            t.start()
-
-        for t in threads:
-            t.join(timeout=10.0)
-
+        self._shutter_all(start=False)
         print("All GoPro cameras stopped")
 
     def keep_alive_all(self):
-        """Send keep-alive to all cameras."""
-        threads = []
+        """Send keep-alive to all cameras.
+
+        Each keep-alive is one UDP sendto on a bound socket, which doesn't
+        block, so they are sent in turn rather than on a thread per camera.
+        """
         for cam in self.cameras.values():
-            t = threading.Thread(target=cam.keep_alive)
-            threads.append(t)
-            t.start()
-        for t in threads:
-            t.join(timeout=5.0)
+            cam.keep_alive()
 
     def disconnect_all(self):
-        """Disconnect from all GoPro cameras."""
-        for cam in self.cameras.values():
-            cam.disconnect()
+        """Disconnect from all GoPro cameras in parallel."""
+        self._run_parallel(GoProCam.disconnect, timeout=10.0)
+        if self._pool is not None:
+            # Don't block on a camera that is still stuck past the timeout
+            self._pool.shutdown(wait=False)
+            self._pool = None
         print("All GoPro cameras disconnected")
 
     def get_status_all(self) -> dict:
-        """Get status of all cameras."""
-        status = {}
-        for cam_id, cam in self.cameras.items():
-            status[cam_id] = {
+        """Get status of all cameras, querying them in parallel."""
+        def status(cam):
+            return {
                 "name": cam.config.name,
                 "model": cam.config.model,
                 "connected": cam.is_connected,
-                "recording": cam.is_recording(),
-                "battery": cam.get_battery(),
+                **cam.get_status_snapshot(),
             }
-        return status
+
+        if not self.cameras:
+            return {}
+        return dict(zip(self.cameras, self._executor().map(status, self.cameras.values())))
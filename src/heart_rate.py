@@ -29,6 +29,20 @@ ECG_STOP = bytearray([0x03, 0x00])
 # Polar epoch offset (2000-01-01 in Unix time, in nanoseconds)
 POLAR_EPOCH_OFFSET_NS = 946_684_800 * 1_000_000_000
 
+# Write buffer for the session CSV files (a long ECG session is ~100k rows)
+CSV_BUFFER_SIZE = 1024 * 1024
+
+HR_CSV_HEADER = ["timestamp", "bpm", "rr_intervals_ms", "sensor_contact", "phase"]
+ECG_CSV_HEADER = ["timestamp", "phase", "ecg_values_uv"]
+
+
+def _hr_row(s: "HeartRateSample") -> tuple:
+    return (s.timestamp, s.bpm, ";".join(map(str, s.rr_intervals_ms or ())), s.sensor_contact, s.phase)
+
+
+def _ecg_row(s: "ECGSample") -> tuple:
+    return (s.timestamp, s.phase, ";".join(map(str, s.values_uv)))
+
 
 @dataclass
 class HeartRateSample:
@@ -51,6 +65,9 @@ class PolarH10:
 
     Records HR + RR intervals (and optionally ECG) continuously across
     experiment phases. Data is labeled by phase for later analysis.
+
+    Samples are kept in memory and saved with save_to_csv/save_ecg_to_csv,
+    or, after attach_writers, appended to the CSV files as they arrive.
     """
 
     def __init__(self, device_address: Optional[str] = None, ecg_enabled: bool = False):
@@ -69,6 +86,12 @@ class PolarH10:
         self._connected = threading.Event()
         self._stop_event = threading.Event()
         self._connection_ok = False  # True only after stable connection confirmed
+        # Streaming CSV writers (see attach_writers); None until attached
+        self._hr_file = None
+        self._hr_writer = None
+        self._ecg_file = None
+        self._ecg_writer = None
+        self._ecg_written = 0
 
     @staticmethod
     def _parse_hr_measurement(data: bytearray) -> dict:
@@ -140,7 +163,10 @@ class PolarH10:
             phase=self._current_phase,
         )
         with self._samples_lock:
+            # HR stays in memory too (~1 sample/s) for get_summary
             self._hr_samples.append(sample)
+            if self._hr_writer is not None:
+                self._hr_writer.writerow(_hr_row(sample))
 
     def _ecg_callback(self, sender, data: bytearray):
         """Callback for PMD ECG data notifications."""
@@ -154,7 +180,11 @@ class PolarH10:
                 phase=self._current_phase,
             )
             with self._samples_lock:
-                self._ecg_samples.append(sample)
+                if self._ecg_writer is not None:
+                    self._ecg_writer.writerow(_ecg_row(sample))
+                    self._ecg_written += 1
+                else:
+                    self._ecg_samples.append(sample)
 
     async def _find_device(self):
         """Scan for Polar H10."""
@@ -336,6 +366,11 @@ class PolarH10:
     def set_phase(self, phase: str):
         """Update the current phase label for subsequent samples."""
         self._current_phase = phase
+        # Phase changes double as checkpoints for the streamed CSVs
+        with self._samples_lock:
+            for f in (self._hr_file, self._ecg_file):
+                if f is not None:
+                    f.flush()
         print(f"Polar H10 phase updated to: {phase}")
 
     def stop_recording(self):
@@ -362,17 +397,49 @@ class PolarH10:
                 return [s for s in self._hr_samples if s.phase == phase]
             return list(self._hr_samples)
 
+    def attach_writers(self, hr_path: Path, ecg_path: Optional[Path] = None):
+        """Append samples to CSV files as they arrive instead of at the end.
+
+        ECG packets are written straight to ecg_path and no longer kept in
+        memory. Call close_writers when recording is over.
+        """
+        hr_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._samples_lock:
+            self._hr_file = open(hr_path, "w", newline="", buffering=CSV_BUFFER_SIZE)
+            self._hr_writer = csv.writer(self._hr_file)
+            self._hr_writer.writerow(HR_CSV_HEADER)
+            self._hr_writer.writerows(_hr_row(s) for s in self._hr_samples)
+            if ecg_path is not None:
+                self._ecg_file = open(ecg_path, "w", newline="", buffering=CSV_BUFFER_SIZE)
+                self._ecg_writer = csv.writer(self._ecg_file)
+                self._ecg_writer.writerow(ECG_CSV_HEADER)
+                self._ecg_writer.writerows(_ecg_row(s) for s in self._ecg_samples)
+                self._ecg_written = len(self._ecg_samples)
+                self._ecg_samples.clear()
+
+    def close_writers(self):
+        """Flush and close the files opened by attach_writers."""
+        with self._samples_lock:
+            hr_file, ecg_file = self._hr_file, self._ecg_file
+            self._hr_file = self._hr_writer = None
+            self._ecg_file = self._ecg_writer = None
+            hr_count = len(self._hr_samples)
+        if hr_file is not None:
+            hr_file.close()
+            print(f"Heart rate data saved to {hr_file.name} ({hr_count} samples)")
+        if ecg_file is not None:
+            ecg_file.close()
+            print(f"ECG data saved to {ecg_file.name} ({self._ecg_written} packets)")
+
     def save_to_csv(self, filepath: Path):
         """Save HR data (BPM + RR intervals) to CSV."""
         filepath.parent.mkdir(parents=True, exist_ok=True)
         with self._samples_lock:
             samples = list(self._hr_samples)
-        with open(filepath, "w", newline="") as f:
+        with open(filepath, "w", newline="", buffering=CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
-            writer.writerow(["timestamp", "bpm", "rr_intervals_ms", "sensor_contact", "phase"])
-            for s in samples:
-                rr_str = ";".join(str(r) for r in s.rr_intervals_ms) if s.rr_intervals_ms else ""
-                writer.writerow([s.timestamp, s.bpm, rr_str, s.sensor_contact, s.phase])
+            writer.writerow(HR_CSV_HEADER)
+            writer.writerows(_hr_row(s) for s in samples)
         print(f"Heart rate data saved to {filepath} ({len(samples)} samples)")
 
     def save_ecg_to_csv(self, filepath: Path):
@@ -382,12 +449,10 @@ class PolarH10:
         if not samples:
             return
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, "w", newline="") as f:
+        with open(filepath, "w", newline="", buffering=CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
-            writer.writerow(["timestamp", "phase", "ecg_values_uv"])
-            for s in samples:
-                values_str = ";".join(str(v) for v in s.values_uv)
-                writer.writerow([s.timestamp, s.phase, values_str])
+            writer.writerow(ECG_CSV_HEADER)
+            writer.writerows(_ecg_row(s) for s in samples)
         total_samples = sum(len(s.values_uv) for s in samples)
         print(f"ECG data saved to {filepath} ({total_samples} samples across {len(samples)} packets)")
 
@@ -7,11 +7,44 @@ BOARD_INNER_COLS = 10  # inner corners horizontally
 BOARD_INNER_ROWS = 7   # inner corners vertically
 SQUARE_SIZE_MM = 25.0  # side length of each square in mm
 
+# Object points grid: (0,0,0), (25,0,0), (50,0,0), ... — shared, read-only
+BOARD_OBJECT_POINTS = np.zeros((BOARD_INNER_COLS * BOARD_INNER_ROWS, 3), np.float32)
+BOARD_OBJECT_POINTS[:, :2] = np.mgrid[0:BOARD_INNER_COLS, 0:BOARD_INNER_ROWS].T.reshape(-1, 2)
+BOARD_OBJECT_POINTS *= SQUARE_SIZE_MM
+BOARD_OBJECT_POINTS.setflags(write=False)
+
 # How many frames to sample for calibration from each end of the video
 CALIBRATION_SAMPLE_FRAMES = 60
 # Fraction of video at each end to search for checkerboard (e.g. 0.15 = first/last 15%)
 CALIBRATION_END_FRACTION = 0.15
 
+# Frames at least this wide are searched for the board at half resolution;
+# the corners are then refined on the full-resolution image
+DETECT_DOWNSCALE_MIN_WIDTH = 1920
+SUBPIX_CRITERIA = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 30, 0.001)
+
+
+def detect_checkerboard(gray):
+    """Find and sub-pixel refine the checkerboard corners in a grayscale frame.
+
+    Returns the refined corners, or None if the board was not found.
+    """
+    board_size = (BOARD_INNER_COLS, BOARD_INNER_ROWS)
+    flags = (cv2.CALIB_CB_ADAPTIVE_THRESH + cv2.CALIB_CB_NORMALIZE_IMAGE
+             + cv2.CALIB_CB_FAST_CHECK)
+    if gray.shape[1] < DETECT_DOWNSCALE_MIN_WIDTH:
+        found, corners = cv2.findChessboardCorners(gray, board_size, flags)
+        if not found:
+            return None
+        return cv2.cornerSubPix(gray, corners, (11, 11), (-1, -1), SUBPIX_CRITERIA)
+
+    small = cv2.resize(gray, (0, 0), fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+    found, corners = cv2.findChessboardCorners(small, board_size, flags)
+    if not found:
+        return None
+    corners = corners.astype(np.float32) * 2.0
+    return cv2.cornerSubPix(gray, corners, (7, 7), (-1, -1), SUBPIX_CRITERIA)
+
 
 def calibrate_from_video(input_file):
     """First pass: detect checkerboard corners and calibrate the camera."""
@@ -20,17 +53,9 @@ def calibrate_from_video(input_file):
     w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
     h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
 
-    board_size = (BOARD_INNER_COLS, BOARD_INNER_ROWS)
-
-    # Prepare the object points grid: (0,0,0), (25,0,0), (50,0,0), ...
-    objp = np.zeros((BOARD_INNER_COLS * BOARD_INNER_ROWS, 3), np.float32)
-    objp[:, :2] = np.mgrid[0:BOARD_INNER_COLS, 0:BOARD_INNER_ROWS].T.reshape(-1, 2)
-    objp *= SQUARE_SIZE_MM
-
     obj_points = []  # 3D points in real-world space
     img_points = []  # 2D points in image plane
 
-    criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 30, 0.001)
     min_detections = 10
 
     def build_end_samples(total, fraction, num_samples):
@@ -52,10 +77,14 @@ def calibrate_from_video(input_file):
         return set(range(0, total, interval))
 
     def detect_in_frames(cap, sample_frames, label):
-        """Seek through video and detect checkerboard in the given frame set."""
+        """Seek through video and detect checkerboard in the given frame set.
+
+        A sampled frame identical to the previous one reuses its result.
+        """
         cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
         local_obj = []
         local_img = []
+        prev_gray, prev_corners = None, None
         frame_idx = 0
         max_frame = max(sample_frames)
         while frame_idx <= max_frame:
@@ -64,13 +93,13 @@ def calibrate_from_video(input_file):
                 break
             if frame_idx in sample_frames:
                 gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                found, corners = cv2.findChessboardCorners(
-                    gray, board_size,
-                    cv2.CALIB_CB_ADAPTIVE_THRESH + cv2.CALIB_CB_NORMALIZE_IMAGE + cv2.CALIB_CB_FAST_CHECK
-                )
-                if found:
-                    corners_refined = cv2.cornerSubPix(gray, corners, (11, 11), (-1, -1), criteria)
-                    local_obj.append(objp)
+                if prev_gray is not None and np.array_equal(gray, prev_gray):
+                    corners_refined = prev_corners
+                else:
+                    corners_refined = detect_checkerboard(gray)
+                prev_gray, prev_corners = gray, corners_refined
+                if corners_refined is not None:
+                    local_obj.append(BOARD_OBJECT_POINTS)
                     local_img.append(corners_refined)
                     print(f"  [{label}] Frame {frame_idx}: checkerboard detected ({len(local_obj)} total)")
             frame_idx += 1
@@ -412,7 +441,8 @@ def process_videos(input_files):
 
 
 # Usage
-process_videos([
-    '/Users/camhickling/Desktop/FrontCamera.mov',
-    '/Users/camhickling/Desktop/BackCamera.mov',
-])
+if __name__ == "__main__":
+    process_videos([
+        '/Users/camhickling/Desktop/FrontCamera.mov',
+        '/Users/camhickling/Desktop/BackCamera.mov',
+    ])
@@ -1,9 +1,25 @@
 """Utility functions."""
 
+import os
+import shutil
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+import cv2
+
+COPY_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Holders of single_opencv_thread() and the thread count to restore when
+# the last one leaves
+_cv_threads_lock = threading.Lock()
+_cv_threads_users = 0
+_cv_threads_saved = 0
+
 
 def timestamp_string() -> str:
     """Return current timestamp as string for filenames."""
@@ -16,6 +32,111 @@ def ensure_dir(path: Path) -> Path:
     return path
 
 
+@contextmanager
+def single_opencv_thread():
+    """Run the block with OpenCV's internal thread pool limited to one thread.
+
+    For code that already parallelizes across its own threads. The setting
+    is process-wide, so overlapping holders share it: the original count is
+    restored only when the last one exits.
+    """
+    global _cv_threads_users, _cv_threads_saved
+    with _cv_threads_lock:
+        if _cv_threads_users == 0:
+            _cv_threads_saved = cv2.getNumThreads()
+            cv2.setNumThreads(1)
+        _cv_threads_users += 1
+    try:
+        yield
+    finally:
+        with _cv_threads_lock:
+            _cv_threads_users -= 1
+            if _cv_threads_users == 0:
+                cv2.setNumThreads(_cv_threads_saved)
+
+
+def copy_file(src: Path, dst: Path):
+    """Copy one file in large chunks, keeping metadata.
+
+    Uses copy_file_range on Linux (a reflink clone on btrfs/xfs), falling
+    back to sendfile, and a large-buffer copy everywhere else.
+    """
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+        if not _copy_kernel(fsrc.fileno(), fdst.fileno()):
+            shutil.copyfileobj(fsrc, fdst, COPY_CHUNK_SIZE)
+    shutil.copystat(src, dst)
+
+
+def _copy_kernel(src_fd: int, dst_fd: int) -> bool:
+    """Copy src_fd to dst_fd inside the kernel; False if no such path is usable."""
+    if not sys.platform.startswith("linux"):
+        # macOS/BSD sendfile needs a socket destination
+        return False
+    if hasattr(os, "copy_file_range"):
+        copied = 0
+        try:
+            while True:
+                n = os.copy_file_range(src_fd, dst_fd, COPY_CHUNK_SIZE)
+                if n == 0:
+                    return True
+                copied += n
+        except OSError:
+            if copied:
+                raise
+            # e.g. cross-device on older kernels; nothing written yet
+    if hasattr(os, "sendfile"):
+        offset = 0
+        try:
+            while True:
+                sent = os.sendfile(dst_fd, src_fd, offset, COPY_CHUNK_SIZE)
+                if sent == 0:
+                    return True
+                offset += sent
+        except OSError:
+            if offset:
+                raise
+    return False
+
+
+def _is_unchanged(src: Path, dst: Path) -> bool:
+    """True if dst exists with the same size and mtime as src.
+
+    mtimes are compared with a 2 s tolerance to allow for FAT/exFAT
+    timestamp resolution on removable drives.
+    """
+    try:
+        dst_stat = dst.stat()
+    except FileNotFoundError:
+        return False
+    src_stat = src.stat()
+    return (src_stat.st_size == dst_stat.st_size
+            and abs(src_stat.st_mtime - dst_stat.st_mtime) < 2.0)
+
+
+def copy_tree_parallel(src: Path, dst: Path, max_workers: int = 8) -> int:
+    """Incrementally copy a directory tree, files in parallel. Returns files copied.
+
+    Directories are created up front by a single walk; files whose size and
+    mtime already match at the destination are skipped, and the rest are
+    handed to a thread pool, since many small files are latency- rather
+    than bandwidth-bound. Extra files at the destination are left alone.
+    """
+    src, dst = Path(src), Path(dst)
+    files = []
+    for root, _dirs, names in os.walk(src):
+        target_dir = dst / Path(root).relative_to(src)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        for name in names:
+            src_file, dst_file = Path(root) / name, target_dir / name
+            if not _is_unchanged(src_file, dst_file):
+                files.append((src_file, dst_file))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for future in [pool.submit(copy_file, s, d) for s, d in files]:
+            future.result()
+    return len(files)
+
+
 class Timer:
     """Simple timer for tracking elapsed time."""
 
@@ -1,5 +1,6 @@
 """Video playback engine for reviewing recorded footage in the GUI."""
 
+import queue
 import threading
 import time
 from enum import Enum, auto
@@ -9,6 +10,16 @@ import cv2
 import numpy as np
 
 
+def _preview_maps(src_size: tuple[int, int], dst_size: tuple[int, int]):
+    """Build fixed-point remap tables that sample src at dst pixel centres."""
+    sw, sh = src_size
+    dw, dh = dst_size
+    xs = (np.arange(dw, dtype=np.float32) + 0.5) * (sw / dw) - 0.5
+    ys = (np.arange(dh, dtype=np.float32) + 0.5) * (sh / dh) - 0.5
+    map_x, map_y = np.meshgrid(xs, ys)
+    return cv2.convertMaps(map_x, map_y, cv2.CV_16SC2)
+
+
 class PlayerState(Enum):
     STOPPED = auto()
     PLAYING = auto()
@@ -22,10 +33,23 @@ class VideoPlayer:
         on_frame(frame: np.ndarray, position_sec: float) -- called for each displayed frame
         on_state_change(state: PlayerState) -- called when state changes
         on_complete() -- called when video reaches the end
+        should_display() -> bool -- optional; returning False skips this
+            display tick (e.g. the GUI has not drawn the previous frame yet),
+            so the frame is grabbed without being converted or downscaled
+
+    If preview_width is given, frames wider than it are downscaled on the
+    playback thread before on_frame; frames that are not displayed are
+    skipped without being converted at all. Downscaled frames are written
+    into buffers from a small preallocated pool; a consumer hands each one
+    back with release_preview() once it is done with it. If the pool runs
+    dry (frames not yet released), a fresh buffer is allocated instead.
     """
 
-    def __init__(self, video_path: str):
+    PREVIEW_POOL_SIZE = 4
+
+    def __init__(self, video_path: str, preview_width: Optional[int] = None):
         self.video_path = video_path
+        self.preview_width = preview_width
         self._cap: Optional[cv2.VideoCapture] = None
         self._thread: Optional[threading.Thread] = None
         self._state = PlayerState.STOPPED
@@ -39,6 +63,10 @@ class VideoPlayer:
         self.total_frames: int = 0
         self.duration_sec: float = 0.0
         self.frame_size: tuple[int, int] = (0, 0)
+        self.preview_size: Optional[tuple[int, int]] = None
+        self._preview_maps = None
+        self._preview_pool: queue.SimpleQueue = queue.SimpleQueue()
+        self._decode_buf: Optional[np.ndarray] = None
 
         # Current position
         self._current_frame: int = 0
@@ -48,6 +76,7 @@ class VideoPlayer:
         self.on_frame: Optional[Callable[[np.ndarray, float], None]] = None
         self.on_state_change: Optional[Callable[[PlayerState], None]] = None
         self.on_complete: Optional[Callable[[], None]] = None
+        self.should_display: Optional[Callable[[], bool]] = None
 
     def open(self) -> bool:
         """Open the video file and read its properties."""
@@ -62,9 +91,35 @@ class VideoPlayer:
         h = int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
         self.frame_size = (w, h)
         self.duration_sec = self.total_frames / self.fps if self.fps > 0 else 0.0
+        if self.preview_width and w > self.preview_width:
+            scale = self.preview_width / w
+            self.preview_size = (self.preview_width, int(h * scale))
+            # The sampling grid is fixed for the whole file, so build it once.
+            # Beyond 2x, remap beats INTER_AREA (which is only fast at exactly 2x).
+            if w > 2 * self.preview_width:
+                self._preview_maps = _preview_maps((w, h), self.preview_size)
+            for _ in range(self.PREVIEW_POOL_SIZE):
+                self._preview_pool.put(self._new_preview_buffer())
+            # Full-size frames never leave the playback thread on this path,
+            # so a single decode target is reused for every read
+            self._decode_buf = np.empty((h, w, 3), dtype=np.uint8)
         print(f"Video opened: {self.video_path} ({w}x{h}, {self.fps:.1f} fps, {self.duration_sec:.1f}s)")
         return True
 
+    def _new_preview_buffer(self) -> np.ndarray:
+        pw, ph = self.preview_size
+        return np.empty((ph, pw, 3), dtype=np.uint8)
+
+    def release_preview(self, frame: np.ndarray):
+        """Return a downscaled frame from on_frame to the buffer pool.
+
+        Buffers allocated while the pool ran dry are dropped once it is full
+        again, so a slow consumer cannot grow the pool past PREVIEW_POOL_SIZE.
+        """
+        if (self.preview_size is not None and frame.shape[:2] == self.preview_size[::-1]
+                and self._preview_pool.qsize() < self.PREVIEW_POOL_SIZE):
+            self._preview_pool.put(frame)
+
     def play(self):
         """Start or resume playback."""
         with self._state_lock:
@@ -148,22 +203,38 @@ class VideoPlayer:
 
         Frames are read at the video's native FPS for correct timing,
         but on_frame callbacks are throttled to ~20fps to avoid overwhelming
-        the GUI while still maintaining smooth playback perception.
+        the GUI while still maintaining smooth playback perception. Skipped
+        frames are only grabbed (demuxed and decoded), never retrieved, so the
+        colour conversion for frames nobody sees is avoided.
+
+        Ticks are scheduled against absolute deadlines, so per-frame overhead
+        and sleep overshoot don't accumulate into playback running slow.
         """
         interval = 1.0 / self.fps if self.fps > 0 else 1.0 / 30.0
         display_interval = 1.0 / 20.0  # cap display callbacks at 20fps
         last_display = 0.0
+        next_tick = None
 
         while not self._stop_event.is_set():
-            # Wait while paused
-            self._pause_event.wait()
+            # Wait while paused; the schedule restarts on resume
+            if not self._pause_event.is_set():
+                self._pause_event.wait()
+                next_tick = None
             if self._stop_event.is_set():
                 break
 
             start = time.perf_counter()
+            if next_tick is None:
+                next_tick = start
 
-            ret, frame = self._cap.read()
-            if not ret or frame is None:
+            # Only send frame to GUI at display rate (skip intermediate frames)
+            display = (self.on_frame is not None and (start - last_display) >= display_interval
+                       and (self.should_display is None or self.should_display()))
+            if display:
+                ret, frame = self._cap.read(self._decode_buf)
+            else:
+                ret, frame = self._cap.grab(), None
+            if not ret or (display and frame is None):
                 # End of video
                 with self._state_lock:
                     self._state = PlayerState.STOPPED
@@ -176,16 +247,27 @@ class VideoPlayer:
                 self._current_frame += 1
                 pos = self._current_frame / self.fps if self.fps > 0 else 0.0
 
-            # Only send frame to GUI at display rate (skip intermediate frames)
-            now = time.perf_counter()
-            if self.on_frame and (now - last_display) >= display_interval:
+            if display:
+                if self.preview_size is not None:
+                    try:
+                        out = self._preview_pool.get_nowait()
+                    except queue.Empty:
+                        out = self._new_preview_buffer()
+                    if self._preview_maps is not None:
+                        frame = cv2.remap(frame, *self._preview_maps, cv2.INTER_LINEAR, dst=out)
+                    else:
+                        frame = cv2.resize(frame, self.preview_size, dst=out,
+                                           interpolation=cv2.INTER_AREA)
                 self.on_frame(frame, pos)
-                last_display = now
+                last_display = start
 
-            elapsed = time.perf_counter() - start
-            sleep_time = interval - elapsed
+            next_tick += interval
+            sleep_time = next_tick - time.perf_counter()
             if sleep_time > 0:
                 time.sleep(sleep_time)
+            elif sleep_time < -0.25:
+                # Stalled (e.g. disk): carry on from now rather than racing to catch up
+                next_tick = None
 
     def _notify_state_change(self):
         if self.on_state_change:
@@ -1,28 +1,211 @@
 """Video recording from USB cameras to MP4 files."""
 
+import queue
+import shutil
+import subprocess
 import threading
 import time
-from typing import Optional
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Optional
 
 import cv2
 import numpy as np
 
 from .camera import Camera
 
+# Output options per H.264 encoder, fastest settings first. Hardware encoders
+# are tried in order; libx264 is the software fallback.
+H264_ENCODER_ARGS = {
+    "h264_nvenc": ["-c:v", "h264_nvenc", "-preset", "fast", "-pix_fmt", "yuv420p"],
+    "h264_qsv": ["-c:v", "h264_qsv", "-preset", "veryfast", "-pix_fmt", "nv12"],
+    "h264_videotoolbox": ["-c:v", "h264_videotoolbox", "-realtime", "1", "-pix_fmt", "yuv420p"],
+    "libx264": ["-c:v", "libx264", "-preset", "ultrafast", "-tune", "zerolatency",
+                "-threads", "0", "-pix_fmt", "yuv420p"],
+}
+
+# stdin pipe buffer for raw frames; large writes stall less on big frames
+PIPE_BUFFER_SIZE = 1024 * 1024
+
+# Keep ffmpeg from opening a console window when launched from the GUI
+_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+
+@lru_cache(maxsize=1)
+def detect_h264_encoder() -> Optional[str]:
+    """Return the first H.264 encoder in H264_ENCODER_ARGS that actually works.
+
+    Listing in `ffmpeg -encoders` is not enough (builds ship NVENC/QSV even
+    without the hardware), so each candidate encodes a short test clip.
+    Returns None if ffmpeg is missing or nothing works.
+    """
+    if shutil.which("ffmpeg") is None:
+        return None
+    try:
+        listed = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=10, creationflags=_NO_WINDOW,
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    for name, args in H264_ENCODER_ARGS.items():
+        if f" {name} " not in listed:
+            continue
+        try:
+            probe = subprocess.run(
+                ["ffmpeg", "-hide_banner", "-loglevel", "error",
+                 "-f", "lavfi", "-i", "color=size=256x256:duration=0.2",
+                 *args, "-f", "null", "-"],
+                capture_output=True, timeout=15, creationflags=_NO_WINDOW,
+            )
+        except (OSError, subprocess.SubprocessError):
+            continue
+        if probe.returncode == 0:
+            print(f"Video encoder: {name}")
+            return name
+    return None
+
+
+class FFmpegPipeWriter:
+    """cv2.VideoWriter-compatible writer that pipes raw BGR frames into ffmpeg.
+
+    If audio_path is given, that file's audio is muxed in by the same ffmpeg
+    process (encoded with audio_args, AAC 192k by default), so no separate
+    mux pass over the video is needed.
+
+    If ffmpeg goes away mid-write the remaining frames are discarded;
+    release() returns ffmpeg's exit status so callers can tell the output
+    is incomplete.
+    """
+
+    def __init__(self, output_path: str, fps: float, size: tuple[int, int], encoder: str,
+                 audio_path: Optional[str] = None, audio_args: Optional[list[str]] = None):
+        w, h = size
+        if audio_path:
+            audio = ["-i", audio_path, "-map", "0:v", "-map", "1:a",
+                     *(audio_args or ["-c:a", "aac", "-b:a", "192k"]), "-shortest"]
+        else:
+            audio = ["-an"]
+        cmd = [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+            "-f", "rawvideo", "-pix_fmt", "bgr24", "-s", f"{w}x{h}", "-r", str(fps),
+            "-i", "-", *audio, *H264_ENCODER_ARGS[encoder], output_path,
+        ]
+        self._failed = False
+        try:
+            self._proc: Optional[subprocess.Popen] = subprocess.Popen(
+                cmd, stdin=subprocess.PIPE, bufsize=PIPE_BUFFER_SIZE,
+                creationflags=_NO_WINDOW,
+            )
+        except OSError as e:
+            print(f"ERROR: Could not start ffmpeg: {e}")
+            self._proc = None
+
+    def isOpened(self) -> bool:
+        return self._proc is not None and not self._failed and self._proc.poll() is None
+
+    def write(self, frame: np.ndarray):
+        if self._proc is None or self._failed:
+            return
+        if not frame.flags.c_contiguous:
+            frame = np.ascontiguousarray(frame)
+        try:
+            # Write the array's buffer directly; tobytes() would copy it first
+            self._proc.stdin.write(frame.data)
+        except (BrokenPipeError, OSError) as e:
+            print(f"ERROR: ffmpeg writer closed unexpectedly: {e}")
+            self._failed = True
+
+    def release(self) -> Optional[int]:
+        """Close ffmpeg's input and wait for it; returns its exit status (None if it never started)."""
+        if self._proc is None:
+            return None
+        try:
+            self._proc.stdin.close()
+        except OSError:
+            pass
+        returncode = self._proc.wait()
+        self._proc = None
+        return returncode
+
+
+class _WriteQueue:
+    """Bounded queue of (frame, repeats) entries that never blocks the producer.
+
+    When full, the oldest entry is dropped and its repeats are added to the
+    next one, so the video keeps its wall-clock length and only loses the
+    dropped frame's image. The frame buffer of a dropped entry is handed to
+    on_drop. close() queues the end marker, after which get() returns None.
+    maxsize must be at least 2.
+    """
+
+    def __init__(self, maxsize: int, on_drop: Callable[[np.ndarray], None]):
+        self._items: deque = deque()
+        self._maxsize = maxsize
+        self._on_drop = on_drop
+        self._closed = False
+        self._cond = threading.Condition()
+        self.dropped = 0
+
+    def put(self, item: tuple):
+        with self._cond:
+            if len(self._items) >= self._maxsize:
+                dropped_frame, dropped_repeats = self._items.popleft()
+                frame, repeats = self._items[0]
+                if frame is None:
+                    # The next entry only repeats, so the dropped frame is
+                    # still the one it should repeat
+                    frame = dropped_frame
+                elif dropped_frame is not None:
+                    self._on_drop(dropped_frame)
+                    self.dropped += 1
+                self._items[0] = (frame, repeats + dropped_repeats)
+            self._items.append(item)
+            self._cond.notify()
+
+    def get(self) -> Optional[tuple]:
+        with self._cond:
+            while not self._items and not self._closed:
+                self._cond.wait()
+            return self._items.popleft() if self._items else None
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+
 
 class VideoRecorder:
-    """Records frames from a Camera to an MP4 file on a background thread."""
+    """Records frames from a Camera to an MP4 file on background threads.
+
+    One thread reads the camera; a second one feeds the video writer from a
+    bounded queue, so encode and disk stalls don't delay the next read. If
+    the writer falls WRITE_QUEUE_SIZE entries behind, the oldest queued
+    frames are dropped (see dropped_frames) rather than stalling capture.
+    With an encoder name from H264_ENCODER_ARGS the frames are piped to
+    ffmpeg; otherwise OpenCV's mp4v VideoWriter is used.
+    """
 
-    def __init__(self, camera: Camera, output_path: str, fps: int = 30):
+    # Frames the capture thread may run ahead of the writer thread
+    WRITE_QUEUE_SIZE = 8
+
+    def __init__(self, camera: Camera, output_path: str, fps: int = 30,
+                 encoder: Optional[str] = None):
         self.camera = camera
         self.output_path = output_path
         self.fps = fps
+        self.encoder = encoder
         self._writer: Optional[cv2.VideoWriter] = None
         self._thread: Optional[threading.Thread] = None
+        self._writer_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._frame_count = 0
         self._last_frame: Optional[np.ndarray] = None
         self._lock = threading.Lock()
+        # Frame buffers the writer thread has finished with, reused for reads
+        self._free_buffers: queue.SimpleQueue = queue.SimpleQueue()
+        self._write_queue = _WriteQueue(self.WRITE_QUEUE_SIZE, self._free_buffers.put)
+        self._size_warned = False
 
     def start(self) -> bool:
         """Start recording on a background thread."""
@@ -33,14 +216,20 @@ class VideoRecorder:
         # Use actual resolution from camera (not configured), since the camera
         # may deliver frames at a different size than requested
         w, h = self.camera.config.actual_resolution or self.camera.config.resolution
-        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-        self._writer = cv2.VideoWriter(self.output_path, fourcc, self.fps, (w, h))
+        if self.encoder:
+            self._writer = FFmpegPipeWriter(self.output_path, self.fps, (w, h), self.encoder)
+        else:
+            fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+            self._writer = cv2.VideoWriter(self.output_path, fourcc, self.fps, (w, h))
         if not self._writer.isOpened():
             print(f"Failed to open video writer: {self.output_path}")
             return False
 
         self._stop_event.clear()
         self._frame_count = 0
+        self._write_queue = _WriteQueue(self.WRITE_QUEUE_SIZE, self._free_buffers.put)
+        self._writer_thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer_thread.start()
         self._thread = threading.Thread(target=self._record_loop, daemon=True)
         self._thread.start()
         print(f"Video recording started: {self.output_path} ({w}x{h} @ {self.fps}fps)")
@@ -56,55 +245,123 @@ class VideoRecorder:
         """
         interval = 1.0 / self.fps
         expected_size = self.camera.config.actual_resolution or self.camera.config.resolution
-        size_warned = False
         start_time = time.perf_counter()
+        next_tick = start_time
 
         while not self._stop_event.is_set():
-            loop_start = time.perf_counter()
-            frame = self.camera.read_frame()
-            if frame is not None:
-                # Ensure frame matches writer dimensions
-                fh, fw = frame.shape[:2]
-                if (fw, fh) != expected_size:
-                    if not size_warned:
-                        print(f"WARNING: Frame size {fw}x{fh} != writer size "
-                              f"{expected_size[0]}x{expected_size[1]}, resizing")
-                        size_warned = True
-                    frame = cv2.resize(frame, expected_size)
-                with self._lock:
-                    self._last_frame = frame.copy()
+            frame = self._read_frame(expected_size)
 
             # Write enough frames to stay in sync with wall-clock time
-            write_frame = frame
-            if write_frame is None:
-                with self._lock:
-                    write_frame = self._last_frame
-            if write_frame is not None:
-                expected_frames = int((time.perf_counter() - start_time) * self.fps)
-                while self._frame_count < expected_frames:
-                    self._writer.write(write_frame)
-                    self._frame_count += 1
-
-            elapsed = time.perf_counter() - loop_start
-            sleep_time = interval - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            if frame is not None or self._last_frame is not None:
+                self._queue_write(frame, start_time)
+
+            next_tick = self._sleep_until(next_tick + interval)
+
+    @staticmethod
+    def _sleep_until(deadline: float) -> float:
+        """Sleep until deadline; return it, or now if it has already passed.
+
+        Absolute deadlines keep the read cadence from drifting. When behind,
+        the schedule restarts from now, since repeat writes fill the gap.
+        """
+        sleep_time = deadline - time.perf_counter()
+        if sleep_time > 0:
+            time.sleep(sleep_time)
+            return deadline
+        return time.perf_counter()
+
+    def _read_frame(self, expected_size: tuple[int, int]) -> Optional[np.ndarray]:
+        """Read the next camera frame into a pooled buffer of the writer's size.
+
+        Buffers come back from the writer thread once a newer frame has
+        replaced them, so steady-state capture allocates nothing.
+        """
+        try:
+            buf = self._free_buffers.get_nowait()
+        except queue.Empty:
+            buf = np.empty((expected_size[1], expected_size[0], 3), dtype=np.uint8)
+        frame = self.camera.read_frame(buf)
+        if frame is None:
+            self._free_buffers.put(buf)
+            return None
+        if frame is not buf:
+            # Camera delivered another size (or ignored the buffer)
+            fh, fw = frame.shape[:2]
+            if (fw, fh) != expected_size:
+                if not self._size_warned:
+                    print(f"WARNING: Frame size {fw}x{fh} != writer size "
+                          f"{expected_size[0]}x{expected_size[1]}, resizing")
+                    self._size_warned = True
+                cv2.resize(frame, expected_size, dst=buf)
+            else:
+                np.copyto(buf, frame)
+        with self._lock:
+            self._last_frame = buf
+        return buf
+
+    def _queue_write(self, frame: Optional[np.ndarray], start_time: float):
+        """Tell the writer thread how many frames to write to keep pace with wall-clock time.
+
+        frame is a newly captured frame, or None to repeat the previous one.
+        Every new frame is queued, even with nothing due yet, so the writer
+        always holds the latest one. Never blocks: a backed-up writer loses
+        its oldest queued frame instead.
+        """
+        expected_frames = int((time.perf_counter() - start_time) * self.fps)
+        repeats = max(0, expected_frames - self._frame_count)
+        if frame is not None or repeats:
+            self._write_queue.put((frame, repeats))
+            self._frame_count += repeats
+
+    def _write_loop(self):
+        """Writer thread: encode queued frames until the queue is closed.
+
+        A frame's buffer goes back to the pool once a newer frame replaces it.
+        """
+        current = None
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                return
+            frame, repeats = item
+            if frame is not None:
+                if current is not None:
+                    self._free_buffers.put(current)
+                current = frame
+            for _ in range(repeats):
+                self._writer.write(current)
 
     def stop(self):
-        """Stop recording and release the video writer."""
+        """Stop recording, drain the write queue and release the video writer."""
         self._stop_event.set()
         if self._thread is not None:
             self._thread.join(timeout=5.0)
             self._thread = None
+        if self._writer_thread is not None:
+            self._write_queue.close()
+            self._writer_thread.join()
+            self._writer_thread = None
         if self._writer is not None:
-            self._writer.release()
+            # cv2.VideoWriter returns None; FFmpegPipeWriter its exit status
+            status = self._writer.release()
             self._writer = None
+            if status:
+                print(f"ERROR: ffmpeg exited with status {status}; "
+                      f"{self.output_path} may be incomplete")
         print(f"Video recording stopped: {self._frame_count} frames written to {self.output_path}")
+        if self.dropped_frames:
+            print(f"WARNING: {self.dropped_frames} frames dropped from {self.output_path} "
+                  f"because the video writer fell behind")
 
     @property
     def frame_count(self) -> int:
         return self._frame_count
 
+    @property
+    def dropped_frames(self) -> int:
+        """Captured frames discarded because the writer fell behind."""
+        return self._write_queue.dropped
+
     @property
     def last_frame(self) -> Optional[np.ndarray]:
         with self._lock:
@@ -118,8 +375,9 @@ class PausableVideoRecorder(VideoRecorder):
     FPS so that the output video duration matches wall-clock time.
     """
 
-    def __init__(self, camera: Camera, output_path: str, fps: int = 30):
-        super().__init__(camera, output_path, fps)
+    def __init__(self, camera: Camera, output_path: str, fps: int = 30,
+                 encoder: Optional[str] = None):
+        super().__init__(camera, output_path, fps, encoder)
         self._paused = False
         self._pause_lock = threading.Lock()
 
@@ -148,38 +406,19 @@ class PausableVideoRecorder(VideoRecorder):
         """
         interval = 1.0 / self.fps
         expected_size = self.camera.config.actual_resolution or self.camera.config.resolution
-        size_warned = False
         start_time = time.perf_counter()
+        next_tick = start_time
 
         while not self._stop_event.is_set():
-            loop_start = time.perf_counter()
 
             with self._pause_lock:
                 paused = self._paused
 
-            if not paused:
-                frame = self.camera.read_frame()
-                if frame is not None:
-                    fh, fw = frame.shape[:2]
-                    if (fw, fh) != expected_size:
-                        if not size_warned:
-                            print(f"WARNING: Frame size {fw}x{fh} != writer size "
-                                  f"{expected_size[0]}x{expected_size[1]}, resizing")
-                            size_warned = True
-                        frame = cv2.resize(frame, expected_size)
-                    with self._lock:
-                        self._last_frame = frame.copy()
+            # While paused nothing is read and the last frame is repeated
+            frame = None if paused else self._read_frame(expected_size)
 
             # Write enough frames to stay in sync with wall-clock time
-            with self._lock:
-                write_frame = self._last_frame
-            if write_frame is not None:
-                expected_frames = int((time.perf_counter() - start_time) * self.fps)
-                while self._frame_count < expected_frames:
-                    self._writer.write(write_frame)
-                    self._frame_count += 1
-
-            elapsed = time.perf_counter() - loop_start
-            sleep_time = interval - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            if frame is not None or self._last_frame is not None:
+                self._queue_write(frame, start_time)
+
+            next_tick = self._sleep_until(next_tick + interval)
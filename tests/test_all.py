@@ -50,6 +50,75 @@ class TestEnsureDir:
         assert result == target
 
 
+class TestSingleOpencvThread:
+    def test_overlapping_holders_restore_once(self):
+        import cv2
+        from src.utils import single_opencv_thread
+        before = cv2.getNumThreads()
+        with single_opencv_thread():
+            with single_opencv_thread():
+                assert cv2.getNumThreads() == 1
+            # The outer holder is still inside its block
+            assert cv2.getNumThreads() == 1
+        assert cv2.getNumThreads() == before
+
+
+class TestCopyTreeParallel:
+    def test_copy_tree_parallel(self, tmp_path):
+        from src.utils import copy_tree_parallel
+        src = tmp_path / "src"
+        (src / "review").mkdir(parents=True)
+        (src / "empty").mkdir()
+        (src / "manifest.json").write_text("{}")
+        (src / "review" / "clip.bin").write_bytes(os.urandom(5 * 1024 * 1024))
+
+        count = copy_tree_parallel(src, tmp_path / "dst")
+        assert count == 2
+        assert (tmp_path / "dst" / "empty").is_dir()
+        assert (tmp_path / "dst" / "manifest.json").read_text() == "{}"
+        assert ((tmp_path / "dst" / "review" / "clip.bin").read_bytes()
+                == (src / "review" / "clip.bin").read_bytes())
+
+    def test_copy_file_falls_back_without_kernel_copy(self, tmp_path):
+        from src import utils
+        src = tmp_path / "clip.bin"
+        src.write_bytes(os.urandom(utils.COPY_CHUNK_SIZE + 123))
+        with patch.object(utils, "_copy_kernel", return_value=False):
+            utils.copy_file(src, tmp_path / "fallback.bin")
+        utils.copy_file(src, tmp_path / "kernel.bin")
+        for name in ("fallback.bin", "kernel.bin"):
+            dst = tmp_path / name
+            assert dst.read_bytes() == src.read_bytes()
+            assert dst.stat().st_mtime == src.stat().st_mtime
+
+    def test_copy_file_falls_back_when_sendfile_unusable(self, tmp_path):
+        from src import utils
+        src = tmp_path / "clip.bin"
+        src.write_bytes(os.urandom(1000))
+        with patch.object(utils.sys, "platform", "darwin"), \
+                patch.object(utils.os, "sendfile", create=True) as sendfile:
+            utils.copy_file(src, tmp_path / "mac.bin")
+        sendfile.assert_not_called()
+        with patch.object(utils.os, "copy_file_range", side_effect=OSError(18, "EXDEV"), create=True), \
+                patch.object(utils.os, "sendfile", side_effect=OSError(22, "EINVAL"), create=True):
+            utils.copy_file(src, tmp_path / "linux.bin")
+        for name in ("mac.bin", "linux.bin"):
+            assert (tmp_path / name).read_bytes() == src.read_bytes()
+
+    def test_copy_tree_parallel_skips_unchanged(self, tmp_path):
+        from src.utils import copy_tree_parallel
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "video.mp4").write_bytes(b"x" * 1000)
+        (src / "manifest.json").write_text("{}")
+        assert copy_tree_parallel(src, tmp_path / "dst") == 2
+        assert copy_tree_parallel(src, tmp_path / "dst") == 0
+
+        (src / "manifest.json").write_text('{"events": []}')
+        assert copy_tree_parallel(src, tmp_path / "dst") == 1
+        assert (tmp_path / "dst" / "manifest.json").read_text() == '{"events": []}'
+
+
 class TestTimer:
     def test_timer_start_stop(self):
         from src.utils import Timer
@@ -259,10 +328,48 @@ class TestCamera:
         frame = camera.read_frame()
         assert frame is None
 
+    @patch("src.camera.cv2")
+    def test_camera_open_reuses_capture(self, mock_cv2):
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.get.return_value = 30.0
+        mock_cv2.VideoCapture.return_value = mock_cap
+
+        camera = self._make_camera()
+        assert camera.open() is True
+        assert camera.open() is True
+        mock_cv2.VideoCapture.assert_called_once()
+
+    @patch("src.camera.cv2")
+    def test_camera_stats_counts_reads(self, mock_cv2):
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.get.return_value = 30.0
+        fake_frame = np.zeros((4, 4, 3), dtype=np.uint8)
+        mock_cap.read.side_effect = [(True, fake_frame), (True, fake_frame), (False, None)]
+        mock_cv2.VideoCapture.return_value = mock_cap
+
+        camera = self._make_camera()
+        camera.open()
+        for _ in range(3):
+            camera.read_frame()
+        stats = camera.stats()
+        assert stats["grabbed"] == 2
+        assert stats["dropped"] == 1
+        assert stats["fps"] > 0
+
     def test_camera_read_frame_not_opened(self):
         camera = self._make_camera()
         assert camera.read_frame() is None
 
+    def test_camera_skip_frames_grabs_without_decoding(self):
+        camera = self._make_camera()
+        assert camera.skip_frames(5) == 0
+        camera._capture = MagicMock()
+        camera._capture.grab.side_effect = [True, True, False]
+        assert camera.skip_frames(5) == 2
+        camera._capture.read.assert_not_called()
+
 
 class TestCameraManager:
     @patch("src.camera.cv2")
@@ -324,6 +431,55 @@ class TestCameraManager:
 # Module: src/gopro.py
 # ============================================================
 
+def _gopro_configs(count, **extra):
+    """Settings entries for count enabled GoPros, gp0..gp{count-1}."""
+    return [
+        {"id": f"gp{i}", "name": f"GP{i}", "model": "hero7_silver",
+         "wifi_interface": f"wlan{i}", "enabled": True, **extra}
+        for i in range(count)
+    ]
+
+
+def _start_camera_http_server():
+    """Start a local keep-alive HTTP server standing in for a camera.
+
+    Returns (server, requests); requests collects (path, client_address)
+    per GET. /gp/ paths answer 200 with an empty status, anything else 404.
+    """
+    import http.server
+    requests = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            requests.append((self.path, self.client_address))
+            found = self.path.startswith("/gp/")
+            body = b'{"status": {}}' if found else b"no"
+            self.send_response(200 if found else 404)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, requests
+
+
+@pytest.fixture
+def camera_http_server():
+    """A _start_camera_http_server server for one test; yields (port, requests)."""
+    server, requests = _start_camera_http_server()
+    try:
+        yield server.server_address[1], requests
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
 class TestGoProConfig:
     def test_gopro_config_defaults(self):
         from src.gopro import GoProConfig
@@ -377,6 +533,174 @@ class TestGoProCam:
         cam = self._make_cam()
         assert cam.is_connected is False
 
+    def test_interface_ip_cached_for_ttl(self):
+        from src import gopro
+        gopro.invalidate_interface_ip("WiFi 4")
+        with patch.object(gopro, "_query_interface_ip", return_value="10.5.5.100") as query:
+            assert gopro.get_interface_ip("WiFi 4") == "10.5.5.100"
+            assert gopro.get_interface_ip("WiFi 4") == "10.5.5.100"
+            assert query.call_count == 1
+            gopro.invalidate_interface_ip("WiFi 4")
+            gopro.get_interface_ip("WiFi 4")
+            assert query.call_count == 2
+        gopro.invalidate_interface_ip("WiFi 4")
+
+    def test_interface_ip_misses_not_cached(self):
+        from src import gopro
+        with patch.object(gopro, "_query_interface_ip", side_effect=[None, "10.5.5.101"]):
+            assert gopro.get_interface_ip("WiFi 5") is None
+            assert gopro.get_interface_ip("WiFi 5") == "10.5.5.101"
+        gopro.invalidate_interface_ip("WiFi 5")
+
+    def test_find_adapter_ip_walks_adapter_list(self):
+        import ctypes
+        from src import gopro
+
+        def sockaddr(ip):
+            addr = gopro._SockaddrIn(sin_family=gopro._AF_INET)
+            addr.sin_addr[:] = [int(part) for part in ip.split(".")]
+            return addr
+
+        link_local, gopro_ip = sockaddr("169.254.3.4"), sockaddr("10.5.5.100")
+        second = gopro._IpAdapterUnicastAddress()
+        second.Address.lpSockaddr = ctypes.pointer(gopro_ip)
+        first = gopro._IpAdapterUnicastAddress(Next=ctypes.pointer(second))
+        first.Address.lpSockaddr = ctypes.pointer(link_local)
+        wifi4 = gopro._IpAdapterAddresses(FriendlyName="WiFi 4",
+                                          FirstUnicastAddress=ctypes.pointer(first))
+        ethernet = gopro._IpAdapterAddresses(FriendlyName="Ethernet",
+                                             Next=ctypes.pointer(wifi4))
+        head = ctypes.pointer(ethernet)
+
+        assert gopro._find_adapter_ip(head, "WiFi 4") == "10.5.5.100"
+        assert gopro._find_adapter_ip(head, "Ethernet") is None
+        assert gopro._find_adapter_ip(head, "WiFi 9") is None
+
+    def test_parse_ipconfig_maps_named_adapters(self):
+        from src import gopro
+        output = (
+            "Windows IP Configuration\n\n"
+            "Ethernet adapter Ethernet:\n\n"
+            "   IPv4 Address. . . . . . . . . . . : 192.168.1.20\n\n"
+            "Wireless LAN adapter WiFi 4:\n\n"
+            "   Link-local IPv6 Address . . . . . : fe80::1%12\n"
+            "   IPv4 Address. . . . . . . . . . . : 10.5.5.100(Preferred)\n\n"
+            "Wireless LAN adapter WiFi 14:\n\n"
+            "   IPv4 Address. . . . . . . . . . . : 10.5.5.114\n\n"
+            "Wireless LAN adapter WiFi 5:\n\n"
+            "   Media State . . . . . . . . . . . : Media disconnected\n"
+        )
+        assert gopro._parse_ipconfig(output, ["WiFi 4", "WiFi 5"]) == {"WiFi 4": "10.5.5.100"}
+
+    def test_parse_ipconfig_localized_headers(self):
+        from src import gopro
+        output = (
+            "Drahtlos-LAN-Adapter WLAN 4:\n\n"
+            "   IPv4-Adresse  . . . . . . . . . . : 10.5.5.100(Bevorzugt)\n\n"
+            "Carte réseau sans fil Wi-Fi 5 :\n\n"
+            "   Adresse IPv4. . . . . . . . . . . . . .: 10.5.5.101(préféré)\n"
+        )
+        assert gopro._parse_ipconfig(output, ["WLAN 4", "Wi-Fi 5"]) == {
+            "WLAN 4": "10.5.5.100", "Wi-Fi 5": "10.5.5.101"}
+
+    def test_get_all_interface_ips_seeds_cache(self):
+        from src import gopro
+        ips = {"WiFi 4": "10.5.5.100", "WiFi 5": "10.5.5.101"}
+        with patch.object(gopro.platform, "system", return_value="Windows"), \
+                patch.object(gopro, "_iphlpapi_adapters", return_value=ips), \
+                patch.object(gopro, "_query_interface_ip") as query:
+            assert gopro.get_all_interface_ips(["WiFi 4", "WiFi 5"]) == ips
+            assert gopro.get_interface_ip("WiFi 5") == "10.5.5.101"
+            query.assert_not_called()
+        for name in ips:
+            gopro.invalidate_interface_ip(name)
+
+    def test_dhcp_wait_wakes_on_address_change(self):
+        from src import gopro
+        with patch.object(gopro, "get_interface_ip", side_effect=[None, None, "10.5.5.100"]), \
+                patch.object(gopro, "_wait_for_addr_change", return_value=True) as notify, \
+                patch.object(gopro.time, "sleep") as sleep:
+            assert gopro.ensure_interface_ip("WiFi 4", "10.5.5.101") == "10.5.5.100"
+        assert notify.call_count == 2
+        sleep.assert_not_called()
+
+    def test_addr_change_wait_reaps_cancelled_request(self):
+        from src import gopro
+        dlls = MagicMock()
+        kernel32, iphlpapi = dlls.kernel32, dlls.iphlpapi
+        kernel32.CreateEventW.return_value = 0x44
+        kernel32.WaitForSingleObject.side_effect = [258, 0]  # WAIT_TIMEOUT, then the abort
+        iphlpapi.NotifyAddrChange.return_value = gopro._ERROR_IO_PENDING
+        with patch.object(gopro.ctypes, "WinDLL", side_effect=lambda name: getattr(dlls, name),
+                          create=True):
+            assert gopro._wait_for_addr_change(0.5) is False
+        calls = [c[0] for c in dlls.mock_calls if not c[0].startswith("kernel32.CreateEventW")]
+        assert calls == ["iphlpapi.NotifyAddrChange", "kernel32.WaitForSingleObject",
+                         "iphlpapi.CancelIPChangeNotify", "kernel32.WaitForSingleObject",
+                         "kernel32.CloseHandle"]
+        assert kernel32.WaitForSingleObject.call_args.args[1] == gopro._INFINITE
+
+    def test_dhcp_wait_polls_without_notify_api(self):
+        from src import gopro
+        with patch.object(gopro, "get_interface_ip", side_effect=[None, "10.5.5.100"]), \
+                patch.object(gopro, "_wait_for_addr_change", side_effect=OSError(50, "unsupported")), \
+                patch.object(gopro.time, "sleep") as sleep:
+            assert gopro.ensure_interface_ip("WiFi 4", "10.5.5.101") == "10.5.5.100"
+        sleep.assert_called_once()
+
+    def test_find_adapter_index(self):
+        import ctypes
+        from src import gopro
+        wifi4 = gopro._IpAdapterAddresses(FriendlyName="WiFi 4", IfIndex=12)
+        ethernet = gopro._IpAdapterAddresses(FriendlyName="Ethernet", IfIndex=3,
+                                             Next=ctypes.pointer(wifi4))
+        head = ctypes.pointer(ethernet)
+        assert gopro._find_adapter_index(head, "WiFi 4") == 12
+        assert gopro._find_adapter_index(head, "WiFi 9") is None
+
+    def test_connection_pinned_to_interface(self):
+        import socket
+        from src import gopro
+        conn = gopro._BoundHTTPConnection("10.5.5.9", source_address=("10.5.5.100", 0),
+                                          if_index=12, timeout=1.0)
+        with patch.object(gopro.socket, "socket") as sock_cls:
+            conn.connect()
+        sock = sock_cls.return_value
+        sock.setsockopt.assert_any_call(socket.IPPROTO_IP, gopro.IP_UNICAST_IF, socket.htonl(12))
+        sock.bind.assert_called_once_with(("10.5.5.100", 0))
+        sock.connect.assert_called_once_with(("10.5.5.9", 80))
+
+    def test_http_handler_caps_timeout(self):
+        import socket
+        import urllib.request
+        from src.gopro import HTTP_TIMEOUT, _BoundHTTPHandler
+        handler = _BoundHTTPHandler(None)
+        handler.do_open = MagicMock()
+        for requested, expected in ((socket._GLOBAL_DEFAULT_TIMEOUT, HTTP_TIMEOUT),
+                                    (60, HTTP_TIMEOUT), (1.0, 1.0)):
+            req = urllib.request.Request("http://10.5.5.9/gp/gpControl/status")
+            req.timeout = requested
+            handler.http_open(req)
+            assert req.timeout == expected
+
+    @patch("src.gopro.socket.socket")
+    def test_keep_alive_reuses_socket(self, mock_socket):
+        from src.gopro import KEEPALIVE_PAYLOAD
+        cam = self._make_cam()
+        cam._connected = True
+        cam._source_ip = "10.5.5.100"
+        cam.keep_alive()
+        cam.keep_alive()
+        sock = mock_socket.return_value
+        mock_socket.assert_called_once()
+        sock.bind.assert_called_once_with(("10.5.5.100", 0))
+        assert sock.sendto.call_count == 2
+        assert sock.sendto.call_args.args[0] == KEEPALIVE_PAYLOAD
+
+        cam._camera = MagicMock()
+        cam.disconnect()
+        sock.close.assert_called_once()
+
 
 class TestGoProManager:
     @patch("src.gopro.GoProCamera")
@@ -415,6 +739,185 @@ class TestGoProManager:
         mgr.keep_alive_all()
         mock_camera.KeepAlive.assert_called()
 
+    def test_disconnect_all_runs_in_parallel(self):
+        from src.gopro import GoProManager
+        mgr = GoProManager(_gopro_configs(3))
+        barrier = threading.Barrier(3, timeout=2.0)
+        met = []
+        for cam in mgr.cameras.values():
+            cam._camera = MagicMock()
+            cam._connected = True
+            cam.stop_recording = lambda: met.append(barrier.wait())
+        mgr.disconnect_all()
+        assert len(met) == 3  # all three stops were in flight at once
+        assert not any(c.is_connected for c in mgr.cameras.values())
+
+    def test_disconnect_skips_stop_after_acknowledged_stop(self):
+        from src.gopro import GoProManager
+        mgr = GoProManager([{"id": "gp1", "name": "GP1", "model": "hero7_silver",
+                             "wifi_interface": "wlan1", "enabled": True}])
+        cam = mgr.cameras["gp1"]
+        camera = cam._camera = MagicMock()
+        cam._connected = True
+        cam.start_recording()
+        cam.stop_recording()
+        cam.disconnect()
+        assert camera.shutter.call_count == 2
+        camera.IsRecording.assert_not_called()
+
+    def test_disconnect_stops_when_state_unknown(self):
+        from src.gopro import GoProManager
+        mgr = GoProManager([{"id": "gp1", "name": "GP1", "model": "hero7_silver",
+                             "wifi_interface": "wlan1", "enabled": True}])
+        cam = mgr.cameras["gp1"]
+        camera = cam._camera = MagicMock()
+        camera.shutter.side_effect = [OSError("timed out"), None]
+        cam._connected = True
+        cam.stop_recording()  # lost reply: the camera may still be recording
+        cam.disconnect()
+        assert camera.shutter.call_count == 2
+
+    def test_get_status_all_uses_one_request_per_camera(self):
+        import io
+        from src.gopro import GoProManager
+        mgr = GoProManager([{"id": "gp1", "name": "GP1", "model": "hero7_silver",
+                             "wifi_interface": "wlan1", "enabled": True}])
+        cam = mgr.cameras["gp1"]
+        cam._camera = MagicMock()
+        cam._connected = True
+        cam._urlopen = MagicMock(return_value=io.BytesIO(b'{"status": {"8": 1, "70": 87}}'))
+        status = mgr.get_status_all()["gp1"]
+        assert status == {"name": "GP1", "model": "hero7_silver", "connected": True,
+                          "recording": True, "battery": 87}
+        cam._urlopen.assert_called_once_with("http://10.5.5.9/gp/gpControl/status")
+        cam._camera.IsRecording.assert_not_called()
+        cam._camera.getStatus.assert_not_called()
+        mgr.disconnect_all()
+
+    def test_static_ips_unique_across_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from src.gopro import GoProManager
+        mgr = GoProManager(_gopro_configs(8))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            ips = list(pool.map(lambda cam: cam._next_static_ip(), mgr.cameras.values()))
+        assert len(set(ips)) == 8
+        assert min(ips) == "10.5.5.100"
+
+    def test_cameras_route_requests_concurrently(self):
+        from src import gopro
+        mgr = gopro.GoProManager(_gopro_configs(2))
+        barrier = threading.Barrier(2, timeout=2.0)
+        passed = []
+
+        def shutter(_):
+            # What goprocam does inside each call
+            gopro.GoProCamera.urllib.request.urlopen("http://10.5.5.9/gp/gpControl/command/shutter?p=1")
+            passed.append(barrier.wait())
+
+        for cam in mgr.cameras.values():
+            cam._urlopen = MagicMock()
+            cam._camera = MagicMock()
+            cam._camera.shutter.side_effect = shutter
+            cam._connected = True
+
+            def start_then_check_route(start=cam.start_recording):
+                start()
+                # Routing is per worker thread and must not outlive the call
+                leftover.append(getattr(gopro._route, "camera", None))
+            cam.start_recording = start_then_check_route
+        leftover = []
+        mgr.start_recording_all()
+        assert len(passed) == 2  # both cameras were mid-request at once
+        for cam in mgr.cameras.values():
+            cam._urlopen.assert_called_once_with("http://10.5.5.9/gp/gpControl/command/shutter?p=1")
+        assert leftover == [None, None]
+        mgr.disconnect_all()
+
+    def test_camera_requests_reuse_one_connection(self, camera_http_server):
+        import urllib.error
+        from src.gopro import GoProCam, GoProConfig
+        port, requests = camera_http_server
+        base = f"http://127.0.0.1:{port}"
+        cam = GoProCam(GoProConfig(id="gp1", name="GP1", model="hero7_silver",
+                                   wifi_interface="wlan1", ip_address="127.0.0.1"))
+        try:
+            with cam._route_requests():
+                assert cam._urlopen(base + "/gp/gpControl/status", timeout=5).read() == b'{"status": {}}'
+                assert cam._urlopen(base + "/gp/gpControl/command/shutter?p=1").status == 200
+                with pytest.raises(urllib.error.HTTPError):
+                    cam._urlopen(base + "/missing")
+        finally:
+            cam._close_http()
+        peers = [peer for _, peer in requests]
+        assert len(peers) == 3 and len(set(peers)) == 1  # one TCP connection
+
+    def test_camera_connection_follows_port(self, camera_http_server):
+        from src.gopro import GoProCam, GoProConfig
+        port, requests = camera_http_server
+        other, other_requests = _start_camera_http_server()
+        cam = GoProCam(GoProConfig(id="gp1", name="GP1", model="hero7_silver",
+                                   wifi_interface="wlan1", ip_address="127.0.0.1"))
+        try:
+            with cam._route_requests():
+                cam._urlopen(f"http://127.0.0.1:{port}/gp/gpControl/status").read()
+                cam._urlopen(f"http://127.0.0.1:{other.server_address[1]}/gp/media").read()
+                cam._urlopen(f"http://127.0.0.1:{port}/gp/gpControl/status").read()
+        finally:
+            cam._close_http()
+            other.shutdown()
+            other.server_close()
+        assert [path for path, _ in requests] == ["/gp/gpControl/status"] * 2
+        assert [path for path, _ in other_requests] == ["/gp/media"]
+
+    def test_shutter_sent_to_all_before_replies(self, camera_http_server):
+        from src.gopro import GoProManager
+        port, requests = camera_http_server
+        mgr = GoProManager(_gopro_configs(2, ip_address="127.0.0.1"))
+        try:
+            for cam in mgr.cameras.values():
+                cam._camera = MagicMock()
+                cam._connected = True
+                with cam._route_requests():
+                    cam._urlopen(f"http://127.0.0.1:{port}/gp/gpControl/status").read()
+            mgr.start_recording_all()
+            for cam in mgr.cameras.values():
+                cam._camera.shutter.assert_not_called()
+        finally:
+            mgr.disconnect_all()
+        paths = [path for path, _ in requests]
+        assert paths.count("/gp/gpControl/command/shutter?p=1") == 2
+
+    def test_shutter_falls_back_to_goprocam(self):
+        from src.gopro import GoProManager
+        mgr = GoProManager([{"id": "gp1", "name": "GP1", "model": "hero7_silver",
+                             "wifi_interface": "wlan1", "enabled": True}])
+        cam = mgr.cameras["gp1"]
+        cam._camera = MagicMock()
+        cam._connected = True
+        cam._http = MagicMock()
+        cam._http.request.side_effect = OSError("connection reset")
+        mgr.stop_recording_all()
+        cam._camera.shutter.assert_called_once()
+        assert cam._http is None
+        mgr.disconnect_all()
+
+    def test_parallel_calls_reuse_worker_pool(self):
+        from src.gopro import GoProManager
+        mgr = GoProManager(_gopro_configs(2))
+        workers = set()
+        for cam in mgr.cameras.values():
+            cam._camera = MagicMock()
+            cam._connected = True
+            cam.start_recording = lambda: workers.add(threading.current_thread())
+            cam.stop_recording = lambda: workers.add(threading.current_thread())
+        mgr.start_recording_all()
+        pool = mgr._pool
+        mgr.stop_recording_all()
+        assert mgr._pool is pool
+        assert len(workers) <= 2
+        mgr.disconnect_all()
+        assert mgr._pool is None
+
 
 # ============================================================
 # Module: src/heart_rate.py
@@ -499,11 +1002,8 @@ class TestParseEcgData:
 
 class TestHrSampleRecording:
     def test_samples_stored_with_phase(self):
-        from src.heart_rate import PolarH10, HeartRateSample
-        monitor = PolarH10.__new__(PolarH10)
-        monitor._hr_samples = []
-        monitor._ecg_samples = []
-        monitor._samples_lock = threading.Lock()
+        from src.heart_rate import PolarH10
+        monitor = PolarH10()
         monitor._recording = True
         monitor._current_phase = "calibration"
 
@@ -516,10 +1016,7 @@ class TestHrSampleRecording:
 
     def test_samples_not_recorded_when_stopped(self):
         from src.heart_rate import PolarH10
-        monitor = PolarH10.__new__(PolarH10)
-        monitor._hr_samples = []
-        monitor._ecg_samples = []
-        monitor._samples_lock = threading.Lock()
+        monitor = PolarH10()
         monitor._recording = False
         monitor._current_phase = "calibration"
 
@@ -552,6 +1049,52 @@ class TestSaveToCsv:
         assert rows[1][2] == "800.0;810.5"
         assert rows[2][2] == ""
 
+    def test_save_ecg_to_csv_format(self, tmp_path):
+        from src.heart_rate import PolarH10, ECGSample
+        monitor = PolarH10.__new__(PolarH10)
+        monitor._samples_lock = threading.Lock()
+        monitor._ecg_samples = [
+            ECGSample(timestamp=1000.0, values_uv=[12, -40, 7], phase="recording"),
+            ECGSample(timestamp=1000.1, values_uv=[3], phase="recording"),
+        ]
+
+        filepath = tmp_path / "ecg.csv"
+        monitor.save_ecg_to_csv(filepath)
+
+        with open(filepath) as f:
+            rows = list(csv.reader(f))
+
+        assert rows[0] == ["timestamp", "phase", "ecg_values_uv"]
+        assert rows[1] == ["1000.0", "recording", "12;-40;7"]
+        assert rows[2][2] == "3"
+
+    def test_attach_writers_streams_samples(self, tmp_path):
+        from src.heart_rate import PolarH10
+        monitor = PolarH10(ecg_enabled=True)
+        hr_path = tmp_path / "hr.csv"
+        ecg_path = tmp_path / "ecg.csv"
+        monitor.attach_writers(hr_path, ecg_path)
+        monitor.start_recording("review")
+        monitor._hr_callback(None, bytearray([0x00, 72]))
+        ecg = bytearray(13)
+        ecg[10] = 0x05
+        monitor._ecg_callback(None, ecg)
+        monitor.set_phase("scoring")  # flushes what was streamed so far
+        assert len(hr_path.read_text().splitlines()) == 2
+        monitor._hr_callback(None, bytearray([0x00, 80]))
+        monitor.close_writers()
+
+        with open(hr_path) as f:
+            rows = list(csv.reader(f))
+        assert [r[1] for r in rows[1:]] == ["72", "80"]
+        assert rows[2][4] == "scoring"
+        with open(ecg_path) as f:
+            rows = list(csv.reader(f))
+        assert rows[1][1:] == ["review", "5"]
+        # ECG went to disk only; HR is kept for the summary
+        assert monitor._ecg_samples == []
+        assert monitor.get_summary()["scoring"]["count"] == 1
+
 
 class TestGetSummary:
     def test_per_phase_stats(self):
@@ -699,6 +1242,34 @@ class TestExperiment:
             "microphone": {"enabled": False},
         }
 
+    @pytest.fixture
+    def set_up_experiment(self, tmp_path):
+        """Factory for Experiments set up under tmp_path with the hardware patched out.
+
+        On exit every one gets its keep-alive and sync-writer threads stopped
+        and OpenCV's thread count restored.
+        """
+        from src.experiment import Experiment
+        created = []
+
+        def set_up(settings=None):
+            settings = settings or self._make_settings()
+            settings["experiment"]["output_dir"] = str(tmp_path)
+            exp = Experiment(settings)
+            created.append(exp)
+            assert exp.setup() is True
+            return exp
+
+        with patch("src.experiment.check_ffmpeg", return_value=False), \
+                patch("src.experiment.PolarH10"), \
+                patch("src.experiment.GoProManager"), \
+                patch("src.experiment.CameraManager"):
+            yield set_up
+        for exp in created:
+            exp._stop_keepalive()
+            exp._stop_sync_writer()
+            exp._cv_threads.close()
+
     @patch("src.experiment.check_ffmpeg", return_value=True)
     @patch("src.experiment.PolarH10")
     @patch("src.experiment.GoProManager")
@@ -759,6 +1330,375 @@ class TestExperiment:
         assert exp.mic_config.sample_rate == 48000
         assert exp.mic_config.channels == 2
 
+    @patch("src.experiment.check_ffmpeg", return_value=True)
+    @patch("src.experiment.PolarH10")
+    @patch("src.experiment.GoProManager")
+    @patch("src.experiment.CameraManager")
+    def test_wait_action_skips_unexpected(self, mock_cm, mock_gm, mock_hr, mock_ffmpeg):
+        from src.experiment import Experiment
+        exp = Experiment(self._make_settings())
+        exp._user_action_queue.put({"type": "pause"})
+        exp._user_action_queue.put({"type": "continue"})
+        action = exp._wait_action({"continue"})
+        assert action == {"type": "continue"}
+        assert exp._wait_action({"continue"}, deadline=time.monotonic() + 0.1) is None
+        exp._user_action_queue.put({"type": "stop"})
+        with pytest.raises(KeyboardInterrupt):
+            exp._wait_action({"continue"})
+
+    @patch("src.experiment.check_ffmpeg", return_value=True)
+    @patch("src.experiment.PolarH10")
+    @patch("src.experiment.GoProManager")
+    @patch("src.experiment.CameraManager")
+    def test_keepalive_runs_on_own_thread(self, mock_cm, mock_gm, mock_hr, mock_ffmpeg):
+        from src.experiment import Experiment
+        exp = Experiment(self._make_settings())
+        exp._keepalive_interval = 0.01
+        exp._keepalive_thread = threading.Thread(target=exp._keepalive_loop, daemon=True)
+        exp._keepalive_thread.start()
+        time.sleep(0.1)
+        exp._stop_keepalive()
+        assert exp._keepalive_thread is None
+        assert exp.gopro_manager.keep_alive_all.call_count >= 2
+
+    @patch("src.experiment.check_ffmpeg", return_value=True)
+    @patch("src.experiment.PolarH10")
+    @patch("src.experiment.GoProManager")
+    @patch("src.experiment.CameraManager")
+    def test_video_complete_wakes_wait_action(self, mock_cm, mock_gm, mock_hr, mock_ffmpeg):
+        from src.experiment import Experiment
+        exp = Experiment(self._make_settings())
+        timer = threading.Timer(0.05, exp._post_video_complete)
+        timer.start()
+        action = exp._wait_action({"continue", "video_complete"}, deadline=time.monotonic() + 5)
+        timer.join()
+        assert action == {"type": "video_complete"}
+
+    @patch("src.experiment.check_ffmpeg", return_value=True)
+    @patch("src.experiment.PolarH10")
+    @patch("src.experiment.GoProManager")
+    @patch("src.experiment.CameraManager")
+    def test_frame_forwarder_keeps_newest_frame(self, mock_cm, mock_gm, mock_hr, mock_ffmpeg):
+        from src.experiment import Experiment
+        exp = Experiment(self._make_settings())
+        player = MagicMock(duration_sec=10.0)
+        on_frame = exp._frame_forwarder(player)
+        first, second = object(), object()
+        on_frame(first, 1.0)
+        assert player.should_display() is False
+        on_frame(second, 1.1)
+        player.release_preview.assert_called_once_with(first)
+
+        event = exp._gui_event_queue.get_nowait()
+        assert event["frame"] is second and event["duration_sec"] == 10.0
+        assert exp._gui_event_queue.empty()
+        event["release"](event["frame"])
+        assert player.should_display() is True
+
+    @patch("src.experiment.check_ffmpeg", return_value=True)
+    @patch("src.experiment.PolarH10")
+    @patch("src.experiment.GoProManager")
+    @patch("src.experiment.CameraManager")
+    def test_overhead_player_shared_between_phases(self, mock_cm, mock_gm, mock_hr, mock_ffmpeg, tmp_path):
+        from src.experiment import Experiment
+        exp = Experiment(self._make_settings())
+        exp._files.overhead_video = str(tmp_path / "overhead_camera.mp4")
+        _write_clip(exp._files.overhead_video, [np.zeros((48, 64, 3), dtype=np.uint8)] * 5)
+
+        player = exp._get_overhead_player()
+        assert player is not None
+        player.on_frame = lambda frame, pos: None
+        assert exp._get_overhead_player() is player
+        assert player.on_frame is None
+        exp._close_overhead_player()
+        assert exp._overhead_player is None
+        assert exp._get_overhead_player() is not player
+        exp._close_overhead_player()
+
+    @patch("src.experiment.check_ffmpeg", return_value=True)
+    @patch("src.experiment.PolarH10")
+    @patch("src.experiment.GoProManager")
+    @patch("src.experiment.CameraManager")
+    def test_wait_for_user_action_stop_and_redo(self, mock_cm, mock_gm, mock_hr, mock_ffmpeg):
+        from src.experiment import Experiment
+        exp = Experiment(self._make_settings())
+        exp._user_action_queue.put({"type": "redo"})
+        assert exp._wait_for_user_action("continue") is None
+        assert exp._redo_requested is True
+        exp._user_action_queue.put({"type": "stop"})
+        with pytest.raises(KeyboardInterrupt):
+            exp._wait_for_user_action("continue")
+
+    @patch("src.experiment.check_ffmpeg", return_value=True)
+    @patch("src.experiment.PolarH10")
+    @patch("src.experiment.GoProManager")
+    @patch("src.experiment.CameraManager")
+    def test_request_stop_sets_flag_and_wakes_wait(self, mock_cm, mock_gm, mock_hr, mock_ffmpeg):
+        from src.experiment import Experiment
+        exp = Experiment(self._make_settings())
+        exp._check_for_stop()  # no stop requested: returns quietly
+        exp._user_action_queue.put({"type": "continue"})
+        exp.request_stop()
+        with pytest.raises(KeyboardInterrupt):
+            exp._check_for_stop()
+        # The queued continue is left in place, ahead of the stop action
+        assert exp._wait_action({"continue"}) == {"type": "continue"}
+        with pytest.raises(KeyboardInterrupt):
+            exp._wait_action({"continue"})
+
+    def test_setup_creates_session_subdirs(self, set_up_experiment):
+        from src.experiment import SESSION_SUBDIRS
+        exp = set_up_experiment()
+        for name in SESSION_SUBDIRS:
+            assert exp._paths[name] == exp._session_dir / name
+            assert exp._paths[name].is_dir()
+        assert exp._files.review_timestamps == str(exp._session_dir / "review" / "review_timestamps.jsonl")
+
+        # A second run landing on the same session name reuses the directories
+        with patch("src.experiment.timestamp_string", return_value=exp._session_timestamp):
+            again = set_up_experiment()
+        assert again._session_dir == exp._session_dir
+
+    def test_finish_composites_only_present_files(self, set_up_experiment):
+        from concurrent.futures import ThreadPoolExecutor
+        from pathlib import Path
+        exp = set_up_experiment()
+        for path in (exp._files.review_audio, exp._files.review_timestamps,
+                     exp._files.overhead_video, exp._files.hr_csv, exp._files.scoring_face):
+            Path(path).write_bytes(b"")
+        exp._user_action_queue.put({"type": "continue"})
+
+        with patch("src.experiment.ProcessPoolExecutor", ThreadPoolExecutor), \
+                patch("src.experiment.create_review_composite") as review, \
+                patch("src.experiment.create_hr_synced_video") as hr_video:
+            exp._run_finish(exp.phases[0])
+        assert review.call_args.args[0] == exp._files.overhead_video
+        # Only the scoring face video exists, so only it gets an HR overlay
+        assert [c.args[0] for c in hr_video.call_args_list] == [exp._files.scoring_face]
+
+    def test_present_files_skips_missing_subdir(self, set_up_experiment):
+        import shutil
+        from pathlib import Path
+        from src.experiment import REVIEW_COMPOSITE_INPUTS
+        exp = set_up_experiment()
+        for path in (exp._files.review_audio, exp._files.review_timestamps, exp._files.overhead_video):
+            Path(path).write_bytes(b"")
+        shutil.rmtree(exp._paths["scoring"])
+        present = exp._present_files("performance", "review", "scoring")
+        assert present == set(REVIEW_COMPOSITE_INPUTS)
+        assert ("review", "audio_commentary.wav") in present
+
+    def test_finish_collects_background_review_composite(self, set_up_experiment, capsys):
+        from concurrent.futures import Future, ThreadPoolExecutor
+        from pathlib import Path
+        exp = set_up_experiment()
+        for path in (exp._files.review_audio, exp._files.review_timestamps,
+                     exp._files.overhead_video, exp._files.hr_csv, exp._files.scoring_face):
+            Path(path).write_bytes(b"")
+        background = Future()
+        background.set_result(("Review composite written\n", None))
+        exp._review_composite = background
+        exp._user_action_queue.put({"type": "continue"})
+
+        with patch("src.experiment.ProcessPoolExecutor", ThreadPoolExecutor), \
+                patch("src.experiment.create_review_composite") as review, \
+                patch("src.experiment.create_hr_synced_video") as hr_video:
+            exp._run_finish(exp.phases[0])
+        review.assert_not_called()
+        assert hr_video.call_count == 1
+        out = capsys.readouterr().out
+        assert "Review composite written\n" in out
+        assert "Review composite failed" not in out
+        messages = [e.get("message") for e in exp._gui_event_queue.drain()]
+        assert "Post-processing: 2/2 done" in messages
+        assert exp._review_composite is None
+
+    def test_pool_worker_output_returned_to_parent(self):
+        from concurrent.futures import ProcessPoolExecutor
+        from src.experiment import _call_capturing_output
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(_call_capturing_output, print, "Encoding...").result() == ("Encoding...\n", None)
+        output, error = _call_capturing_output(int, "x")
+        assert output == ""
+        assert isinstance(error, ValueError)
+
+    @patch("src.experiment.check_ffmpeg", return_value=True)
+    @patch("src.experiment.PolarH10")
+    @patch("src.experiment.GoProManager")
+    @patch("src.experiment.CameraManager")
+    def test_discard_review_composite_cancels_pending(self, mock_cm, mock_gm, mock_hr, mock_ffmpeg):
+        from concurrent.futures import Future
+        from src.experiment import Experiment
+        exp = Experiment(self._make_settings())
+        pending = Future()
+        exp._review_composite = pending
+        exp._discard_review_composite()
+        assert pending.cancelled()
+        assert exp._review_composite is None
+
+    @patch("src.experiment.check_ffmpeg", return_value=True)
+    @patch("src.experiment.PolarH10")
+    @patch("src.experiment.GoProManager")
+    @patch("src.experiment.CameraManager")
+    def test_backup_result_sent_to_gui(self, mock_cm, mock_gm, mock_hr, mock_ffmpeg,
+                                       tmp_path, monkeypatch, capsys):
+        from src.events import GuiEventQueue
+        from src.experiment import Experiment
+        # Off Windows "F:/" is a relative directory, so give the test one
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "F:").mkdir()
+        session = tmp_path / "session"
+        session.mkdir()
+        (session / "data.txt").write_text("x")
+        exp = Experiment(self._make_settings(), gui_event_queue=GuiEventQueue())
+        exp._session_dir = session
+
+        exp._backup_to_f_drive()
+        with patch("src.experiment.copy_tree_parallel", side_effect=OSError("disk full")):
+            exp._backup_to_f_drive()
+        done = [e["message"] for e in exp._gui_event_queue.drain() if e.get("backup_done")]
+        assert done[0].startswith("Backup complete:") and "(1 files copied)" in done[0]
+        assert done[1].startswith("WARNING: Backup to F: drive failed: disk full.")
+        assert "Backup complete" not in capsys.readouterr().out
+
+    def test_setup_caches_mic_device_index(self, set_up_experiment):
+        settings = self._make_settings()
+        settings["microphone"] = {"enabled": True, "device_name": "Tonor"}
+        with patch("src.experiment.find_audio_device", return_value=3) as mock_find:
+            exp = set_up_experiment(settings)
+        mock_find.assert_called_once_with("Tonor")
+        assert exp.mic_config.device_index == 3
+
+    @patch("src.experiment.check_ffmpeg", return_value=True)
+    @patch("src.experiment.PolarH10")
+    @patch("src.experiment.GoProManager")
+    @patch("src.experiment.CameraManager")
+    def test_print_hr_summary(self, mock_cm, mock_gm, mock_hr, mock_ffmpeg, capsys):
+        from src.experiment import Experiment
+        exp = Experiment(self._make_settings())
+        exp.hr_monitor = MagicMock()
+        exp.hr_monitor.get_summary.return_value = {
+            "review": {"count": 3, "min_bpm": 70, "max_bpm": 90, "avg_bpm": 80.0,
+                       "avg_rr_ms": 750.0, "rr_count": 4},
+            "scoring": {"count": 2, "min_bpm": 60, "max_bpm": 62, "avg_bpm": 61.0},
+        }
+        exp._print_hr_summary()
+        out = capsys.readouterr().out
+        assert "review: avg=80.0 bpm, min=70, max=90, samples=3, avg_rr=750.0ms (4 beats)" in out
+        assert "scoring: avg=61.0 bpm, min=60, max=62, samples=2\n" in out
+
+    def test_setup_limits_opencv_threads(self, set_up_experiment):
+        import cv2
+        before = cv2.getNumThreads()
+        exp = set_up_experiment()
+        assert cv2.getNumThreads() == 1
+        exp._cv_threads.close()
+        assert cv2.getNumThreads() == before
+
+    def test_sync_log_sidecar_and_manifest(self, set_up_experiment):
+        from src.experiment import Experiment
+        exp = set_up_experiment()
+        for i in range(Experiment.SYNC_FLUSH_EVERY):
+            exp._log_sync("tick", i=i)
+        exp._stop_sync_writer()  # the background writer flushes on exit
+
+        sidecar = exp._session_dir / "sync_manifest.jsonl"
+        lines = sidecar.read_text().splitlines()
+        assert len(lines) == Experiment.SYNC_FLUSH_EVERY + 1
+        assert json.loads(lines[0])["event"] == "session_created"
+
+        exp._save_sync_manifest()
+        manifest = json.loads((exp._session_dir / "sync_manifest.json").read_text())
+        times = [e["wall_time"] for e in manifest["events"]]
+        assert len(times) == Experiment.SYNC_FLUSH_EVERY + 1
+        assert times == sorted(times)
+        assert len(sidecar.read_text().splitlines()) == len(times)
+
+    @patch("src.experiment.check_ffmpeg", return_value=True)
+    @patch("src.experiment.PolarH10")
+    @patch("src.experiment.GoProManager")
+    @patch("src.experiment.CameraManager")
+    def test_sync_log_uses_wall_clock(self, mock_cm, mock_gm, mock_hr, mock_ffmpeg):
+        from src.experiment import Experiment
+        exp = Experiment(self._make_settings())
+        with patch("src.experiment.time.time", return_value=1234.5):
+            exp._log_sync("tick")
+        assert exp._sync_log[-1] == {"event": "tick", "wall_time": 1234.5}
+
+    def test_sync_writer_flushes_in_background(self, set_up_experiment):
+        from src.experiment import Experiment
+        exp = set_up_experiment()
+        for i in range(Experiment.SYNC_FLUSH_EVERY):
+            exp._log_sync("tick", i=i)
+        sidecar = exp._session_dir / "sync_manifest.jsonl"
+        deadline = time.time() + 5
+        while time.time() < deadline and exp._sync_flushed < Experiment.SYNC_FLUSH_EVERY:
+            time.sleep(0.01)
+        assert len(sidecar.read_text().splitlines()) >= Experiment.SYNC_FLUSH_EVERY
+
+    def test_large_sync_manifest_is_gzipped(self, set_up_experiment):
+        import gzip
+        from src.experiment import Experiment
+        exp = set_up_experiment()
+        for i in range(Experiment.SYNC_GZIP_MIN_EVENTS):
+            exp._log_sync("tick", i=i)
+
+        exp._save_sync_manifest()
+        assert not (exp._session_dir / "sync_manifest.json").exists()
+        assert not (exp._session_dir / "sync_manifest.json.gz.tmp").exists()
+        with gzip.open(exp._session_dir / "sync_manifest.json.gz") as f:
+            manifest = json.loads(f.read())
+        assert len(manifest["events"]) == Experiment.SYNC_GZIP_MIN_EVENTS + 1
+
+
+# ============================================================
+# Module: src/events.py
+# ============================================================
+
+class TestGuiEventQueue:
+    def test_fifo_and_empty(self):
+        import queue
+        from src.events import GuiEventQueue
+        q = GuiEventQueue()
+        assert q.empty()
+        q.put({"type": "a"})
+        q.put({"type": "b"})
+        assert q.qsize() == 2
+        assert q.get_nowait() == {"type": "a"}
+        assert q.drain() == [{"type": "b"}]
+        with pytest.raises(queue.Empty):
+            q.get_nowait()
+
+    def test_put_latest_keeps_one_pending_per_type(self):
+        from src.events import GuiEventQueue
+        q = GuiEventQueue()
+        assert q.put_latest({"type": "video_frame", "n": 1}) is None
+        q.put({"type": "player_state", "state": "PLAYING"})
+        assert q.put_latest({"type": "video_frame", "n": 2}) == {"type": "video_frame", "n": 1}
+        assert q.qsize() == 2
+        assert q.drain() == [
+            {"type": "video_frame", "n": 2},
+            {"type": "player_state", "state": "PLAYING"},
+        ]
+        assert q.put_latest({"type": "video_frame", "n": 3}) is None
+        assert q.get_nowait() == {"type": "video_frame", "n": 3}
+
+    def test_put_many_preserves_order(self):
+        from src.events import GuiEventQueue
+        q = GuiEventQueue()
+        q.put({"type": "a"})
+        q.put_many([{"type": "b"}, {"type": "c"}])
+        assert [e["type"] for e in q.drain()] == ["a", "b", "c"]
+
+    def test_get_blocks_until_put(self):
+        import queue
+        from src.events import GuiEventQueue
+        q = GuiEventQueue()
+        with pytest.raises(queue.Empty):
+            q.get(timeout=0.05)
+        threading.Timer(0.05, q.put, args=({"type": "late"},)).start()
+        assert q.get(timeout=2.0) == {"type": "late"}
+
 
 # ============================================================
 # Module: src/audio.py
@@ -812,6 +1752,68 @@ class TestVideoPlayerState:
         assert player.progress == 0.0
         assert player.position_sec == 0.0
 
+    def test_player_preview_downscale(self, tmp_path):
+        from src.video_player import VideoPlayer
+        path = str(tmp_path / "clip.mp4")
+        _write_clip(path, (np.full((48, 64, 3), i * 20, dtype=np.uint8) for i in range(10)))
+
+        player = VideoPlayer(path, preview_width=32)
+        assert player.open() is True
+        assert player.preview_size == (32, 24)
+        frames = []
+        done = threading.Event()
+
+        def on_frame(frame, pos):
+            frames.append(frame)
+            player.release_preview(frame)
+
+        player.on_frame = on_frame
+        player.on_complete = done.set
+        player.play()
+        assert done.wait(timeout=5.0)
+        player.close()
+        assert frames and all(f.shape == (24, 32, 3) for f in frames)
+        # Released buffers are reused rather than reallocated per frame
+        assert len({id(f) for f in frames}) <= VideoPlayer.PREVIEW_POOL_SIZE
+
+    def test_release_preview_caps_pool(self, tmp_path):
+        from src.video_player import VideoPlayer
+        path = str(tmp_path / "clip.mp4")
+        _write_clip(path, [np.zeros((48, 64, 3), dtype=np.uint8)])
+
+        player = VideoPlayer(path, preview_width=32)
+        assert player.open() is True
+        for _ in range(VideoPlayer.PREVIEW_POOL_SIZE * 2):
+            player.release_preview(player._new_preview_buffer())
+        player.close()
+        assert player._preview_pool.qsize() == VideoPlayer.PREVIEW_POOL_SIZE
+
+    def test_player_skips_display_while_frame_pending(self, tmp_path):
+        from src.video_player import VideoPlayer
+        path = str(tmp_path / "clip.mp4")
+        _write_clip(path, (np.full((48, 64, 3), i * 10, dtype=np.uint8) for i in range(15)))
+
+        player = VideoPlayer(path)
+        assert player.open() is True
+        frames = []
+        done = threading.Event()
+        player.on_frame = lambda frame, pos: frames.append(pos)
+        player.should_display = lambda: not frames  # GUI never catches up
+        player.on_complete = done.set
+        player.play()
+        assert done.wait(timeout=5.0)
+        player.close()
+        assert len(frames) == 1
+
+    def test_preview_maps_match_target_size(self):
+        import cv2
+        from src.video_player import _preview_maps
+        frame = np.full((2160, 3840, 3), 128, dtype=np.uint8)
+        map1, map2 = _preview_maps((3840, 2160), (960, 540))
+        small = cv2.remap(frame, map1, map2, cv2.INTER_LINEAR)
+        assert small.shape == (540, 960, 3)
+        assert int(small.mean()) == 128
+
 
 # ============================================================
 # Module: src/video_recorder.py
@@ -834,6 +1836,132 @@ class TestVideoRecorder:
         recorder = VideoRecorder(mock_camera, "test.mp4")
         assert recorder.start() is False
 
+    def test_detect_encoder_without_ffmpeg(self):
+        from src.video_recorder import detect_h264_encoder
+        detect_h264_encoder.cache_clear()
+        with patch("src.video_recorder.shutil.which", return_value=None):
+            assert detect_h264_encoder() is None
+        detect_h264_encoder.cache_clear()
+
+    @patch("src.video_recorder.FFmpegPipeWriter")
+    def test_recorder_uses_ffmpeg_pipe_for_encoder(self, mock_writer_cls):
+        from src.video_recorder import VideoRecorder
+        mock_camera = MagicMock()
+        mock_camera.is_open = True
+        mock_camera.config.actual_resolution = (640, 480)
+        mock_camera.read_frame.return_value = None
+        recorder = VideoRecorder(mock_camera, "test.mp4", fps=30, encoder="libx264")
+        assert recorder.start() is True
+        recorder.stop()
+        mock_writer_cls.assert_called_once_with("test.mp4", 30, (640, 480), "libx264")
+        mock_writer_cls.return_value.release.assert_called_once()
+
+    @patch("src.video_recorder.FFmpegPipeWriter")
+    def test_recorder_writes_on_writer_thread(self, mock_writer_cls):
+        from src.video_recorder import VideoRecorder
+        mock_camera = MagicMock()
+        mock_camera.is_open = True
+        mock_camera.config.actual_resolution = (4, 2)
+        mock_camera.read_frame.side_effect = lambda out: out
+        writer_threads = set()
+        mock_writer_cls.return_value.write.side_effect = \
+            lambda frame: writer_threads.add(threading.current_thread().name)
+        recorder = VideoRecorder(mock_camera, "test.mp4", fps=100, encoder="libx264")
+        assert recorder.start() is True
+        time.sleep(0.1)
+        recorder.stop()
+        # Every scheduled frame reaches the writer, all on one non-capture thread
+        assert recorder.frame_count > 0
+        assert mock_writer_cls.return_value.write.call_count == recorder.frame_count
+        assert len(writer_threads) == 1 and threading.current_thread().name not in writer_threads
+
+    @patch("src.video_recorder.FFmpegPipeWriter")
+    def test_recorder_reuses_frame_buffers(self, mock_writer_cls):
+        from src.video_recorder import VideoRecorder
+        mock_camera = MagicMock()
+        mock_camera.is_open = True
+        mock_camera.config.actual_resolution = (4, 2)
+        mock_camera.read_frame.side_effect = lambda out: out
+        written = set()
+        mock_writer_cls.return_value.write.side_effect = lambda frame: written.add(id(frame))
+        recorder = VideoRecorder(mock_camera, "test.mp4", fps=200, encoder="libx264")
+        assert recorder.start() is True
+        time.sleep(0.2)
+        recorder.stop()
+        assert recorder.frame_count > VideoRecorder.WRITE_QUEUE_SIZE + 3
+        # Buffers cycle through the pool instead of being allocated per frame
+        assert len(written) <= VideoRecorder.WRITE_QUEUE_SIZE + 3
+
+    def test_write_queue_drops_oldest_and_keeps_repeats(self):
+        from src.video_recorder import _WriteQueue
+        freed = []
+        q = _WriteQueue(2, freed.append)
+        a, b, c = (np.full(1, i) for i in range(3))
+        q.put((a, 1))
+        q.put((None, 2))
+        q.put((b, 1))  # drops a; the repeat-only entry adopts it
+        assert q.dropped == 0 and freed == []
+        q.put((c, 1))  # drops a again, now superseded by b
+        assert q.dropped == 1 and freed == [a]
+        assert q.get() == (b, 4)
+        assert q.get() == (c, 1)
+        q.close()
+        assert q.get() is None
+
+    @patch("src.video_recorder.FFmpegPipeWriter")
+    def test_recorder_drops_frames_instead_of_blocking(self, mock_writer_cls):
+        from src.video_recorder import VideoRecorder
+        mock_camera = MagicMock()
+        mock_camera.is_open = True
+        mock_camera.config.actual_resolution = (4, 2)
+        mock_camera.read_frame.side_effect = lambda out: out
+        mock_writer_cls.return_value.write.side_effect = lambda frame: time.sleep(0.02)
+        recorder = VideoRecorder(mock_camera, "test.mp4", fps=200, encoder="libx264")
+        assert recorder.start() is True
+        time.sleep(0.2)
+        recorder.stop()
+        assert recorder.dropped_frames > 0
+        # Dropped frames' slots are still written, so the duration is kept
+        assert mock_writer_cls.return_value.write.call_count == recorder.frame_count
+
+    @patch("src.video_recorder.subprocess.Popen")
+    def test_ffmpeg_pipe_writer_writes_frame_buffer(self, mock_popen):
+        from src.video_recorder import PIPE_BUFFER_SIZE, FFmpegPipeWriter
+        writer = FFmpegPipeWriter("out.mp4", 30, (4, 2), "libx264")
+        assert mock_popen.call_args.kwargs["bufsize"] == PIPE_BUFFER_SIZE
+        frame = np.arange(24, dtype=np.uint8).reshape(2, 4, 3)
+        writer.write(frame[:, ::-1])  # non-contiguous view
+        written = mock_popen.return_value.stdin.write.call_args.args[0]
+        assert bytes(written) == frame[:, ::-1].tobytes()
+        writer.release()
+        mock_popen.return_value.wait.assert_called_once()
+
+    @patch("src.video_recorder.subprocess.Popen")
+    def test_ffmpeg_pipe_writer_reports_broken_pipe(self, mock_popen):
+        from src.video_recorder import FFmpegPipeWriter
+        proc = mock_popen.return_value
+        proc.stdin.write.side_effect = BrokenPipeError()
+        proc.poll.return_value = None
+        proc.wait.return_value = 1
+        writer = FFmpegPipeWriter("out.mp4", 30, (4, 2), "libx264")
+        frame = np.zeros((2, 4, 3), dtype=np.uint8)
+        writer.write(frame)
+        writer.write(frame)
+        assert proc.stdin.write.call_count == 1  # later frames are discarded
+        assert writer.isOpened() is False
+        assert writer.release() == 1
+        proc.stdin.close.assert_called_once()
+        proc.wait.assert_called_once()
+
+    @patch("src.video_recorder.subprocess.Popen")
+    def test_ffmpeg_pipe_writer_muxes_audio(self, mock_popen):
+        from src.video_recorder import FFmpegPipeWriter
+        FFmpegPipeWriter("out.mp4", 30, (4, 2), "libx264", audio_path="commentary.wav")
+        cmd = mock_popen.call_args.args[0]
+        assert cmd[cmd.index("-map") + 1] == "0:v"
+        assert "commentary.wav" in cmd and "-an" not in cmd
+        assert cmd[cmd.index("-c:a") + 1] == "aac"
+
 
 class TestPausableVideoRecorder:
     def test_pause_resume(self):
@@ -859,6 +1987,252 @@ class TestCompositing:
         result = check_ffmpeg()
         assert isinstance(result, bool)
 
+    def test_load_timestamp_events_jsonl_and_legacy_json(self, tmp_path):
+        from src.compositing import _load_timestamp_events
+        events = [{"type": "pause", "wall_time": 1.0, "video_position_sec": 0.5},
+                  {"type": "resume", "wall_time": 3.0, "video_position_sec": 0.5}]
+        jsonl = tmp_path / "review_timestamps.jsonl"
+        jsonl.write_text("".join(json.dumps(e) + "\n" for e in events))
+        legacy = tmp_path / "review_timestamps.json"
+        legacy.write_text(json.dumps(events, indent=2))
+        assert _load_timestamp_events(str(jsonl)) == events
+        assert _load_timestamp_events(str(legacy)) == events
+
+    @patch("src.compositing.overlay_audio_on_video")
+    @patch("src.compositing._can_copy_audio", return_value=False)
+    @patch("src.compositing.FFmpegPipeWriter")
+    def test_review_composite_single_pass_with_encoder(self, mock_writer_cls, mock_copy,
+                                                        mock_overlay, tmp_path):
+        from src.compositing import create_review_composite
+        video = str(tmp_path / "overhead.mp4")
+        _write_clip(video, [np.zeros((24, 32, 3), dtype=np.uint8)] * 5, fps=10)
+        ts = tmp_path / "review_timestamps.jsonl"
+        ts.write_text('{"type": "pause", "wall_time": 1.0, "video_position_sec": 0.2}\n'
+                      '{"type": "resume", "wall_time": 1.5, "video_position_sec": 0.2}\n')
+
+        mock_writer_cls.return_value.release.return_value = 0
+        create_review_composite(video, "audio.wav", str(ts), str(tmp_path / "out.mp4"),
+                                encoder="libx264")
+        mock_writer_cls.assert_called_once_with(str(tmp_path / "out.mp4"), 10.0, (32, 24), "libx264",
+                                                audio_path="audio.wav", audio_args=None)
+        assert mock_writer_cls.return_value.write.call_count == 5 + 5  # 0.5 s frozen at 10 fps
+        mock_overlay.assert_not_called()
+        assert not (tmp_path / "_temp_expanded.mp4").exists()
+
+    @patch("src.compositing._can_copy_audio", return_value=False)
+    @patch("src.compositing.FFmpegPipeWriter")
+    def test_review_composite_raises_on_ffmpeg_failure(self, mock_writer_cls, mock_copy, tmp_path):
+        from src.compositing import create_review_composite
+        video = str(tmp_path / "overhead.mp4")
+        _write_clip(video, [np.zeros((24, 32, 3), dtype=np.uint8)], fps=10)
+        ts = tmp_path / "review_timestamps.jsonl"
+        ts.write_text("")
+        mock_writer_cls.return_value.release.return_value = 1
+        with pytest.raises(RuntimeError, match="status 1"):
+            create_review_composite(video, "missing.wav", str(ts), str(tmp_path / "out.mp4"),
+                                    encoder="libx264")
+
+    def test_load_timestamp_events_skips_truncated_tail(self, tmp_path):
+        from src.compositing import _load_timestamp_events
+        path = tmp_path / "review_timestamps.jsonl"
+        path.write_text('{"type": "pause", "wall_time": 1.0, "video_position_sec": 0.5}\n'
+                        '{"type": "resume", "wall_ti')
+        assert _load_timestamp_events(str(path)) == [
+            {"type": "pause", "wall_time": 1.0, "video_position_sec": 0.5}]
+
+    @patch("src.compositing.ffmpeg")
+    def test_overlay_audio_copies_aac(self, mock_ffmpeg, tmp_path):
+        from src.compositing import overlay_audio_on_video
+        audio = tmp_path / "audio.m4a"
+        audio.write_bytes(b"")
+        mock_ffmpeg.probe.return_value = {"streams": [
+            {"codec_type": "audio", "codec_name": "aac", "bit_rate": "192000"},
+        ]}
+
+        overlay_audio_on_video("video.mp4", str(audio), "out.mp4")
+        kwargs = mock_ffmpeg.output.call_args.kwargs
+        assert kwargs["acodec"] == "copy"
+        assert "audio_bitrate" not in kwargs
+
+    @patch("src.compositing.ffmpeg")
+    def test_overlay_audio_encodes_wav(self, mock_ffmpeg, tmp_path):
+        from src.compositing import overlay_audio_on_video
+        audio = tmp_path / "audio.wav"
+        audio.write_bytes(b"")
+        mock_ffmpeg.probe.return_value = {"streams": [
+            {"codec_type": "audio", "codec_name": "pcm_s16le"},
+        ]}
+
+        overlay_audio_on_video("video.mp4", str(audio), "out.mp4")
+        kwargs = mock_ffmpeg.output.call_args.kwargs
+        assert kwargs["acodec"] == "aac"
+        assert kwargs["audio_bitrate"] == "192k"
+
+    @patch("src.compositing.ffmpeg")
+    def test_hr_overlay_uses_fast_encoder(self, mock_ffmpeg, tmp_path):
+        from src.compositing import create_hr_synced_video
+        hr_csv = tmp_path / "hr.csv"
+        hr_csv.write_text("timestamp,bpm,phase\n1.0,90,review\n2.0,100,review\n")
+
+        create_hr_synced_video("face.mp4", str(hr_csv), "out.mp4", "review", encoder="libx264")
+        kwargs = mock_ffmpeg.input.return_value.output.call_args.kwargs
+        assert kwargs["acodec"] == "copy"
+        assert kwargs["c:v"] == "libx264"
+        assert kwargs["preset"] == "ultrafast"
+
+
+# ============================================================
+# Module: src/lens_correct.py
+# ============================================================
+
+def _write_clip(path, frames, fps=30):
+    """Write BGR frames (all the same size) to an mp4v video at path."""
+    import cv2
+    frames = list(frames)
+    h, w = frames[0].shape[:2]
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), fps, (w, h))
+    for frame in frames:
+        writer.write(frame)
+    writer.release()
+
+
+def _checkerboard_gray(shape=(240, 300), origin=(40, 40), square=20):
+    """White frame with an 11x8 board (10x7 inner corners) whose top-left is at origin (y, x)."""
+    squares = (np.indices((8, 11)).sum(0) % 2).astype(np.uint8) * 255
+    gray = np.full(shape, 255, dtype=np.uint8)
+    y, x = origin
+    gray[y:y + 8 * square, x:x + 11 * square] = np.kron(squares, np.ones((square, square), dtype=np.uint8))
+    return gray
+
+
+def _write_checkerboard_video(path, frame_count, visible):
+    """Write a 300x240 mp4v video showing the board on the frame indices in visible."""
+    import cv2
+    board = cv2.cvtColor(_checkerboard_gray(), cv2.COLOR_GRAY2BGR)
+    blank = np.full_like(board, 255)
+    _write_clip(path, [board if i in visible else blank for i in range(frame_count)])
+
+
+class TestLensCorrect:
+    def test_detect_checkerboard_downscaled(self):
+        from src.lens_correct import DETECT_DOWNSCALE_MIN_WIDTH, detect_checkerboard
+        # 11x8 board of 100 px squares centred in a frame wide enough to be
+        # searched at half resolution
+        gray = _checkerboard_gray((1080, DETECT_DOWNSCALE_MIN_WIDTH), origin=(140, 410), square=100)
+
+        corners = detect_checkerboard(gray).reshape(-1, 2)
+        assert corners.shape == (70, 2)
+        # Inner corners sit on the 100 px grid lines
+        xs = np.round(corners[:, 0] - 410) % 100
+        ys = np.round(corners[:, 1] - 140) % 100
+        assert np.all(np.minimum(xs, 100 - xs) <= 1)
+        assert np.all(np.minimum(ys, 100 - ys) <= 1)
+
+    def test_detect_checkerboard_not_found(self):
+        from src.lens_correct import detect_checkerboard
+        assert detect_checkerboard(np.full((240, 300), 255, dtype=np.uint8)) is None
+
+
+# ============================================================
+# Module: src/extrinsic_calibration.py
+# ============================================================
+
+class TestExtrinsicCalibration:
+    def test_calibrate_all_intrinsics_keep_camera_order(self):
+        from src import extrinsic_calibration
+        results = {"a.mp4": ("Ka", "Da", (640, 480)), "b.mp4": None, "c.mp4": ("Kc", "Dc", (640, 480))}
+        with patch.object(extrinsic_calibration, "calibrate_intrinsic", side_effect=results.get), \
+                patch.object(extrinsic_calibration, "_find_shared_checkerboard_frames", return_value={}):
+            result = extrinsic_calibration.calibrate_all(list(results))
+        assert list(result["intrinsics"]) == ["a.mp4", "c.mp4"]
+        assert result["intrinsics"]["c.mp4"]["index"] == 2
+        assert result["extrinsics"] == {}
+
+    def test_find_shared_checkerboard_frames(self, tmp_path):
+        from src.extrinsic_calibration import _find_shared_checkerboard_frames
+        paths = []
+        for name, visible in (("a.mp4", {0, 3, 6, 9}), ("b.mp4", {3, 9, 12})):
+            path = str(tmp_path / name)
+            _write_checkerboard_video(path, 15, visible)
+            paths.append(path)
+
+        shared = _find_shared_checkerboard_frames(paths)
+        assert sorted(shared) == [3, 9]
+        assert all(shared[3][p].reshape(-1, 2).shape == (70, 2) for p in paths)
+
+    def test_calibrate_extrinsic_pair_recovers_baseline(self):
+        import cv2
+        from src.extrinsic_calibration import calibrate_extrinsic_pair
+        from src.lens_correct import BOARD_OBJECT_POINTS
+        K = np.array([[800.0, 0, 320], [0, 800.0, 240], [0, 0, 1]])
+        D = np.zeros(5)
+        baseline = np.array([-100.0, 0.0, 0.0])
+        pts_a, pts_b = [], []
+        for i in range(6):
+            rvec = np.array([0.1 * (i % 3) - 0.1, 0.05 * i - 0.1, 0.0])
+            tvec = np.array([-110.0 + 10 * i, -70.0, 900.0 + 50 * i])
+            a, _ = cv2.projectPoints(BOARD_OBJECT_POINTS, rvec, tvec, K, D)
+            b, _ = cv2.projectPoints(BOARD_OBJECT_POINTS, rvec, tvec + baseline, K, D)
+            pts_a.append(a.astype(np.float32))
+            pts_b.append(b.astype(np.float32))
+
+        result = calibrate_extrinsic_pair(K, D, K, D, pts_a, pts_b, (640, 480), (640, 480))
+        assert result is not None
+        assert result["rms"] < 0.01
+        np.testing.assert_allclose(result["T"].ravel(), baseline, atol=0.5)
+        assert not BOARD_OBJECT_POINTS.flags.writeable
+
+    def test_save_calibration_log_numpy_values(self, tmp_path):
+        from src.extrinsic_calibration import save_calibration_log
+        out = tmp_path / "logs" / "calibration.json"
+        save_calibration_log(
+            {"cam_a": {"K": np.eye(3), "rms": np.float64(0.25),
+                       "frames": [np.int64(3), 9], "size": (640, 480)}},
+            str(out),
+        )
+        data = json.loads(out.read_text())
+        assert data["cam_a"]["K"][1] == [0.0, 1.0, 0.0]
+        assert data["cam_a"]["rms"] == 0.25
+        assert data["cam_a"]["frames"] == [3, 9]
+        assert data["cam_a"]["size"] == [640, 480]
+
+    def test_detect_checkerboards_reuses_result_for_repeated_frames(self, tmp_path):
+        import cv2
+        from src import extrinsic_calibration
+        path = str(tmp_path / "frozen.mp4")
+        # A frozen frame, as a paused recorder writes
+        _write_checkerboard_video(path, 6, set(range(6)))
+
+        cap = cv2.VideoCapture(path)
+        with patch.object(extrinsic_calibration, "detect_checkerboard",
+                          wraps=extrinsic_calibration.detect_checkerboard) as detect:
+            try:
+                detections = extrinsic_calibration._detect_checkerboards(cap, set(range(6)))
+            finally:
+                cap.release()
+        assert sorted(detections) == list(range(6))
+        assert detect.call_count < 6
+
+    def test_sorted_intersect(self):
+        from src.extrinsic_calibration import _sorted_intersect
+        assert _sorted_intersect([0, 3, 6, 9], [3, 9, 12]) == [3, 9]
+        assert _sorted_intersect([1, 2], [3, 4]) == []
+        assert _sorted_intersect([], [1]) == []
+
+    def test_detect_checkerboards_seeks_long_gaps(self, tmp_path):
+        import cv2
+        from src.extrinsic_calibration import SEEK_MIN_GAP, _detect_checkerboards
+        far = SEEK_MIN_GAP + 20
+        path = str(tmp_path / "long.mp4")
+        _write_checkerboard_video(path, far + 5, {2, far})
+
+        cap = cv2.VideoCapture(path)
+        try:
+            detections = _detect_checkerboards(cap, {0, 2, far - 1, far})
+        finally:
+            cap.release()
+        assert sorted(detections) == [2, far]
+
 
 # ============================================================
 # Module: main.py